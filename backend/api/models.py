@@ -679,6 +679,8 @@ class RunnerStatusResponse(BaseModel):
     resume_count: int = Field(default=0, description="Number of sleep->resume transitions")
     market_session_open: Optional[bool] = Field(default=None, description="Latest broker market-session flag")
     last_state_persisted_at: Optional[str] = Field(default=None, description="Last persisted runner-state checkpoint timestamp ISO string")
+    market_data_cache_hits: int = Field(default=0, description="Symbol quotes served from the runner market-data cache")
+    market_data_cache_misses: int = Field(default=0, description="Symbol quotes fetched from the broker")
 
 
 class RunnerActionResponse(BaseModel):
@@ -3149,8 +3149,7 @@ def _capture_portfolio_snapshot(storage: StorageService, broker: Optional[Broker
     if not market_open and latest is not None:
         account_snapshot = _load_account_snapshot(broker)
         holdings_snapshot = _load_holdings_snapshot(storage, broker)
-        trades = storage.get_all_trades(limit=5000)
-        realized_pnl_total = sum(_safe_float(trade.realized_pnl, 0.0) for trade in trades)
+        realized_pnl_total = _safe_float(storage.get_realized_pnl_total(), 0.0)
         cash_eps = 0.05
         realized_eps = 0.01
         off_hours_trade_change = (
@@ -3177,8 +3176,7 @@ def _capture_portfolio_snapshot(storage: StorageService, broker: Optional[Broker
         unrealized_pnl += row_market_value - (qty * avg_entry_price)
 
     if realized_pnl_total is None:
-        trades = storage.get_all_trades(limit=5000)
-        realized_pnl_total = sum(_safe_float(trade.realized_pnl, 0.0) for trade in trades)
+        realized_pnl_total = _safe_float(storage.get_realized_pnl_total(), 0.0)
     if equity <= 0.0 and (cash > 0.0 or market_value > 0.0):
         equity = max(0.0, cash + market_value)
 
@@ -6,12 +6,15 @@ import logging
 import threading
 import time
 import math
+import hashlib
 import re
 from sqlalchemy.orm import Session
 
 from engine.strategy_runner import StrategyRunner, StrategyStatus
 from engine.strategies import MetricsDrivenStrategy
 from services.broker import PaperBroker
+from services.market_screener import MarketScreener
+from config.settings import get_settings
 from services.order_execution import OrderExecutionService
 from services.budget_tracker import get_budget_tracker
 from config.investing_defaults import (
@@ -61,6 +64,11 @@ class RunnerManager:
         self.runner: Optional[StrategyRunner] = None
         self._initialized = True
 
+        # Screener shared by the strategies of the current runner, keyed by
+        # a digest of the credentials it was built with.
+        self._screener: Optional[MarketScreener] = None
+        self._screener_key: Optional[str] = None
+
         # ── Watchdog state ──────────────────────────────────────────
         self._watchdog_thread: Optional[threading.Thread] = None
         self._watchdog_stop = threading.Event()
@@ -68,6 +76,30 @@ class RunnerManager:
         self._auto_restart_count: int = 0
         self._auto_restart_timestamps: list[float] = []
 
+    def _runner_screener(
+        self,
+        alpaca_client: Optional[Dict[str, str]],
+        require_real_data: bool,
+    ) -> MarketScreener:
+        """
+        Return the screener shared by runner strategies.
+
+        Only one screener is kept; it is rebuilt when the credentials change,
+        so rotated keys do not leave stale clients behind.
+        """
+        client = alpaca_client if isinstance(alpaca_client, dict) else {}
+        fingerprint = "\x00".join((
+            str(client.get("api_key") or "").strip(),
+            str(client.get("secret_key") or "").strip(),
+            str(bool(client.get("paper", True))),
+            str(bool(require_real_data)),
+        ))
+        key = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+        if self._screener is None or self._screener_key != key:
+            self._screener = MarketScreener(alpaca_client, require_real_data=require_real_data)
+            self._screener_key = key
+        return self._screener
+
     @staticmethod
     def _runner_thread_alive(runner: StrategyRunner) -> bool:
         """Best-effort runner thread liveness check."""
@@ -261,12 +293,15 @@ class RunnerManager:
             )
             
             # Create runner
+            settings = get_settings()
             self.runner = StrategyRunner(
                 broker=active_broker,
                 storage_service=storage,
                 tick_interval=tick_interval,
                 order_execution_service=execution_service,
                 streaming_enabled=streaming_enabled,
+                runner_cpu=settings.runner_cpu,
+                realtime_priority=settings.runner_realtime_priority,
             )
         else:
             self.runner.tick_interval = tick_interval
@@ -372,7 +407,7 @@ class RunnerManager:
                 }
 
             # Always rebuild loaded strategies from DB for deterministic behavior.
-            runner.strategies = {}
+            runner.clear_strategies()
             
             # Load active strategies from database
             owns_session = db is None
@@ -457,6 +492,7 @@ class RunnerManager:
                         stop_loss_pct=float(merged_params.get("stop_loss_pct", 2.0)),
                     )
                     try:
+                        screener = self._runner_screener(alpaca_client, require_real_data)
                         strategy = MetricsDrivenStrategy({
                             "name": db_strategy.name,
                             "strategy_id": db_strategy.id,
@@ -475,6 +511,7 @@ class RunnerManager:
                             "dca_tranches": int(merged_params.get("dca_tranches", 1)),
                             "alpaca_client": alpaca_client,
                             "require_real_data": require_real_data,
+                            "screener": screener,
                         })
                     except RuntimeError:
                         skipped_invalid.append(f"{db_strategy.name} (market data unavailable)")
@@ -781,10 +818,7 @@ class RunnerManager:
         with self._lock:
             if self.runner is None:
                 return False
-            if strategy_name in self.runner.strategies:
-                del self.runner.strategies[strategy_name]
-                return True
-            return False
+            return self.runner.unload_strategy(strategy_name)
 
     def set_tick_interval(self, tick_interval: float) -> None:
         """Update runner polling interval when config changes."""
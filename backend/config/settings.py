@@ -77,6 +77,10 @@ class Settings(BaseSettings):
     api_auth_key: Optional[str] = Field(default=None, alias="STOCKSBOT_API_KEY")
     backend_reload: bool = Field(default=False, alias="STOCKSBOT_BACKEND_RELOAD")
 
+    # Strategy runner scheduler thread (Linux only; unset leaves OS defaults)
+    runner_cpu: Optional[int] = Field(default=None, alias="STOCKSBOT_RUNNER_CPU")
+    runner_realtime_priority: Optional[int] = Field(default=None, alias="STOCKSBOT_RUNNER_REALTIME_PRIORITY")
+
     # Notification delivery (email + sms)
     summary_notifications_enabled: bool = Field(default=True, alias="STOCKSBOT_SUMMARY_NOTIFICATIONS_ENABLED")
     summary_scheduler_enabled: bool = Field(default=True, alias="STOCKSBOT_SUMMARY_SCHEDULER_ENABLED")
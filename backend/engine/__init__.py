@@ -8,13 +8,14 @@ Core components:
 - Order management
 """
 
-from engine.strategy_interface import StrategyInterface, Signal
+from engine.strategy_interface import StrategyInterface, Signal, SignalReason
 from engine.strategies import MovingAverageCrossoverStrategy, BuyAndHoldStrategy
 from engine.strategy_runner import StrategyRunner, StrategyStatus
 
 __all__ = [
     "StrategyInterface",
     "Signal",
+    "SignalReason",
     "MovingAverageCrossoverStrategy",
     "BuyAndHoldStrategy",
     "StrategyRunner",
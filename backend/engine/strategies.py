@@ -3,10 +3,57 @@ Sample Strategy Implementations.
 Example strategies to demonstrate the strategy interface.
 """
 
-from typing import Dict, List, Any
-from engine.strategy_interface import StrategyInterface, Signal
+import logging
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Dict, FrozenSet, List, Any, Optional, Tuple
+from engine.strategy_interface import StrategyInterface, Signal, SignalReason
 from services.market_screener import MarketScreener
 
+logger = logging.getLogger(__name__)
+
+# Daily-bar charts and the market regime barely move intraday, so ticks
+# inside these windows reuse the previous screener result.
+_CHART_CACHE_TTL_SECONDS = 300.0
+_REGIME_CACHE_TTL_SECONDS = 60.0
+_CHART_FETCH_MAX_WORKERS = 8
+_CHART_METRIC_CACHE_MAX_ENTRIES = 512
+
+
+def _tick_price(data: Dict[str, Any]) -> float:
+    """Return a tick's price as a float, or 0.0 when it is missing or malformed."""
+    try:
+        return float(data.get("price") or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@dataclass
+class StrategyPosition:
+    """Open position tracked by MetricsDrivenStrategy."""
+    __slots__ = (
+        "entry_price",
+        "qty",
+        "peak_price",
+        "atr_stop_price",
+        "take_profit_price",
+        "entry_tick",
+        "dca_tranches_filled",
+        "dca_tranches_total",
+        "total_cost",
+    )
+    entry_price: float
+    qty: float
+    peak_price: float
+    atr_stop_price: float
+    take_profit_price: float
+    entry_tick: int
+    dca_tranches_filled: int
+    dca_tranches_total: int
+    total_cost: float
+
 
 class MovingAverageCrossoverStrategy(StrategyInterface):
     """
@@ -37,86 +84,113 @@ class MovingAverageCrossoverStrategy(StrategyInterface):
             raise ValueError("short_window must be smaller than long_window")
         if self.position_size <= 0:
             raise ValueError("position_size must be positive")
+        # Parameters are fixed after construction; keep derived constants ready for on_tick.
+        self._order_quantity = float(self.position_size)
         
-        # State tracking
-        self.state = {
-            "price_history": {},  # symbol -> list of prices
-            "in_position": {},  # symbol -> bool
-            "last_signal": {},  # symbol -> last signal
-            "last_spread_sign": {},  # symbol -> -1/0/1
-        }
+        # Per-symbol state is stored column-wise: one list per field, indexed
+        # through ``_index`` (symbol -> slot) which is built in on_start().
+        self._index: Dict[str, int] = {}
+        self._history: List[Deque[float]] = []
+        self._short_sum: List[float] = []
+        self._long_sum: List[float] = []
+        self._last_sign: List[int] = []
+        self._in_position: List[bool] = []
+        self._last_signal: List[Signal] = []
     
     def on_start(self) -> None:
         """
         Initialize strategy state.
         """
-        print(f"[{self.name}] Starting MA Crossover Strategy")
-        print(f"  Symbols: {self.symbols}")
-        print(f"  Short MA: {self.short_window}, Long MA: {self.long_window}")
+        logger.info(
+            "[%s] Starting MA Crossover Strategy: symbols=%s short_ma=%s long_ma=%s",
+            self.name,
+            self.symbols,
+            self.short_window,
+            self.long_window,
+        )
         
-        for symbol in self.symbols:
-            self.state["price_history"][symbol] = []
-            self.state["in_position"][symbol] = False
-            self.state["last_signal"][symbol] = Signal.HOLD
-            self.state["last_spread_sign"][symbol] = 0
+        self._index = {symbol: idx for idx, symbol in enumerate(dict.fromkeys(self.symbols))}
+        count = len(self._index)
+        self._history = [deque(maxlen=self.long_window) for _ in range(count)]
+        self._short_sum = [0.0] * count
+        self._long_sum = [0.0] * count
+        self._last_sign = [0] * count
+        self._in_position = [False] * count
+        self._last_signal = [Signal.HOLD] * count
         
         self.is_running = True
     
     def on_tick(self, market_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Process market data and generate crossover signals.
+
+        Moving averages are maintained as running window sums, so each tick
+        costs O(1) per symbol regardless of the window lengths.
         """
         signals = []
+        emit = signals.append
+        short_window = self.short_window
+        long_window = self.long_window
+        position_size = self._order_quantity
+        histories = self._history
+        short_sums = self._short_sum
+        long_sums = self._long_sum
+        last_signs = self._last_sign
+        in_positions = self._in_position
+        last_signals = self._last_signal
         
-        for symbol in self.symbols:
-            if symbol not in market_data:
+        for symbol, idx in self._index.items():
+            data = market_data.get(symbol)
+            if not data:
                 continue
-            
-            data = market_data[symbol]
-            current_price = float(data.get("price", 0.0) or 0.0)
+            current_price = _tick_price(data)
             if current_price <= 0:
                 continue
 
-            history = self.state["price_history"][symbol]
+            history = histories[idx]
+            size = len(history)
+            if size >= short_window:
+                short_sums[idx] -= history[size - short_window]
+            if size == long_window:
+                long_sums[idx] -= history[0]
             history.append(current_price)
-            if len(history) > self.long_window + 5:
-                self.state["price_history"][symbol] = history[-(self.long_window + 5):]
-                history = self.state["price_history"][symbol]
+            short_sums[idx] += current_price
+            long_sums[idx] += current_price
 
-            if len(history) < self.long_window:
+            if size + 1 < long_window:
                 continue
 
-            short_ma = self._calculate_ma(symbol, self.short_window)
-            long_ma = self._calculate_ma(symbol, self.long_window)
+            short_ma = short_sums[idx] / short_window
+            long_ma = long_sums[idx] / long_window
             spread = short_ma - long_ma
-            sign = 1 if spread > 0 else (-1 if spread < 0 else 0)
-            prev_sign = int(self.state["last_spread_sign"][symbol])
-            in_position = bool(self.state["in_position"][symbol])
-            self.state["last_spread_sign"][symbol] = sign
+            sign = (spread > 0.0) - (spread < 0.0)
+            prev_sign = last_signs[idx]
+            in_position = in_positions[idx]
+            last_signs[idx] = sign
 
             crossed_up = sign > 0 and prev_sign <= 0
             crossed_down = sign < 0 and prev_sign >= 0
 
             if crossed_up and not in_position:
-                signals.append({
+                emit({
                     "symbol": symbol,
                     "signal": Signal.BUY,
-                    "quantity": float(self.position_size),
+                    "quantity": position_size,
                     "order_type": "market",
-                    "reason": f"MA crossover up: short={short_ma:.2f} long={long_ma:.2f}",
+                    "reason": SignalReason("MA crossover up: short=%.2f long=%.2f", short_ma, long_ma),
                 })
-                self.state["in_position"][symbol] = True
-                self.state["last_signal"][symbol] = Signal.BUY
+                in_positions[idx] = True
+                last_signals[idx] = Signal.BUY
             elif crossed_down and in_position:
-                signals.append({
+                emit({
                     "symbol": symbol,
                     "signal": Signal.SELL,
-                    "quantity": float(self.position_size),
+                    "quantity": position_size,
                     "order_type": "market",
-                    "reason": f"MA crossover down: short={short_ma:.2f} long={long_ma:.2f}",
+                    "reason": SignalReason("MA crossover down: short=%.2f long=%.2f", short_ma, long_ma),
                 })
-                self.state["in_position"][symbol] = False
-                self.state["last_signal"][symbol] = Signal.SELL
+                in_positions[idx] = False
+                last_signals[idx] = Signal.SELL
         
         return signals
     
@@ -124,7 +198,7 @@ class MovingAverageCrossoverStrategy(StrategyInterface):
         """
         Stop strategy.
         """
-        print(f"[{self.name}] Stopping MA Crossover Strategy")
+        logger.info("[%s] Stopping MA Crossover Strategy", self.name)
         self.is_running = False
     
     def _calculate_ma(self, symbol: str, window: int) -> float:
@@ -138,10 +212,24 @@ class MovingAverageCrossoverStrategy(StrategyInterface):
         Returns:
             Moving average value
         """
-        prices = self.state["price_history"].get(symbol, [])
-        if len(prices) < window or window <= 0:
+        idx = self._index.get(symbol)
+        if idx is None or window <= 0:
+            return 0.0
+        prices = self._history[idx]
+        if len(prices) < window:
             return 0.0
-        return float(sum(prices[-window:]) / window)
+        return float(sum(list(prices)[-window:]) / window)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Expose the column-wise per-symbol state keyed by symbol."""
+        state = super().get_state()
+        state["state"] = {
+            "price_history": {symbol: list(self._history[idx]) for symbol, idx in self._index.items()},
+            "in_position": {symbol: self._in_position[idx] for symbol, idx in self._index.items()},
+            "last_signal": {symbol: self._last_signal[idx].label for symbol, idx in self._index.items()},
+            "last_spread_sign": {symbol: self._last_sign[idx] for symbol, idx in self._index.items()},
+        }
+        return state
 
 
 class BuyAndHoldStrategy(StrategyInterface):
@@ -163,20 +251,19 @@ class BuyAndHoldStrategy(StrategyInterface):
         super().__init__(config)
         self.position_size = config.get("position_size", 100)
         self.sell_on_stop = config.get("sell_on_stop", False)
+        self._order_quantity = float(self.position_size)
         
-        self.state = {
-            "bought": {}  # symbol -> bool
-        }
+        self._index: Dict[str, int] = {}
+        self._bought: List[bool] = []
     
     def on_start(self) -> None:
         """
         Initialize strategy state.
         """
-        print(f"[{self.name}] Starting Buy and Hold Strategy")
-        print(f"  Symbols: {self.symbols}")
+        logger.info("[%s] Starting Buy and Hold Strategy: symbols=%s", self.name, self.symbols)
         
-        for symbol in self.symbols:
-            self.state["bought"][symbol] = False
+        self._index = {symbol: idx for idx, symbol in enumerate(dict.fromkeys(self.symbols))}
+        self._bought = [False] * len(self._index)
         
         self.is_running = True
     
@@ -185,23 +272,27 @@ class BuyAndHoldStrategy(StrategyInterface):
         Buy symbols that haven't been bought yet.
         """
         signals = []
+        bought = self._bought
+        position_size = self._order_quantity
         
-        for symbol in self.symbols:
-            if symbol not in market_data:
+        for symbol, idx in self._index.items():
+            if bought[idx]:
                 continue
-            price = float(market_data[symbol].get("price", 0.0) or 0.0)
+            data = market_data.get(symbol)
+            if not data:
+                continue
+            price = _tick_price(data)
             if price <= 0:
                 continue
             
-            if not bool(self.state["bought"].get(symbol, False)):
-                signals.append({
-                    "symbol": symbol,
-                    "signal": Signal.BUY,
-                    "quantity": float(self.position_size),
-                    "order_type": "market",
-                    "reason": "Buy and hold - initial purchase"
-                })
-                self.state["bought"][symbol] = True
+            signals.append({
+                "symbol": symbol,
+                "signal": Signal.BUY,
+                "quantity": position_size,
+                "order_type": "market",
+                "reason": "Buy and hold - initial purchase"
+            })
+            bought[idx] = True
         
         return signals
     
@@ -209,14 +300,22 @@ class BuyAndHoldStrategy(StrategyInterface):
         """
         Stop strategy.
         """
-        print(f"[{self.name}] Stopping Buy and Hold Strategy")
+        logger.info("[%s] Stopping Buy and Hold Strategy", self.name)
         self.is_running = False
 
+    def get_state(self) -> Dict[str, Any]:
+        """Expose the column-wise per-symbol state keyed by symbol."""
+        state = super().get_state()
+        state["state"] = {
+            "bought": {symbol: self._bought[idx] for symbol, idx in self._index.items()},
+        }
+        return state
+
 
 class MetricsDrivenStrategy(StrategyInterface):
     """
     ETF-investing strategy:
-    - Global trend gate: SPY > 200DMA
+    - Global trend gate: SPY > 200DMA (optionally also an allowed market regime)
     - Entry pullback: near SMA50 OR RSI(14) < 45 while symbol is above SMA200
     - Mechanical exits: TP / trailing / ATR / time
     """
@@ -234,136 +333,152 @@ class MetricsDrivenStrategy(StrategyInterface):
         self.dca_tranches = max(1, min(3, int(config.get("dca_tranches", 1))))
         self.pullback_sma_tolerance = float(config.get("pullback_sma_tolerance", 1.01))
         self.pullback_rsi_threshold = float(config.get("pullback_rsi_threshold", 45.0))
-
-        self.screener = MarketScreener(
-            config.get("alpaca_client"),
-            require_real_data=bool(config.get("require_real_data", False)),
+        # Optional regime gate for new entries; None allows entries in any regime.
+        allowed_regimes = config.get("allowed_regimes")
+        self.allowed_regimes: Optional[FrozenSet[str]] = (
+            frozenset(allowed_regimes) if allowed_regimes is not None else None
         )
+        # Price multipliers derived from the fixed percentage parameters.
+        self._stop_loss_factor = 1.0 - self.stop_loss_pct / 100.0
+        self._take_profit_factor = 1.0 + self.take_profit_pct / 100.0
+        self._trailing_stop_factor = 1.0 - self.trailing_stop_pct / 100.0
+        self._atr_stop_scale = self.atr_stop_mult / 100.0
+        self._entry_tranche_notional = self.position_size / self.dca_tranches
+
+        # The runner manager passes one screener to all strategies it loads,
+        # so reloading strategies does not rebuild Alpaca clients.
+        screener = config.get("screener")
+        if screener is None:
+            screener = MarketScreener(
+                config.get("alpaca_client"),
+                require_real_data=bool(config.get("require_real_data", False)),
+            )
+        self.screener = screener
         self.state: Dict[str, Any] = {
-            "positions": {},
+            "positions": {},  # symbol -> StrategyPosition or None when flat
             "last_regime": "unknown",
         }
         self._tick_count = 0
+        self._chart_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._regime_cache: Tuple[float, str] = (float("-inf"), "unknown")
+        self._chart_pool: Optional[ThreadPoolExecutor] = None
+        self._chart_metric_cache: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
 
     def on_start(self) -> None:
         for symbol in self.symbols:
             self.state["positions"][symbol] = None
         self._tick_count = 0
+        self._chart_cache.clear()
+        self._chart_metric_cache.clear()
+        self._regime_cache = (float("-inf"), "unknown")
+        if self._chart_pool is None:
+            self._chart_pool = ThreadPoolExecutor(
+                max_workers=max(1, min(_CHART_FETCH_MAX_WORKERS, len(self.symbols) + 1)),
+                thread_name_prefix="strategy-charts",
+            )
         self.is_running = True
 
     def on_tick(self, market_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Manage open positions first, then scan flat symbols for entries.
+
+        Symbols exited on this tick are not reconsidered for entry until the
+        next tick.
+        """
         signals: List[Dict[str, Any]] = []
-        regime = self.screener.detect_market_regime()
+        emit = signals.append
+        regime = self._cached_regime()
         self.state["last_regime"] = regime
-        broad_trend_allowed = self._is_spy_above_200dma()
+        allowed_regimes = self.allowed_regimes
+        regime_ok = allowed_regimes is None or regime in allowed_regimes
+        entries_allowed = regime_ok and self._is_spy_above_200dma()
         self._tick_count += 1
+        tick_count = self._tick_count
+        position_size = self.position_size
+        take_profit_factor = self._take_profit_factor
+        trailing_stop_factor = self._trailing_stop_factor
+        atr_stop_scale = self._atr_stop_scale
+        max_hold_days = self.max_hold_days
+        cached_chart = self._cached_chart
+        chart_metric = self._chart_metric
+        get_atr14_pct = self.screener.get_atr14_pct
 
-        for symbol in self.symbols:
+        positions = self.state["positions"]
+        open_symbols = [symbol for symbol, position in positions.items() if position is not None]
+        # No entry can fire when the gates are closed, so flat symbols need no
+        # chart or indicator work on this tick.
+        flat_symbols = (
+            [symbol for symbol in self.symbols if positions.get(symbol) is None]
+            if entries_allowed
+            else []
+        )
+        self._prefetch_charts(
+            [(symbol, 120) for symbol in open_symbols + flat_symbols if market_data.get(symbol)]
+        )
+
+        # --- Open positions: DCA adds, stop ratchet and exits ---
+        for symbol in open_symbols:
+            position = positions[symbol]
             data = market_data.get(symbol)
             if not data:
                 continue
-            price = float(data.get("price", 0.0))
+            price = _tick_price(data)
             if price <= 0:
                 continue
 
-            points = self.screener.get_symbol_chart(symbol, days=120)
-            indicators = self.screener.get_chart_indicators(
-                points=points,
-                take_profit_pct=self.take_profit_pct,
-                trailing_stop_pct=self.trailing_stop_pct,
-                atr_stop_mult=self.atr_stop_mult,
-                zscore_entry_threshold=self.zscore_entry_threshold,
-                dip_buy_threshold_pct=self.dip_buy_threshold_pct,
-            )
-            position = self.state["positions"].get(symbol)
-
-            if position is None:
-                latest_sma50 = self._latest_sma(points, 50)
-                latest_sma200 = self._latest_sma(points, 200)
-                rsi14 = self._rsi14(points)
-                near_sma50 = latest_sma50 is not None and price <= (latest_sma50 * self.pullback_sma_tolerance)
-                rsi_pullback = rsi14 is not None and rsi14 < self.pullback_rsi_threshold
-                symbol_trend_ok = latest_sma200 is not None and price > latest_sma200
-                entry_signal = broad_trend_allowed and symbol_trend_ok and (near_sma50 or rsi_pullback)
-                if entry_signal:
-                    # DCA: split entry into tranches
-                    tranche_size = self.position_size / self.dca_tranches
-                    qty = tranche_size / price  # fractional shares OK
-                    atr_pct = float(indicators.get("atr14_pct", 0.0))
-                    atr_stop_price = price * (1.0 - (self.atr_stop_mult * atr_pct / 100.0))
-                    stop_loss_price = price * (1.0 - self.stop_loss_pct / 100.0)
-                    self.state["positions"][symbol] = {
-                        "entry_price": price,
-                        "qty": qty,
-                        "peak_price": price,
-                        "atr_stop_price": min(atr_stop_price, stop_loss_price),
-                        "take_profit_price": price * (1.0 + self.take_profit_pct / 100.0),
-                        "entry_tick": self._tick_count,
-                        "dca_tranches_filled": 1,
-                        "dca_tranches_total": self.dca_tranches,
-                        "total_cost": qty * price,
-                    }
-                    signals.append({
-                        "symbol": symbol,
-                        "signal": Signal.BUY,
-                        "quantity": qty,
-                        "order_type": "limit",
-                        "price": round(price * 1.001, 4),
-                        "reason": (
-                            f"Trend+pullback entry tranche 1/{self.dca_tranches} "
-                            f"(SPY200DMA={broad_trend_allowed}, near50={near_sma50}, rsi14={rsi14})"
-                        ),
-                    })
-                continue
+            # Exits only need ATR% for the stop ratchet, not the full indicator set.
+            current_atr_pct = chart_metric("atr14_pct", symbol, cached_chart(symbol, 120), get_atr14_pct)
 
             # --- DCA: add subsequent tranches on deeper dips ---
-            tranches_filled = int(position.get("dca_tranches_filled", 1))
-            tranches_total = int(position.get("dca_tranches_total", 1))
+            tranches_filled = position.dca_tranches_filled
+            tranches_total = position.dca_tranches_total
             if tranches_filled < tranches_total:
-                entry_price = float(position["entry_price"])
+                entry_price = position.entry_price
                 # Each subsequent tranche requires an additional 1% dip from avg entry
                 dca_threshold = entry_price * (1.0 - (tranches_filled * 1.0 / 100.0))
                 if price <= dca_threshold:
-                    tranche_size = self.position_size / tranches_total
+                    tranche_size = position_size / tranches_total
                     add_qty = tranche_size / price
-                    old_qty = float(position["qty"])
-                    old_cost = float(position.get("total_cost", old_qty * entry_price))
+                    old_qty = position.qty
+                    old_cost = position.total_cost
                     new_qty = old_qty + add_qty
                     new_cost = old_cost + (add_qty * price)
-                    position["qty"] = new_qty
-                    position["entry_price"] = new_cost / new_qty  # new avg price
-                    position["total_cost"] = new_cost
-                    position["dca_tranches_filled"] = tranches_filled + 1
+                    position.qty = new_qty
+                    position.entry_price = new_cost / new_qty  # new avg price
+                    position.total_cost = new_cost
+                    position.dca_tranches_filled = tranches_filled + 1
                     # Recalculate take profit from new avg entry
                     new_avg = new_cost / new_qty
-                    position["take_profit_price"] = new_avg * (1.0 + self.take_profit_pct / 100.0)
-                    signals.append({
+                    position.take_profit_price = new_avg * take_profit_factor
+                    emit({
                         "symbol": symbol,
                         "signal": Signal.BUY,
                         "quantity": add_qty,
                         "order_type": "limit",
                         "price": round(price * 1.001, 4),
-                        "reason": f"DCA tranche {tranches_filled + 1}/{tranches_total} at ${price:.2f}",
+                        "reason": SignalReason(
+                            "DCA tranche %d/%d at $%.2f", tranches_filled + 1, tranches_total, price
+                        ),
                     })
 
             # --- Dynamic ATR stop: recalculate and ratchet upward ---
-            current_atr_pct = float(indicators.get("atr14_pct", 0.0))
             if current_atr_pct > 0:
-                new_atr_stop = price * (1.0 - (self.atr_stop_mult * current_atr_pct / 100.0))
-                if new_atr_stop > float(position["atr_stop_price"]):
-                    position["atr_stop_price"] = new_atr_stop
+                new_atr_stop = price * (1.0 - atr_stop_scale * current_atr_pct)
+                if new_atr_stop > position.atr_stop_price:
+                    position.atr_stop_price = new_atr_stop
 
             # --- Exit logic ---
-            position["peak_price"] = max(float(position["peak_price"]), price)
-            trailing_stop = float(position["peak_price"]) * (1.0 - self.trailing_stop_pct / 100.0)
-            take_profit_price = float(position["take_profit_price"])
-            atr_stop_price = float(position["atr_stop_price"])
+            if price > position.peak_price:
+                position.peak_price = price
+            trailing_stop = position.peak_price * trailing_stop_factor
+            take_profit_price = position.take_profit_price
+            atr_stop_price = position.atr_stop_price
 
             # Time-based exit: approximate days from tick count (1 tick ~ 1 min during market hours).
             # 390 ticks per trading day (6.5 hours * 60 min).
-            ticks_held = self._tick_count - int(position.get("entry_tick", self._tick_count))
+            ticks_held = tick_count - position.entry_tick
             approx_days_held = ticks_held / 390.0
-            time_exit = approx_days_held >= self.max_hold_days
+            time_exit = approx_days_held >= max_hold_days
 
             should_exit = (
                 time_exit
@@ -372,13 +487,13 @@ class MetricsDrivenStrategy(StrategyInterface):
                 or price >= take_profit_price
             )
             if should_exit:
-                qty = float(position["qty"])
-                exit_reason = "time_exit" if time_exit else (
-                    f"Exit trigger tp={take_profit_price:.2f}, "
-                    f"trail={trailing_stop:.2f}, atr_stop={atr_stop_price:.2f}, price={price:.2f}"
+                qty = position.qty
+                exit_reason = "time_exit" if time_exit else SignalReason(
+                    "Exit trigger tp=%.2f, trail=%.2f, atr_stop=%.2f, price=%.2f",
+                    take_profit_price, trailing_stop, atr_stop_price, price,
                 )
-                self.state["positions"][symbol] = None
-                signals.append({
+                positions[symbol] = None
+                emit({
                     "symbol": symbol,
                     "signal": Signal.SELL,
                     "quantity": qty,
@@ -386,18 +501,147 @@ class MetricsDrivenStrategy(StrategyInterface):
                     "reason": exit_reason,
                 })
 
+        # --- Flat symbols: trend + pullback entries ---
+        for symbol in flat_symbols:
+            data = market_data.get(symbol)
+            if not data:
+                continue
+            price = _tick_price(data)
+            if price <= 0:
+                continue
+
+            points = cached_chart(symbol, 120)
+            latest_sma50, latest_sma200, rsi14 = chart_metric("entry", symbol, points, self._entry_metrics)
+            near_sma50 = latest_sma50 is not None and price <= (latest_sma50 * self.pullback_sma_tolerance)
+            rsi_pullback = rsi14 is not None and rsi14 < self.pullback_rsi_threshold
+            symbol_trend_ok = latest_sma200 is not None and price > latest_sma200
+            entry_signal = entries_allowed and symbol_trend_ok and (near_sma50 or rsi_pullback)
+            if not entry_signal:
+                continue
+            # DCA: split entry into tranches
+            tranche_size = self._entry_tranche_notional
+            qty = tranche_size / price  # fractional shares OK
+            atr_pct = chart_metric("atr14_pct", symbol, points, get_atr14_pct)
+            atr_stop_price = price * (1.0 - atr_stop_scale * atr_pct)
+            stop_loss_price = price * self._stop_loss_factor
+            positions[symbol] = StrategyPosition(
+                entry_price=price,
+                qty=qty,
+                peak_price=price,
+                atr_stop_price=min(atr_stop_price, stop_loss_price),
+                take_profit_price=price * take_profit_factor,
+                entry_tick=tick_count,
+                dca_tranches_filled=1,
+                dca_tranches_total=self.dca_tranches,
+                total_cost=qty * price,
+            )
+            emit({
+                "symbol": symbol,
+                "signal": Signal.BUY,
+                "quantity": qty,
+                "order_type": "limit",
+                "price": round(price * 1.001, 4),
+                "reason": SignalReason(
+                    "Trend+pullback entry tranche 1/%d (SPY200DMA=%s, near50=%s, rsi14=%s)",
+                    self.dca_tranches, entries_allowed, near_sma50, rsi14,
+                ),
+            })
+
         return signals
 
+    def _cached_chart(self, symbol: str, days: int) -> List[Dict[str, Any]]:
+        """Screener chart for symbol, reused across ticks within the chart TTL."""
+        key = (symbol, days)
+        now = time.monotonic()
+        cached = self._chart_cache.get(key)
+        if cached is not None and now - cached[0] < _CHART_CACHE_TTL_SECONDS:
+            return cached[1]
+        points = self.screener.get_symbol_chart(symbol, days=days)
+        self._chart_cache[key] = (now, points)
+        return points
+
+    def _prefetch_charts(self, requests: List[Tuple[str, int]]) -> None:
+        """Fetch missing or expired charts concurrently into the chart cache."""
+        pool = self._chart_pool
+        now = time.monotonic()
+        stale = []
+        for key in dict.fromkeys(requests):
+            cached = self._chart_cache.get(key)
+            if cached is None or now - cached[0] >= _CHART_CACHE_TTL_SECONDS:
+                stale.append(key)
+        if pool is None or len(stale) < 2:
+            return
+        futures = {
+            key: pool.submit(self.screener.get_symbol_chart, key[0], days=key[1])
+            for key in stale
+        }
+        for key, future in futures.items():
+            try:
+                self._chart_cache[key] = (now, future.result())
+            except Exception:
+                # Left uncached; _cached_chart refetches inline and surfaces the error.
+                continue
+
+    def _chart_metric(
+        self,
+        kind: str,
+        symbol: str,
+        points: List[Dict[str, Any]],
+        compute: Callable[[List[Dict[str, Any]]], Any],
+    ) -> Any:
+        """
+        Memoize a value derived from a chart, keyed by the chart's latest bar.
+
+        Strategy parameters are fixed for the strategy's lifetime, so the
+        latest bar's timestamp and close identify the result; an intraday
+        update to the current daily bar changes the close and recomputes.
+        """
+        last = points[-1] if points else {}
+        key = (kind, symbol, last.get("timestamp"), last.get("close"))
+        cache = self._chart_metric_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        value = compute(points)
+        cache[key] = value
+        if len(cache) > _CHART_METRIC_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        return value
+
+    def _cached_regime(self) -> str:
+        """Screener market regime, reused across ticks within the regime TTL."""
+        now = time.monotonic()
+        fetched_at, regime = self._regime_cache
+        if now - fetched_at < _REGIME_CACHE_TTL_SECONDS:
+            return regime
+        regime = self.screener.detect_market_regime()
+        self._regime_cache = (now, regime)
+        return regime
+
     def _is_spy_above_200dma(self) -> bool:
-        points = self.screener.get_symbol_chart("SPY", days=260)
-        closes = [float(point.get("close", 0.0) or 0.0) for point in points]
-        closes = [value for value in closes if value > 0]
+        closes = self._chart_closes(self._cached_chart("SPY", 260))
         if len(closes) < 200:
             return False
         sma200 = sum(closes[-200:]) / 200.0
         return closes[-1] > sma200
 
-    def _latest_sma(self, points: List[Dict[str, Any]], window: int) -> Any:
+    def _entry_metrics(
+        self, points: List[Dict[str, Any]]
+    ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """SMA50, SMA200 and RSI(14) for a chart, parsing its closes only once."""
+        closes = self._chart_closes(points)
+        return (
+            self._latest_sma(points, closes, 50),
+            self._latest_sma(points, closes, 200),
+            self._rsi14(closes),
+        )
+
+    @staticmethod
+    def _chart_closes(points: List[Dict[str, Any]]) -> List[float]:
+        closes = [float(point.get("close", 0.0) or 0.0) for point in points]
+        return [value for value in closes if value > 0]
+
+    def _latest_sma(self, points: List[Dict[str, Any]], closes: List[float], window: int) -> Any:
         if not points:
             return None
         key = "sma50" if window == 50 else None
@@ -410,15 +654,11 @@ class MetricsDrivenStrategy(StrategyInterface):
                         return value
                 except (TypeError, ValueError):
                     pass
-        closes = [float(point.get("close", 0.0) or 0.0) for point in points]
-        closes = [value for value in closes if value > 0]
         if len(closes) < window:
             return None
         return sum(closes[-window:]) / float(window)
 
-    def _rsi14(self, points: List[Dict[str, Any]]) -> Any:
-        closes = [float(point.get("close", 0.0) or 0.0) for point in points]
-        closes = [value for value in closes if value > 0]
+    def _rsi14(self, closes: List[float]) -> Any:
         if len(closes) < 15:
             return None
         gains = 0.0
@@ -436,5 +676,20 @@ class MetricsDrivenStrategy(StrategyInterface):
         rs = avg_gain / avg_loss
         return 100.0 - (100.0 / (1.0 + rs))
 
+    def get_state(self) -> Dict[str, Any]:
+        """Expose open positions as plain dicts for status reporting."""
+        state = super().get_state()
+        state["state"] = {
+            **self.state,
+            "positions": {
+                symbol: asdict(position) if position is not None else None
+                for symbol, position in self.state["positions"].items()
+            },
+        }
+        return state
+
     def on_stop(self) -> None:
+        if self._chart_pool is not None:
+            self._chart_pool.shutdown(wait=False, cancel_futures=True)
+            self._chart_pool = None
         self.is_running = False
@@ -6,15 +6,48 @@ Abstract base class that all trading strategies must implement.
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 
 
-class Signal(Enum):
-    """Trading signal types."""
-    BUY = "buy"
-    SELL = "sell"
-    HOLD = "hold"
-    CLOSE = "close"
+class Signal(IntEnum):
+    """
+    Trading signal types.
+
+    Integer-valued so signals compare and store as plain ints; use
+    ``label`` for the lowercase name shown in logs and status payloads.
+    """
+    HOLD = 0
+    BUY = 1
+    SELL = 2
+    CLOSE = 3
+
+    @property
+    def label(self) -> str:
+        """Lowercase signal name, e.g. "buy"."""
+        return _SIGNAL_LABELS[self]
+
+
+_SIGNAL_LABELS = ("hold", "buy", "sell", "close")
+
+
+class SignalReason:
+    """
+    Signal reason rendered on demand.
+
+    Holds a %-style template and its arguments; the message is only
+    formatted when str() is called, e.g. when a log record is emitted.
+    """
+    __slots__ = ("template", "args")
+
+    def __init__(self, template: str, *args: Any):
+        self.template = template
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.template % self.args
+
+    def __repr__(self) -> str:
+        return repr(str(self))
 
 
 class StrategyInterface(ABC):
@@ -60,7 +93,8 @@ class StrategyInterface(ABC):
         Called on each scheduler tick with current market data.
         
         Args:
-            market_data: Dictionary mapping symbols to market data
+            market_data: Dictionary mapping symbols to market data. Brokers
+                report "price" as a float (0.0 when no quote is available).
                 Example: {
                     "AAPL": {"price": 150.0, "volume": 1000000, "timestamp": "..."},
                     "MSFT": {"price": 300.0, "volume": 500000, "timestamp": "..."}
@@ -77,6 +111,7 @@ class StrategyInterface(ABC):
                         "reason": "Moving average crossover"
                     }
                 ]
+                "reason" may be a str or a SignalReason.
         
         Must be implemented by concrete strategies.
         """
@@ -4,21 +4,90 @@ Scheduler/runner loop for executing trading strategies.
 """
 
 from typing import Dict, List, Optional, Any, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime, timezone
 from enum import Enum
+from collections import defaultdict
+from functools import lru_cache
 import threading
 import time
 import logging
 import json
 import math
+import os
+import sys
+from operator import itemgetter
 
-from engine.strategy_interface import StrategyInterface
+from engine.strategy_interface import StrategyInterface, Signal
 from services.broker import BrokerInterface, OrderSide, OrderType
 from services.order_execution import OrderExecutionService
 
 logger = logging.getLogger(__name__)
 _RECONCILIATION_BLOCKED_KEY = "broker_reconciliation_blocked_v1"
 _RECONCILIATION_STATUS_KEY = "broker_reconciliation_status_v1"
+_MARKET_DATA_FETCH_MAX_WORKERS = 8
+# Consecutive quote misses tolerated before a symbol is backed off; the
+# backoff then starts at one tick interval and doubles up to the cap.
+_MARKET_DATA_FAILURES_BEFORE_BACKOFF = 3
+_MARKET_DATA_FAILURE_BACKOFF_MAX = 60.0
+_TICK_OVERRUN_WARN_AFTER = 3
+# Pause after an overrunning tick, capped by the tick interval itself.
+_TICK_OVERRUN_MIN_PAUSE = 1.0
+_FULL_RECONCILE_EVERY_PASSES = 30
+# Market-session lookups are broker round-trips; session state changes rarely.
+_MARKET_OPEN_CACHE_TTL = 60.0
+_MARKET_CLOSED_CACHE_TTL = 300.0
+_MARKET_EDGE_CACHE_TTL = 5.0
+_AUDIT_FLUSH_BATCH = 64
+_STRATEGY_STATES_CACHE_TTL = 0.5
+# Runtime-state fields that change every tick; on their own they only force a
+# checkpoint write every _RUNTIME_STATE_REFRESH_SECONDS.
+_RUNTIME_STATE_VOLATILE_KEYS = frozenset(
+    {"poll_success_count", "last_poll_at", "last_successful_poll_at", "persisted_at"}
+)
+_RUNTIME_STATE_REFRESH_SECONDS = 30.0
+_SIGNAL_ORDER_SIDES = {
+    Signal.BUY: OrderSide.BUY,
+    Signal.SELL: OrderSide.SELL,
+    Signal.CLOSE: OrderSide.SELL,
+}
+_ORDER_TYPES = {
+    "limit": OrderType.LIMIT,
+    "stop": OrderType.STOP,
+    "market": OrderType.MARKET,
+}
+# Signal dict schema: fields are pulled out in one itemgetter call; signals
+# missing optional keys fall back to these defaults.
+_SIGNAL_DEFAULTS = {
+    "symbol": None,
+    "signal": None,
+    "quantity": 0,
+    "order_type": "market",
+    "price": None,
+    "reason": "",
+}
+_signal_fields = itemgetter("symbol", "signal", "quantity", "order_type", "price", "reason")
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """ISO-8601 text for an optional datetime."""
+    return value.isoformat() if value is not None else None
+
+
+def _as_utc(value: Any) -> Optional[datetime]:
+    """Broker clock timestamp as an aware UTC datetime, or None if absent."""
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _canonical_symbol(raw_symbol: Any) -> str:
+    """Upper-cased, interned ticker so reconciliation reuses one string per symbol."""
+    return sys.intern(str(raw_symbol or "").strip().upper())
 
 
 class StrategyStatus(Enum):
@@ -30,6 +99,17 @@ class StrategyStatus(Enum):
     ERROR = "error"
 
 
+class _BrokerPositionTotals:
+    """Per-symbol running totals of broker positions during reconciliation."""
+
+    __slots__ = ("signed_qty", "weighted_avg_sum", "abs_qty_sum")
+
+    def __init__(self) -> None:
+        self.signed_qty = 0.0
+        self.weighted_avg_sum = 0.0
+        self.abs_qty_sum = 0.0
+
+
 class StrategyRunner:
     """
     Strategy execution engine with scheduler/runner loop.
@@ -42,6 +122,63 @@ class StrategyRunner:
     - Executing paper trades through broker abstraction
     - Recording results in storage
     """
+
+    __slots__ = (
+        "broker",
+        "storage",
+        "tick_interval",
+        "order_execution_service",
+        "streaming_enabled",
+        "runner_cpu",
+        "realtime_priority",
+        "strategies",
+        "_strategies_lock",
+        "status",
+        "_symbols_cache",
+        "_symbols_source",
+        "_md_cache",
+        "_md_hits",
+        "_md_misses",
+        "_md_failures",
+        "_market_data",
+        "_strategy_states_cache",
+        "_market_open_cache",
+        "_next_open_cache",
+        "_runner_thread",
+        "_stop_event",
+        "_stream_update_event",
+        "_io_pool",
+        "_pending_reconcile_ids",
+        "_reconcile_lock",
+        "_reconcile_passes",
+        "_pending_audit_logs",
+        "poll_success_count",
+        "poll_error_count",
+        "last_poll_error",
+        "last_poll_at",
+        "last_successful_poll_at",
+        "_last_error_audit_mono",
+        "last_reconciliation_at",
+        "last_reconciliation_discrepancies",
+        "_last_reconciliation_ts",
+        "_last_reconciliation_signature",
+        "_reconciliation_disabled",
+        "sleeping",
+        "sleep_since",
+        "next_market_open_at",
+        "last_resume_at",
+        "last_catchup_at",
+        "resume_count",
+        "market_session_open",
+        "last_state_persisted_at",
+        "off_hours_poll_interval",
+        "_sleep_state_key",
+        "_persisted_sleep_state",
+        "_runtime_state_key",
+        "_persisted_runtime_state",
+        "_runtime_state_persisted_mono",
+        "on_signal_callback",
+    )
     
     def __init__(
         self,
@@ -50,6 +187,8 @@ class StrategyRunner:
         tick_interval: float = 60.0,
         order_execution_service: Optional[OrderExecutionService] = None,
         streaming_enabled: bool = False,
+        runner_cpu: Optional[int] = None,
+        realtime_priority: Optional[int] = None,
     ):
         """
         Initialize strategy runner.
@@ -58,30 +197,64 @@ class StrategyRunner:
             broker: Broker instance for order execution
             storage_service: Storage service for recording trades (optional)
             tick_interval: Interval between ticks in seconds (default: 60s)
+            runner_cpu: Optional CPU core to pin the scheduler thread to
+                (Linux only; STOCKSBOT_RUNNER_CPU)
+            realtime_priority: Optional SCHED_FIFO priority for the scheduler thread
+                (Linux only; STOCKSBOT_RUNNER_REALTIME_PRIORITY, needs CAP_SYS_NICE)
         """
         self.broker = broker
         self.storage = storage_service
         self.tick_interval = tick_interval
         self.order_execution_service = order_execution_service
         self.streaming_enabled = streaming_enabled
+        self.runner_cpu = runner_cpu
+        self.realtime_priority = realtime_priority
         
+        # Copy-on-write: writers swap in a new dict under the lock, so the
+        # runner thread can iterate a snapshot without locking.
         self.strategies: Dict[str, StrategyInterface] = {}
+        self._strategies_lock = threading.Lock()
         self.status = StrategyStatus.STOPPED
+        # Union of strategy symbols, rebuilt only when the strategies dict is swapped.
+        self._symbols_cache: Optional[frozenset] = None
+        self._symbols_source: Optional[Dict[str, StrategyInterface]] = None
+        # Short-lived per-symbol quote cache: symbol -> (monotonic fetch time, market data).
+        self._md_cache: Dict[str, tuple] = {}
+        self._md_hits = 0
+        self._md_misses = 0
+        # Symbols whose last fetch returned nothing:
+        # symbol -> (monotonic retry time, consecutive failures).
+        self._md_failures: Dict[str, tuple] = {}
+        self._market_data: Dict[str, Dict[str, Any]] = {}
+        # get_status strategy states: (monotonic expiry, strategies dict, states).
+        self._strategy_states_cache: Optional[tuple] = None
+        # Market-session caches: (monotonic expiry, value).
+        self._market_open_cache: Optional[tuple] = None
+        self._next_open_cache: Optional[tuple] = None
         
         # Scheduler loop control
         self._runner_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._stream_update_event = threading.Event()
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # Broker order ids named in stream updates, drained by _reconcile_open_orders.
+        self._pending_reconcile_ids: set[str] = set()
+        self._reconcile_lock = threading.Lock()
+        self._reconcile_passes = 0
+        # Runner audit entries, written in one batch per tick instead of one commit each.
+        self._pending_audit_logs: List[Dict[str, Any]] = []
         self.poll_success_count = 0
         self.poll_error_count = 0
         self.last_poll_error = ""
         self.last_poll_at: Optional[datetime] = None
         self.last_successful_poll_at: Optional[datetime] = None
-        self._last_error_audit_at: Optional[datetime] = None
+        # Throttling timers use monotonic seconds; wall-clock datetimes are kept for status output only.
+        self._last_error_audit_mono: Optional[float] = None
         self.last_reconciliation_at: Optional[datetime] = None
         self.last_reconciliation_discrepancies: int = 0
-        self._last_reconciliation_ts = 0.0
+        self._last_reconciliation_ts: Optional[float] = None
         self._last_reconciliation_signature: Optional[str] = None
+        self._reconciliation_disabled = self._uses_in_memory_sqlite()
         self.sleeping = False
         self.sleep_since: Optional[datetime] = None
         self.next_market_open_at: Optional[datetime] = None
@@ -92,7 +265,12 @@ class StrategyRunner:
         self.last_state_persisted_at: Optional[datetime] = None
         self.off_hours_poll_interval = max(15.0, float(self.tick_interval))
         self._sleep_state_key = "runner_sleep_state"
+        # Last sleep-state payload written, so unchanged checkpoints skip the upsert.
+        self._persisted_sleep_state: Optional[Dict[str, Any]] = None
         self._runtime_state_key = "runner_runtime_state"
+        # Non-volatile part of the last runtime checkpoint written, and when.
+        self._persisted_runtime_state: Optional[Dict[str, Any]] = None
+        self._runtime_state_persisted_mono: Optional[float] = None
         self._restore_sleep_state()
         self._restore_runtime_state()
         
@@ -110,9 +288,35 @@ class StrategyRunner:
             True if loaded successfully
         """
         strategy_name = strategy.get_name()
-        self.strategies[strategy_name] = strategy
-        print(f"[StrategyRunner] Loaded strategy: {strategy_name}")
+        with self._strategies_lock:
+            strategies = dict(self.strategies)
+            strategies[strategy_name] = strategy
+            self.strategies = strategies
+        logger.info("Loaded strategy: %s", strategy_name)
+        return True
+
+    def unload_strategy(self, strategy_name: str) -> bool:
+        """
+        Remove a loaded strategy by name.
+        
+        Args:
+            strategy_name: Name of the strategy to remove
+            
+        Returns:
+            True if the strategy was loaded and has been removed
+        """
+        with self._strategies_lock:
+            if strategy_name not in self.strategies:
+                return False
+            strategies = dict(self.strategies)
+            del strategies[strategy_name]
+            self.strategies = strategies
         return True
+
+    def clear_strategies(self) -> None:
+        """Remove all loaded strategies."""
+        with self._strategies_lock:
+            self.strategies = {}
     
     def start(self) -> bool:
         """
@@ -124,17 +328,17 @@ class StrategyRunner:
             True if started successfully
         """
         if self._runner_thread and self._runner_thread.is_alive() and not self._stop_event.is_set():
-            print(f"[StrategyRunner] Already active ({self.status.value})")
+            logger.info("Strategy runner already active (%s)", self.status.value)
             return False
         
         if not self.strategies:
-            print("[StrategyRunner] No strategies loaded")
+            logger.warning("Strategy runner not started: no strategies loaded")
             return False
         
         # Connect broker
         if not self.broker.is_connected():
             if not self.broker.connect():
-                print("[StrategyRunner] Failed to connect to broker")
+                logger.error("Strategy runner failed to connect to broker")
                 return False
 
         # Optional websocket trade update stream (hybrid with polling fallback).
@@ -142,19 +346,19 @@ class StrategyRunner:
             try:
                 started_stream = self.broker.start_trade_update_stream(self._on_broker_trade_update)
                 if started_stream:
-                    print("[StrategyRunner] Broker trade update stream enabled")
+                    logger.info("Broker trade update stream enabled")
                 else:
-                    print("[StrategyRunner] Broker trade update stream unavailable, using polling fallback")
+                    logger.info("Broker trade update stream unavailable, using polling fallback")
             except Exception as e:
-                print(f"[StrategyRunner] Failed to start trade update stream: {e}")
+                logger.warning("Failed to start trade update stream: %s", e)
         
         # Start all strategies
         for name, strategy in self.strategies.items():
             try:
                 strategy.on_start()
-                print(f"[StrategyRunner] Started strategy: {name}")
-            except Exception as e:
-                print(f"[StrategyRunner] Error starting strategy {name}: {e}")
+                logger.info("Started strategy: %s", name)
+            except Exception:
+                logger.exception("Error starting strategy %s", name)
                 return False
         
         # Mark running before launching thread; loop may immediately transition to SLEEPING.
@@ -162,11 +366,21 @@ class StrategyRunner:
 
         # Start scheduler loop
         self._stop_event.clear()
+        self._stream_update_event.clear()
+        self._invalidate_market_session_cache()
+        # First reconciliation after start sweeps every open order.
+        self._reconcile_passes = _FULL_RECONCILE_EVERY_PASSES
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=_MARKET_DATA_FETCH_MAX_WORKERS,
+                thread_name_prefix="runner-io",
+            )
         self._runner_thread = threading.Thread(target=self._run_loop, daemon=True)
         self._runner_thread.start()
-        self._persist_runtime_state()
+        self._persist_runtime_state(force=True)
+        self._strategy_states_cache = None
 
-        print(f"[StrategyRunner] Runner started with {len(self.strategies)} strategies")
+        logger.info("Runner started with %d strategies", len(self.strategies))
         return True
     
     def stop(self) -> bool:
@@ -179,30 +393,35 @@ class StrategyRunner:
             True if stopped successfully
         """
         if self.status == StrategyStatus.STOPPED:
-            print("[StrategyRunner] Already stopped")
+            logger.info("Strategy runner already stopped")
             return False
         
         # Signal the loop to stop
         self._stop_event.set()
+        self._wake()
         
         # Wait for runner thread to finish
         if self._runner_thread and self._runner_thread.is_alive():
             self._runner_thread.join(timeout=5.0)
+        self._flush_audit_logs()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._io_pool = None
         
         # Stop all strategies
         for name, strategy in self.strategies.items():
             try:
                 strategy.on_stop()
-                print(f"[StrategyRunner] Stopped strategy: {name}")
-            except Exception as e:
-                print(f"[StrategyRunner] Error stopping strategy {name}: {e}")
+                logger.info("Stopped strategy: %s", name)
+            except Exception:
+                logger.exception("Error stopping strategy %s", name)
         
         # Disconnect broker
         if self.streaming_enabled:
             try:
                 self.broker.stop_trade_update_stream()
             except Exception as e:
-                print(f"[StrategyRunner] Error stopping trade update stream: {e}")
+                logger.warning("Error stopping trade update stream: %s", e)
         if self.broker.is_connected():
             self.broker.disconnect()
         
@@ -210,9 +429,10 @@ class StrategyRunner:
         self.sleep_since = None
         self.next_market_open_at = None
         self.status = StrategyStatus.STOPPED
+        self._strategy_states_cache = None
         self._persist_sleep_state()
-        self._persist_runtime_state()
-        print("[StrategyRunner] Runner stopped")
+        self._persist_runtime_state(force=True)
+        logger.info("Runner stopped")
         return True
     
     def _run_loop(self) -> None:
@@ -221,20 +441,33 @@ class StrategyRunner:
         
         Runs on tick interval, fetches market data, and calls strategies.
         """
-        print(f"[StrategyRunner] Scheduler loop started (interval: {self.tick_interval}s)")
+        logger.info("Scheduler loop started (interval: %ss)", self.tick_interval)
+        self._apply_thread_scheduling()
+        # Ticks are scheduled against a monotonic deadline so the period does not
+        # stretch by however long each tick's work took.
+        # Loop-invariant lookups bound once; tick_interval is re-read since it can be reconfigured live.
+        broker = self.broker
+        stop_event = self._stop_event
+        monotonic = time.monotonic
+        now_utc = datetime.now
+        utc = timezone.utc
+        next_deadline = monotonic() + self.tick_interval
+        overruns = 0
         
-        while not self._stop_event.is_set():
-            self.last_poll_at = datetime.now(timezone.utc)
+        while not stop_event.is_set():
+            poll_at = now_utc(utc)
+            self.last_poll_at = poll_at
             try:
-                if not self.broker.is_connected():
-                    if not self.broker.connect():
+                if not broker.is_connected():
+                    if not broker.connect():
                         raise RuntimeError("Broker reconnect failed")
                     logger.info("Broker reconnected in strategy runner loop")
+                    self._invalidate_market_session_cache()
                     # Force-poll open orders to catch fills missed during disconnect
-                    self._reconcile_open_orders()
+                    self._reconcile_open_orders(full=True)
                     # Verify account isn't blocked/restricted after reconnect
                     try:
-                        account = self.broker.get_account_info()
+                        account = broker.get_account_info()
                         if account.get("trading_blocked") or account.get("account_blocked"):
                             logger.error(
                                 "Account blocked after reconnect (trading_blocked=%s, account_blocked=%s), activating circuit breaker",
@@ -247,13 +480,17 @@ class StrategyRunner:
                     except Exception as exc:
                         logger.warning("Failed to verify account status after reconnect: %s", exc)
 
-                self.market_session_open = bool(self.broker.is_market_open())
+                self.market_session_open = self._cached_market_open()
                 if not self.market_session_open:
                     self._enter_sleep_mode()
                     self.poll_success_count += 1
-                    self.last_successful_poll_at = datetime.now(timezone.utc)
+                    self.last_successful_poll_at = poll_at
+                    self._flush_audit_logs()
                     self._persist_runtime_state()
-                    self._sleep_wait(self.off_hours_poll_interval)
+                    # Stream updates are not acted on off-hours, so only a stop request ends this wait.
+                    if stop_event.wait(timeout=self.off_hours_poll_interval):
+                        break
+                    next_deadline = monotonic() + self.tick_interval
                     continue
 
                 if self.sleeping:
@@ -276,28 +513,13 @@ class StrategyRunner:
                         logger.warning("Weekly DCA execution attempt failed: %s", dca_exc)
                 
                 # Process each strategy
-                for name, strategy in self.strategies.items():
-                    try:
-                        # Call strategy's on_tick
-                        signals = strategy.on_tick(market_data)
-                        
-                        # Execute signals
-                        if signals:
-                            self._execute_signals(strategy, signals)
-                    
-                    except Exception as e:
-                        self.poll_error_count += 1
-                        self.last_poll_error = f"strategy:{name} -> {e}"
-                        print(f"[StrategyRunner] Error in strategy {name}: {e}")
-                        logger.exception("Strategy tick failed for %s", name)
-                        self._audit_poll_error(self.last_poll_error)
+                self._run_strategies(market_data)
                 self.poll_success_count += 1
-                self.last_successful_poll_at = datetime.now(timezone.utc)
+                self.last_successful_poll_at = poll_at
                 
             except Exception as e:
                 self.poll_error_count += 1
                 self.last_poll_error = str(e)
-                print(f"[StrategyRunner] Error in scheduler loop: {e}")
                 logger.exception("Strategy runner scheduler loop error")
                 self._audit_poll_error(self.last_poll_error)
 
@@ -305,38 +527,111 @@ class StrategyRunner:
             try:
                 self._reconcile_open_orders()
             except Exception as e:
-                print(f"[StrategyRunner] Error reconciling open orders: {e}")
+                logger.warning("Error reconciling open orders: %s", e)
 
             # Periodic local-vs-broker position reconciliation.
             try:
                 self._maybe_reconcile_positions_with_broker()
             except Exception as e:
-                print(f"[StrategyRunner] Error during position reconciliation: {e}")
+                logger.warning("Error during position reconciliation: %s", e)
 
             # Persist account/portfolio snapshot for dashboard/analytics continuity.
             try:
-                self._record_portfolio_snapshot()
+                self._record_portfolio_snapshot(now_utc=poll_at)
             except Exception as e:
-                print(f"[StrategyRunner] Error recording portfolio snapshot: {e}")
+                logger.warning("Error recording portfolio snapshot: %s", e)
 
+            self._flush_audit_logs()
             self._persist_runtime_state()
             
-            # Wait for next tick, but wake early on broker trade updates.
-            self._sleep_wait(self.tick_interval)
+            # Wait for next tick deadline, but wake early on broker trade updates.
+            now = monotonic()
+            remaining = next_deadline - now
+            if remaining <= 0:
+                overruns += 1
+                if overruns == _TICK_OVERRUN_WARN_AFTER:
+                    logger.warning(
+                        "Strategy runner tick overrun: %d consecutive ticks exceeded %.1fs interval",
+                        overruns,
+                        self.tick_interval,
+                    )
+                # Skip missed ticks instead of running them back-to-back to catch up,
+                # and still pause briefly so persistently slow ticks do not hammer the broker.
+                next_deadline = now + self.tick_interval
+                self._sleep_wait(min(self.tick_interval, _TICK_OVERRUN_MIN_PAUSE))
+                continue
+            overruns = 0
+            if not self._sleep_wait(remaining):
+                next_deadline += self.tick_interval
         
-        print("[StrategyRunner] Scheduler loop exited")
+        logger.info("Scheduler loop exited")
 
-    def _sleep_wait(self, seconds: float) -> None:
-        """Wait loop that can wake early on stream updates or stop requests."""
-        end_time = time.time() + max(0.1, seconds)
-        while not self._stop_event.is_set():
-            remaining = max(0.0, end_time - time.time())
-            if remaining <= 0:
-                break
-            wait_slice = min(0.5, remaining)
-            if self._stream_update_event.wait(timeout=wait_slice):
-                self._stream_update_event.clear()
-                break
+    def _apply_thread_scheduling(self) -> None:
+        """Pin the scheduler thread to a core and/or raise its priority, when configured."""
+        if self.runner_cpu is not None:
+            try:
+                os.sched_setaffinity(0, {int(self.runner_cpu)})
+            except (AttributeError, OSError, ValueError) as e:
+                logger.warning("Could not pin scheduler thread to CPU %s: %s", self.runner_cpu, e)
+        if self.realtime_priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(int(self.realtime_priority)))
+            except (AttributeError, OSError, ValueError) as e:
+                logger.warning("Could not set SCHED_FIFO priority %s: %s", self.realtime_priority, e)
+
+    def _run_strategies(self, market_data: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Tick every loaded strategy and execute the resulting signals.
+        
+        Strategies are independent, so their on_tick calls run concurrently on
+        the I/O pool and hand their signals back as each one finishes. Signals
+        are executed on the runner thread, which owns the storage session, so
+        order submission for one strategy overlaps with the others' ticks.
+        """
+        pool = self._io_pool
+        strategy_items = tuple(self.strategies.items())
+        if pool is not None and len(strategy_items) > 1:
+            futures = {
+                pool.submit(strategy.on_tick, market_data): (name, strategy)
+                for name, strategy in strategy_items
+            }
+            completed = ((futures[future], future) for future in as_completed(futures))
+        else:
+            completed = (((name, strategy), None) for name, strategy in strategy_items)
+
+        for (name, strategy), future in completed:
+            try:
+                # Call strategy's on_tick
+                signals = future.result() if future is not None else strategy.on_tick(market_data)
+                
+                # Execute signals
+                if signals:
+                    self._execute_signals(strategy, signals)
+            
+            except Exception as e:
+                self.poll_error_count += 1
+                self.last_poll_error = f"strategy:{name} -> {e}"
+                logger.exception("Strategy tick failed for %s", name)
+                self._audit_poll_error(self.last_poll_error)
+
+    def _sleep_wait(self, seconds: float) -> bool:
+        """
+        Wait until the timeout, a broker stream update or a stop request.
+        
+        A single blocking wait is used; stop() wakes it through _wake() so the
+        runner thread is not polled awake in short slices.
+        
+        Returns:
+            True if woken early by a broker stream update
+        """
+        woke = self._stream_update_event.wait(timeout=max(0.1, seconds))
+        if woke:
+            self._stream_update_event.clear()
+        return woke and not self._stop_event.is_set()
+
+    def _wake(self) -> None:
+        """Wake the scheduler loop out of its current wait."""
+        self._stream_update_event.set()
 
     def _enter_sleep_mode(self) -> None:
         """Transition runner into off-hours sleep mode."""
@@ -350,18 +645,14 @@ class StrategyRunner:
         self.next_market_open_at = self._safe_next_market_open()
         self.status = StrategyStatus.SLEEPING
         self._persist_sleep_state()
-        if self.storage:
-            try:
-                self.storage.create_audit_log(
-                    event_type="config_updated",
-                    description="Runner entered off-hours sleep mode",
-                    details={
-                        "sleep_since": self.sleep_since.isoformat(),
-                        "next_market_open_at": self.next_market_open_at.isoformat() if self.next_market_open_at else None,
-                    },
-                )
-            except Exception:
-                logger.exception("Failed to audit runner sleep-mode transition")
+        self._queue_audit_log(
+            event_type="config_updated",
+            description="Runner entered off-hours sleep mode",
+            details={
+                "sleep_since": self.sleep_since.isoformat(),
+                "next_market_open_at": _iso(self.next_market_open_at),
+            },
+        )
 
     def _resume_from_sleep(self) -> None:
         """Resume active processing after off-hours sleep."""
@@ -372,37 +663,77 @@ class StrategyRunner:
         self.sleep_since = None
         self.next_market_open_at = None
         self.status = StrategyStatus.RUNNING
+        # Catch up on anything that changed while asleep with a full order sweep.
+        self._reconcile_passes = _FULL_RECONCILE_EVERY_PASSES
         # Warm market-data cache immediately after open so charts/strategies pick up continuity quickly.
         try:
             _ = self._fetch_market_data()
         except Exception:
             logger.debug("Failed to warm market-data cache during resume", exc_info=True)
         self._persist_sleep_state()
-        if self.storage:
-            try:
-                self.storage.create_audit_log(
-                    event_type="config_updated",
-                    description="Runner resumed after market open",
-                    details={
-                        "resume_at": self.last_resume_at.isoformat(),
-                        "resume_count": self.resume_count,
-                    },
-                )
-            except Exception:
-                logger.exception("Failed to audit runner resume transition")
+        self._queue_audit_log(
+            event_type="config_updated",
+            description="Runner resumed after market open",
+            details={
+                "resume_at": self.last_resume_at.isoformat(),
+                "resume_count": self.resume_count,
+            },
+        )
 
     def _safe_next_market_open(self) -> Optional[datetime]:
-        """Best-effort next market-open timestamp from broker."""
+        """Best-effort next market-open timestamp from broker, cached between off-hours polls."""
+        now = time.monotonic()
+        cached = self._next_open_cache
+        # A forecast that has already passed is stale even within the TTL.
+        if cached is not None and now < cached[0] and cached[1] > datetime.now(timezone.utc):
+            return cached[1]
         try:
-            next_open = self.broker.get_next_market_open()
-            if not next_open:
+            next_open = _as_utc(self.broker.get_next_market_open())
+            if next_open is None:
                 return None
-            if next_open.tzinfo is None:
-                return next_open.replace(tzinfo=timezone.utc)
-            return next_open.astimezone(timezone.utc)
         except Exception:
             logger.debug("Failed to fetch next market open from broker", exc_info=True)
             return None
+        self._next_open_cache = (now + _MARKET_CLOSED_CACHE_TTL, next_open)
+        return next_open
+
+    def _cached_market_open(self) -> bool:
+        """
+        Return broker market-open state, cached with a TTL.
+        
+        Both TTLs are cut short at the next session edge: a closed result
+        expires ahead of the predicted next open so the runner wakes within a
+        few seconds of the session starting, and an open result expires at
+        the next close so no ticks (or orders) run past the bell. Open state
+        and both session edges come from one broker clock lookup.
+        """
+        now = time.monotonic()
+        cached = self._market_open_cache
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        clock = self.broker.get_market_clock()
+        is_open = bool(clock.get("is_open"))
+        if is_open:
+            ttl = _MARKET_EDGE_CACHE_TTL
+            next_close = _as_utc(clock.get("next_close"))
+            if next_close is not None:
+                until_close = (next_close - datetime.now(timezone.utc)).total_seconds()
+                ttl = min(_MARKET_OPEN_CACHE_TTL, max(_MARKET_EDGE_CACHE_TTL, until_close))
+        else:
+            ttl = _MARKET_CLOSED_CACHE_TTL
+            next_open = _as_utc(clock.get("next_open"))
+            if next_open is not None:
+                # Seed the forecast cache so sleep-mode status needs no second lookup.
+                self._next_open_cache = (now + _MARKET_CLOSED_CACHE_TTL, next_open)
+                until_open = (next_open - datetime.now(timezone.utc)).total_seconds()
+                ttl = min(ttl, max(_MARKET_EDGE_CACHE_TTL, until_open))
+        self._market_open_cache = (now + ttl, is_open)
+        return is_open
+
+    def _invalidate_market_session_cache(self) -> None:
+        """Drop cached market-session lookups so the next check hits the broker."""
+        self._market_open_cache = None
+        self._next_open_cache = None
 
     def _persist_sleep_state(self) -> None:
         """Persist sleep/resume checkpoint to DB config for continuity across restarts."""
@@ -411,53 +742,77 @@ class StrategyRunner:
         try:
             payload = {
                 "sleeping": self.sleeping,
-                "sleep_since": self.sleep_since.isoformat() if self.sleep_since else None,
-                "next_market_open_at": self.next_market_open_at.isoformat() if self.next_market_open_at else None,
-                "last_resume_at": self.last_resume_at.isoformat() if self.last_resume_at else None,
-                "last_catchup_at": self.last_catchup_at.isoformat() if self.last_catchup_at else None,
+                "sleep_since": _iso(self.sleep_since),
+                "next_market_open_at": _iso(self.next_market_open_at),
+                "last_resume_at": _iso(self.last_resume_at),
+                "last_catchup_at": _iso(self.last_catchup_at),
                 "resume_count": self.resume_count,
             }
+            if payload == self._persisted_sleep_state:
+                return
             self.storage.config.upsert(
                 key=self._sleep_state_key,
-                value=json.dumps(payload),
+                value=json.dumps(payload, separators=(",", ":")),
                 value_type="json",
                 description="Runner sleep/resume continuity checkpoint",
             )
+            self._persisted_sleep_state = payload
         except Exception:
             logger.exception("Failed to persist runner sleep-state checkpoint")
 
-    def _persist_runtime_state(self) -> None:
-        """Persist runner runtime health counters/state for status continuity across restarts."""
+    def _persist_runtime_state(self, force: bool = False) -> None:
+        """
+        Persist runner runtime health counters/state for status continuity across restarts.
+        
+        Ticks that only advance poll timestamps/counters are written at most
+        every 30s; any other change (status, errors, sleep state) is written
+        immediately.
+        
+        Args:
+            force: Write the checkpoint even if nothing meaningful changed
+        """
         if not self.storage:
             return
         try:
+            persisted_at = datetime.now(timezone.utc)
             payload = {
                 "status": self.status.value,
                 "poll_success_count": int(self.poll_success_count),
                 "poll_error_count": int(self.poll_error_count),
                 "last_poll_error": self.last_poll_error,
-                "last_poll_at": self.last_poll_at.isoformat() if self.last_poll_at else None,
-                "last_successful_poll_at": self.last_successful_poll_at.isoformat() if self.last_successful_poll_at else None,
-                "last_reconciliation_at": self.last_reconciliation_at.isoformat() if self.last_reconciliation_at else None,
+                "last_poll_at": _iso(self.last_poll_at),
+                "last_successful_poll_at": _iso(self.last_successful_poll_at),
+                "last_reconciliation_at": _iso(self.last_reconciliation_at),
                 "last_reconciliation_discrepancies": int(self.last_reconciliation_discrepancies),
                 "sleeping": bool(self.sleeping),
-                "sleep_since": self.sleep_since.isoformat() if self.sleep_since else None,
-                "next_market_open_at": self.next_market_open_at.isoformat() if self.next_market_open_at else None,
-                "last_resume_at": self.last_resume_at.isoformat() if self.last_resume_at else None,
-                "last_catchup_at": self.last_catchup_at.isoformat() if self.last_catchup_at else None,
+                "sleep_since": _iso(self.sleep_since),
+                "next_market_open_at": _iso(self.next_market_open_at),
+                "last_resume_at": _iso(self.last_resume_at),
+                "last_catchup_at": _iso(self.last_catchup_at),
                 "resume_count": int(self.resume_count),
                 "market_session_open": self.market_session_open,
                 "broker_connected": bool(self.broker.is_connected()),
                 "runner_thread_alive": bool(self._runner_thread and self._runner_thread.is_alive()),
-                "persisted_at": datetime.now(timezone.utc).isoformat(),
+                "persisted_at": persisted_at.isoformat(),
             }
+            stable = {key: value for key, value in payload.items() if key not in _RUNTIME_STATE_VOLATILE_KEYS}
+            now_mono = time.monotonic()
+            if (
+                not force
+                and stable == self._persisted_runtime_state
+                and self._runtime_state_persisted_mono is not None
+                and now_mono - self._runtime_state_persisted_mono < _RUNTIME_STATE_REFRESH_SECONDS
+            ):
+                return
             self.storage.config.upsert(
                 key=self._runtime_state_key,
-                value=json.dumps(payload),
+                value=json.dumps(payload, separators=(",", ":")),
                 value_type="json",
                 description="Runner runtime health/status checkpoint",
             )
-            self.last_state_persisted_at = datetime.now(timezone.utc)
+            self.last_state_persisted_at = persisted_at
+            self._persisted_runtime_state = stable
+            self._runtime_state_persisted_mono = now_mono
         except Exception:
             logger.exception("Failed to persist runner runtime-state checkpoint")
 
@@ -524,24 +879,54 @@ class StrategyRunner:
             logger.debug("Failed to parse ISO datetime value: %s", value, exc_info=True)
             return None
 
-    def _reconcile_open_orders(self) -> None:
-        """Poll broker status for open local orders and process newly filled trades."""
+    def _reconcile_open_orders(self, full: bool = False) -> None:
+        """
+        Poll broker status for open local orders and process newly filled trades.
+        
+        While the broker trade-update stream is running, only orders named in
+        stream updates since the last pass are polled; a full sweep of open
+        orders still runs every few ticks, and whenever streaming is down.
+        
+        Args:
+            full: Force a sweep of all open orders (e.g. after a reconnect)
+        """
         if not self.order_execution_service or not self.storage:
             return
-        open_orders = self.storage.get_open_orders(limit=500)
-        for order in open_orders:
+        with self._reconcile_lock:
+            updated_ids = self._pending_reconcile_ids
+            self._pending_reconcile_ids = set()
+        self._reconcile_passes += 1
+
+        stream_active = False
+        if self.streaming_enabled:
             try:
-                self.order_execution_service.update_order_status(order)
-            except Exception as e:
-                print(f"[StrategyRunner] Failed to reconcile order {order.id}: {e}")
-                logger.exception("Failed to reconcile order %s", order.id)
+                stream_active = bool(self.broker.is_trade_update_stream_active())
+            except Exception:
+                logger.debug("Failed to query trade update stream state", exc_info=True)
+        full_sweep = full or not stream_active or self._reconcile_passes >= _FULL_RECONCILE_EVERY_PASSES
+        if full_sweep:
+            self._reconcile_passes = 0
+            open_orders = self.storage.get_open_orders(limit=500)
+        elif updated_ids:
+            open_orders = self.storage.get_open_orders_by_external_ids(sorted(updated_ids))
+        else:
+            return
+        if open_orders:
+            # Full sweeps exist to catch missed stream events, so they must not
+            # be answered from streamed broker state.
+            self.order_execution_service.update_order_statuses_bulk(open_orders, use_cache=not full_sweep)
 
     def _on_broker_trade_update(self, update: Dict[str, Any]) -> None:
         """
         Trade update callback from broker stream.
-        Signals runner loop to reconcile orders immediately.
+        Queues the updated order for reconciliation and wakes the runner loop.
         """
-        self._stream_update_event.set()
+        update = update or {}
+        order_id = str(update.get("order_id") or update.get("id") or "").strip()
+        if order_id:
+            with self._reconcile_lock:
+                self._pending_reconcile_ids.add(order_id)
+        self._wake()
 
     @staticmethod
     def _signed_quantity(raw_quantity: Any, raw_side: Any = None) -> float:
@@ -560,25 +945,23 @@ class StrategyRunner:
 
     def _aggregate_broker_quantities(self, broker_positions: List[Dict[str, Any]]) -> Dict[str, float]:
         """Aggregate signed broker quantities by symbol."""
-        broker_qty: Dict[str, float] = {}
+        broker_qty: Dict[str, float] = defaultdict(float)
         for row in broker_positions:
-            sym = str(row.get("symbol", "")).strip().upper()
+            sym = _canonical_symbol(row.get("symbol", ""))
             if not sym:
                 continue
-            signed = self._signed_quantity(row.get("quantity", 0.0), row.get("side"))
-            broker_qty[sym] = broker_qty.get(sym, 0.0) + signed
-        return broker_qty
+            broker_qty[sym] += self._signed_quantity(row.get("quantity", 0.0), row.get("side"))
+        return dict(broker_qty)
 
     def _aggregate_local_quantities(self, local_positions: List[Any]) -> Dict[str, float]:
         """Aggregate signed local quantities by symbol."""
-        local_qty: Dict[str, float] = {}
+        local_qty: Dict[str, float] = defaultdict(float)
         for row in local_positions:
-            sym = str(getattr(row, "symbol", "")).strip().upper()
+            sym = _canonical_symbol(getattr(row, "symbol", ""))
             if not sym:
                 continue
-            signed = self._signed_quantity(getattr(row, "quantity", 0.0), getattr(row, "side", None))
-            local_qty[sym] = local_qty.get(sym, 0.0) + signed
-        return local_qty
+            local_qty[sym] += self._signed_quantity(getattr(row, "quantity", 0.0), getattr(row, "side", None))
+        return dict(local_qty)
 
     def _collect_quantity_discrepancies(
         self,
@@ -589,11 +972,9 @@ class StrategyRunner:
     ) -> List[Dict[str, Any]]:
         """Build discrepancy rows for non-pending symbols."""
         rows: List[Dict[str, Any]] = []
-        for sym in sorted(set(broker_qty.keys()) | set(local_qty.keys())):
-            if sym in pending_symbols:
-                continue
-            broker_quantity = float(broker_qty.get(sym, 0.0))
-            local_quantity = float(local_qty.get(sym, 0.0))
+        for sym in sorted((broker_qty.keys() | local_qty.keys()) - pending_symbols):
+            broker_quantity = broker_qty.get(sym, 0.0)
+            local_quantity = local_qty.get(sym, 0.0)
             diff = abs(broker_quantity - local_quantity)
             if diff <= quantity_tolerance:
                 continue
@@ -632,40 +1013,35 @@ class StrategyRunner:
             return []
         from storage.models import PositionSideEnum
 
-        broker_state: Dict[str, Dict[str, float]] = {}
+        broker_state: Dict[str, _BrokerPositionTotals] = defaultdict(_BrokerPositionTotals)
         for row in broker_positions:
-            sym = str(row.get("symbol", "")).strip().upper()
+            sym = _canonical_symbol(row.get("symbol", ""))
             if not sym:
                 continue
             signed_qty = self._signed_quantity(row.get("quantity", 0.0), row.get("side"))
             if abs(signed_qty) <= quantity_tolerance:
                 continue
             avg_entry_price = self._safe_float(row.get("avg_entry_price", row.get("price", 0.0)), 0.0)
-            state = broker_state.setdefault(
-                sym,
-                {"signed_qty": 0.0, "weighted_avg_sum": 0.0, "abs_qty_sum": 0.0},
-            )
+            state = broker_state[sym]
             abs_qty = abs(signed_qty)
-            state["signed_qty"] += signed_qty
-            state["weighted_avg_sum"] += max(0.0, avg_entry_price) * abs_qty
-            state["abs_qty_sum"] += abs_qty
+            state.signed_qty += signed_qty
+            state.weighted_avg_sum += max(0.0, avg_entry_price) * abs_qty
+            state.abs_qty_sum += abs_qty
 
         local_positions = self.storage.get_open_positions()
-        local_by_symbol: Dict[str, List[Any]] = {}
+        local_by_symbol: Dict[str, List[Any]] = defaultdict(list)
         for row in local_positions:
-            sym = str(getattr(row, "symbol", "")).strip().upper()
+            sym = _canonical_symbol(getattr(row, "symbol", ""))
             if not sym:
                 continue
-            local_by_symbol.setdefault(sym, []).append(row)
+            local_by_symbol[sym].append(row)
 
         changes: List[Dict[str, Any]] = []
-        for sym in sorted(set(broker_state.keys()) | set(local_by_symbol.keys())):
-            if sym in pending_symbols:
-                continue
+        for sym in sorted((broker_state.keys() | local_by_symbol.keys()) - pending_symbols):
             local_rows = sorted(local_by_symbol.get(sym, []), key=lambda row: int(getattr(row, "id", 0)))
             target_state = broker_state.get(sym)
 
-            if target_state is None or abs(float(target_state.get("signed_qty", 0.0))) <= quantity_tolerance:
+            if target_state is None or abs(target_state.signed_qty) <= quantity_tolerance:
                 for row in local_rows:
                     self.storage.positions.close_position(
                         row,
@@ -680,12 +1056,12 @@ class StrategyRunner:
                     )
                 continue
 
-            target_signed_qty = float(target_state["signed_qty"])
+            target_signed_qty = target_state.signed_qty
             target_qty = abs(target_signed_qty)
             target_side = PositionSideEnum.SHORT if target_signed_qty < 0 else PositionSideEnum.LONG
             target_avg_entry = (
-                float(target_state["weighted_avg_sum"]) / float(target_state["abs_qty_sum"])
-                if float(target_state["abs_qty_sum"]) > 0
+                target_state.weighted_avg_sum / target_state.abs_qty_sum
+                if target_state.abs_qty_sum > 0
                 else 0.0
             )
             target_avg_entry = max(0.0, target_avg_entry)
@@ -748,25 +1124,18 @@ class StrategyRunner:
 
     def _maybe_reconcile_positions_with_broker(self) -> None:
         """Run position reconciliation every 5 minutes."""
-        if not self.storage:
+        if not self.storage or self._reconciliation_disabled:
             return
-        # In-memory sqlite sessions in tests are not thread-safe for runner thread usage.
-        try:
-            bind_url = str(self.storage.db.get_bind().url)
-            if bind_url.startswith("sqlite:///:memory:"):
-                return
-        except Exception:
-            logger.debug("Failed to inspect storage bind URL for reconciliation guard", exc_info=True)
-        now = time.time()
-        if now - self._last_reconciliation_ts < 300:
+        now = time.monotonic()
+        if self._last_reconciliation_ts is not None and now - self._last_reconciliation_ts < 300:
             return
         self._last_reconciliation_ts = now
         broker_positions = self.broker.get_positions()
         local_positions = self.storage.get_open_positions()
         pending_symbols: set[str] = set()
         try:
-            for order in self.storage.get_open_orders(limit=500):
-                symbol = str(getattr(order, "symbol", "")).strip().upper()
+            for raw_symbol in self.storage.get_open_order_symbols():
+                symbol = _canonical_symbol(raw_symbol)
                 if symbol:
                     pending_symbols.add(symbol)
         except Exception:
@@ -825,7 +1194,7 @@ class StrategyRunner:
         except Exception:
             logger.debug("Failed to persist reconciliation status snapshot", exc_info=True)
         if sync_changes:
-            self.storage.create_audit_log(
+            self._queue_audit_log(
                 event_type="config_updated",
                 description=f"Runner synchronized {len(sync_changes)} local position state change(s) with broker",
                 details={
@@ -836,7 +1205,7 @@ class StrategyRunner:
         if discrepancies > 0:
             signature = self._discrepancy_signature(discrepancy_rows)
             if signature != self._last_reconciliation_signature:
-                self.storage.create_audit_log(
+                self._queue_audit_log(
                     event_type="error",
                     description=f"Runner reconciliation found {discrepancies} unresolved discrepancy(ies)",
                     details={
@@ -849,64 +1218,213 @@ class StrategyRunner:
                 )
                 self._last_reconciliation_signature = signature
         elif self._last_reconciliation_signature is not None:
-            self.storage.create_audit_log(
+            self._queue_audit_log(
                 event_type="config_updated",
                 description="Runner reconciliation resolved all previously-detected discrepancies",
                 details={"source": "strategy_runner_reconciliation"},
             )
             self._last_reconciliation_signature = None
 
+    def _uses_in_memory_sqlite(self) -> bool:
+        """Whether storage is backed by in-memory sqlite (test sessions, not thread-safe for the runner)."""
+        if not self.storage:
+            return False
+        try:
+            return str(self.storage.db.get_bind().url).startswith("sqlite:///:memory:")
+        except Exception:
+            logger.debug("Failed to inspect storage bind URL for reconciliation guard", exc_info=True)
+            return False
+
     def _audit_poll_error(self, message: str) -> None:
         """Write poll errors into audit trail with basic throttling."""
         if not self.storage:
             return
-        now = datetime.now(timezone.utc)
-        if self._last_error_audit_at and (now - self._last_error_audit_at).total_seconds() < 30:
+        now = time.monotonic()
+        if self._last_error_audit_mono is not None and now - self._last_error_audit_mono < 30:
+            return
+        self._last_error_audit_mono = now
+        self._queue_audit_log(
+            event_type="error",
+            description=f"Runner poll error: {message}",
+            details={"source": "strategy_runner_poll"},
+        )
+
+    def _queue_audit_log(self, event_type: str, description: str, details: Optional[Dict[str, Any]] = None) -> None:
+        """Buffer a runner audit entry for the next batched flush."""
+        if not self.storage:
+            return
+        self._pending_audit_logs.append({
+            "event_type": event_type,
+            "description": description,
+            "details": details,
+            "timestamp": datetime.now(timezone.utc),
+        })
+        if len(self._pending_audit_logs) >= _AUDIT_FLUSH_BATCH:
+            self._flush_audit_logs()
+
+    def _flush_audit_logs(self) -> None:
+        """Write buffered runner audit entries in a single insert/commit."""
+        pending = self._pending_audit_logs
+        if not pending or not self.storage:
             return
-        self._last_error_audit_at = now
+        self._pending_audit_logs = []
         try:
-            self.storage.create_audit_log(
-                event_type="error",
-                description=f"Runner poll error: {message}",
-                details={"source": "strategy_runner_poll"},
-            )
+            self.storage.create_audit_logs_bulk(pending)
         except Exception:
-            logger.exception("Failed to persist runner poll error audit log")
+            self.storage.rollback()
+            logger.exception("Failed to persist %d runner audit log(s)", len(pending))
     
+    def _tracked_symbols(self) -> frozenset:
+        """
+        Return the cached union of symbols across all loaded strategies.
+
+        The cache is keyed on the strategies dict, which load/unload/clear
+        replace on every change. Strategy symbol lists are treated as fixed
+        once loaded; changing them requires reloading the strategy.
+        """
+        strategies = self.strategies
+        symbols = self._symbols_cache
+        if symbols is None or strategies is not self._symbols_source:
+            symbols = frozenset().union(*(strategy.get_symbols() for strategy in strategies.values()))
+            self._symbols_cache = symbols
+            self._symbols_source = strategies
+        return symbols
+
     def _fetch_market_data(self) -> Dict[str, Dict[str, Any]]:
         """
         Fetch current market data for all tracked symbols.
         
+        The returned dict is reused and updated in place on every call, so
+        callers must treat it as a read-only snapshot for the current tick.
+        
         Returns:
             Dictionary mapping symbols to market data
         """
-        # Collect all symbols from all strategies
-        symbols = set()
-        for strategy in self.strategies.values():
-            symbols.update(strategy.get_symbols())
-        
-        # Fetch data from broker
-        market_data = {}
+        market_data = self._market_data
+        symbols = self._tracked_symbols()
+        if not symbols:
+            market_data.clear()
+            return market_data
+
+        # Serve quotes fetched within the TTL (e.g. resume warm-up, fast stream wakeups).
+        now = time.monotonic()
+        ttl = min(float(self.tick_interval) / 2.0, 1.0)
+        md_cache = self._md_cache
+        md_failures = self._md_failures
+        refreshed = 0
+        missing = []
         for symbol in symbols:
+            cached = md_cache.get(symbol)
+            if cached is not None and now - cached[0] < ttl:
+                market_data[symbol] = cached[1]
+                refreshed += 1
+                continue
+            failure = md_failures.get(symbol)
+            if failure is not None and now < failure[0]:
+                # Back off persistently failing symbols instead of re-raising/logging every tick.
+                market_data.pop(symbol, None)
+                continue
+            missing.append(symbol)
+        self._md_hits += refreshed
+
+        if missing:
+            self._md_misses += len(missing)
+            fetched = self._fetch_broker_market_data(missing)
+            fetched_at = time.monotonic()
+            for symbol in missing:
+                data = fetched.get(symbol)
+                if data is None:
+                    # Never hand strategies a quote left over from an earlier tick.
+                    market_data.pop(symbol, None)
+                    failure = md_failures.get(symbol)
+                    failures = failure[1] + 1 if failure is not None else 1
+                    backoff = 0.0
+                    if failures >= _MARKET_DATA_FAILURES_BEFORE_BACKOFF:
+                        backoff = min(
+                            float(self.tick_interval) * 2 ** (failures - _MARKET_DATA_FAILURES_BEFORE_BACKOFF),
+                            _MARKET_DATA_FAILURE_BACKOFF_MAX,
+                        )
+                    md_failures[symbol] = (fetched_at + backoff, failures)
+                    continue
+                md_failures.pop(symbol, None)
+                md_cache[symbol] = (fetched_at, data)
+                market_data[symbol] = data
+                refreshed += 1
+
+        if len(market_data) != refreshed:
+            # Drop symbols whose strategies were unloaded since the last tick.
+            for symbol in [symbol for symbol in market_data if symbol not in symbols]:
+                del market_data[symbol]
+        return market_data
+
+    def _fetch_broker_market_data(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch market data for symbols from the broker, batched or concurrently when possible."""
+        market_data: Dict[str, Dict[str, Any]] = {}
+        # Prefer a single batched quote request when the broker supports it.
+        fetch_multi = getattr(self.broker, "get_market_data_multi", None)
+        if callable(fetch_multi) and len(symbols) > 1:
+            try:
+                batch = fetch_multi(sorted(symbols)) or {}
+                for symbol in symbols:
+                    data = batch.get(symbol) or batch.get(symbol.upper())
+                    if data is not None:
+                        market_data[symbol] = data
+            except Exception as e:
+                logger.warning("Batched market-data fetch failed, falling back per symbol: %s", e)
+        pending = [symbol for symbol in symbols if symbol not in market_data]
+
+        # Overlap the remaining per-symbol broker round-trips on the I/O pool.
+        pool = self._io_pool
+        if pool is not None and len(pending) > 1:
+            futures = {pool.submit(self.broker.get_market_data, symbol): symbol for symbol in pending}
+            # Bound the wait so one hung quote request cannot stall the whole tick.
+            deadline = max(1.0, float(self.tick_interval) * 0.8)
+            try:
+                for future in as_completed(futures, timeout=deadline):
+                    symbol = futures[future]
+                    try:
+                        market_data[symbol] = future.result()
+                    except Exception as e:
+                        logger.warning("Error fetching data for %s: %s", symbol, e)
+            except FuturesTimeoutError:
+                late = sorted(symbol for future, symbol in futures.items() if not future.done())
+                for future in futures:
+                    future.cancel()
+                logger.warning("Market-data fetch timed out after %.1fs for %s", deadline, late)
+            return market_data
+
+        for symbol in pending:
             try:
                 data = self.broker.get_market_data(symbol)
                 market_data[symbol] = data
             except Exception as e:
-                print(f"[StrategyRunner] Error fetching data for {symbol}: {e}")
+                logger.warning("Error fetching data for %s: %s", symbol, e)
         
         return market_data
 
-    def _record_portfolio_snapshot(self) -> None:
-        """Persist a point-in-time portfolio snapshot."""
+    def _record_portfolio_snapshot(self, now_utc: Optional[datetime] = None) -> None:
+        """
+        Persist a point-in-time portfolio snapshot.
+        
+        Args:
+            now_utc: Snapshot time; the scheduler passes its per-tick clock reading
+        """
         if not self.storage:
             return
 
-        account = self.broker.get_account_info()
+        # Account and positions are independent broker round-trips; overlap them.
+        pool = self._io_pool
+        if pool is not None:
+            positions_future = pool.submit(self.broker.get_positions)
+            account = self.broker.get_account_info()
+            positions = positions_future.result()
+        else:
+            account = self.broker.get_account_info()
+            positions = self.broker.get_positions()
         equity = self._safe_float(account.get("equity", account.get("portfolio_value", 0.0)))
         cash = self._safe_float(account.get("cash", 0.0))
         buying_power = self._safe_float(account.get("buying_power", 0.0))
 
-        positions = self.broker.get_positions()
         market_value = 0.0
         unrealized_pnl = 0.0
         for row in positions:
@@ -920,11 +1438,11 @@ class StrategyRunner:
             row_cost = qty * avg_entry_price
             unrealized_pnl += row_market_value - row_cost
 
-        trades = self.storage.get_all_trades(limit=5000)
-        realized_pnl_total = sum(self._safe_float(getattr(t, "realized_pnl", 0.0), 0.0) for t in trades)
+        realized_pnl_total = self._safe_float(self.storage.get_realized_pnl_total(), 0.0)
 
         latest = self.storage.get_latest_portfolio_snapshot()
-        now_utc = datetime.now(timezone.utc)
+        if now_utc is None:
+            now_utc = datetime.now(timezone.utc)
         if latest is not None:
             latest_ts = latest.timestamp
             latest_aware = (
@@ -940,7 +1458,7 @@ class StrategyRunner:
             latest_realized = self._safe_float(getattr(latest, "realized_pnl_total", 0.0), 0.0)
             latest_open_positions = int(getattr(latest, "open_positions", 0) or 0)
             try:
-                market_open = bool(self.broker.is_market_open())
+                market_open = self._cached_market_open()
             except Exception:
                 market_open = True
 
@@ -1005,154 +1523,183 @@ class StrategyRunner:
         """
         Execute trading signals through paper broker.
         
+        Signals are normalized up front without any I/O, then submitted as one
+        batch; paper fills recorded directly in storage commit one per signal.
+        
         Args:
             strategy: Strategy that generated signals
             signals: List of signal dictionaries
         """
+        order_execution_service = self.order_execution_service
+        storage = self.storage
+        strategy_id = strategy.config.get("strategy_id")
+        # Decided once per batch so disabled INFO logging costs nothing per signal.
+        log_decisions = logger.isEnabledFor(logging.INFO)
+
+        normalized = []
         for signal_data in signals:
             try:
-                symbol = signal_data.get("symbol")
-                signal = signal_data.get("signal")
-                quantity = signal_data.get("quantity", 0)
-                order_type = signal_data.get("order_type", "market")
-                price = signal_data.get("price")
-                reason = signal_data.get("reason", "")
-                logger.info(
-                    "Signal decision: strategy=%s symbol=%s signal=%s qty=%s order_type=%s reason=%s",
-                    strategy.name,
-                    symbol,
-                    getattr(signal, "value", signal),
-                    quantity,
-                    order_type,
-                    reason,
-                )
+                try:
+                    symbol, signal, quantity, order_type, price, reason = _signal_fields(signal_data)
+                except KeyError:
+                    # Only signals that omit optional keys pay for the merged copy.
+                    symbol, signal, quantity, order_type, price, reason = _signal_fields(
+                        {**_SIGNAL_DEFAULTS, **signal_data}
+                    )
+                if log_decisions:
+                    logger.info(
+                        "Signal decision: strategy=%s symbol=%s signal=%s qty=%s order_type=%s reason=%s",
+                        strategy.name,
+                        symbol,
+                        getattr(signal, "label", signal),
+                        quantity,
+                        order_type,
+                        reason,
+                    )
                 
                 # Convert signal to order side
-                if signal.value in ["buy"]:
-                    side = OrderSide.BUY
-                elif signal.value in ["sell", "close"]:
-                    side = OrderSide.SELL
-                else:
+                side = _SIGNAL_ORDER_SIDES.get(signal)
+                if side is None:
                     continue  # HOLD or unknown signal
                 
                 # Convert order type
-                if order_type == "limit":
-                    otype = OrderType.LIMIT
-                elif order_type == "stop":
-                    otype = OrderType.STOP
-                else:
-                    otype = OrderType.MARKET
-                
-                # Submit order through broker
-                if self.order_execution_service:
-                    strategy_id = strategy.config.get("strategy_id")
-                    submitted = self.order_execution_service.submit_order(
-                        symbol=symbol,
-                        side=side.value,
-                        order_type=otype.value,
-                        quantity=quantity,
-                        price=price,
-                        strategy_id=strategy_id,
-                    )
-                    order = {
-                        "id": submitted.external_id or str(submitted.id),
-                        "status": submitted.status.value,
-                        "symbol": submitted.symbol,
-                        "filled_quantity": submitted.filled_quantity,
-                        "avg_fill_price": submitted.avg_fill_price,
-                    }
-                else:
-                    order = self.broker.submit_order(
+                otype = _ORDER_TYPES.get(order_type, OrderType.MARKET)
+
+                normalized.append((signal_data, symbol, signal, side, otype, quantity, price))
+            except Exception as e:
+                logger.warning("Error executing signal: %s", e)
+        if not normalized:
+            return
+
+        # Submit all orders for this strategy in one batch
+        results: List[Any] = []
+        if order_execution_service:
+            submitted_batch = order_execution_service.submit_orders_bulk([
+                {
+                    "symbol": symbol,
+                    "side": side.value,
+                    "order_type": otype.value,
+                    "quantity": quantity,
+                    "price": price,
+                    "strategy_id": strategy_id,
+                }
+                for _, symbol, _, side, otype, quantity, price in normalized
+            ])
+            for submitted in submitted_batch:
+                if isinstance(submitted, Exception):
+                    results.append(submitted)
+                    continue
+                results.append({
+                    "id": submitted.external_id or str(submitted.id),
+                    "status": submitted.status.value,
+                    "symbol": submitted.symbol,
+                    "filled_quantity": submitted.filled_quantity,
+                    "avg_fill_price": submitted.avg_fill_price,
+                })
+        else:
+            for _, symbol, _, side, otype, quantity, price in normalized:
+                try:
+                    results.append(self.broker.submit_order(
                         symbol=symbol,
                         side=side,
                         order_type=otype,
                         quantity=quantity,
                         price=price
-                    )
-                
-                print(f"[StrategyRunner] Executed {signal.value} order for {symbol}: {order}")
+                    ))
+                except Exception as e:
+                    results.append(e)
+
+        executed = []
+        for (signal_data, symbol, signal, side, otype, quantity, price), order in zip(normalized, results):
+            if isinstance(order, Exception):
+                logger.warning("Error executing signal for %s: %s", symbol, order)
+                continue
+            if log_decisions:
                 logger.info(
                     "Order result: strategy=%s symbol=%s signal=%s broker_order_id=%s status=%s filled_qty=%s avg_fill_price=%s",
                     strategy.name,
                     symbol,
-                    signal.value,
+                    signal.label,
                     order.get("id"),
                     order.get("status"),
                     order.get("filled_quantity"),
                     order.get("avg_fill_price"),
                 )
-                
-                # Record in storage if available and execution service is not used.
-                if self.storage and not self.order_execution_service:
-                    try:
-                        fill_price = price or order.get("avg_fill_price") or order.get("price") or 100.0
-                        db_order = self.storage.create_order(
-                            symbol=symbol,
-                            side=side.value,
-                            order_type=otype.value,
-                            quantity=quantity,
-                            price=price
-                        )
-                        
-                        # For paper trading, immediately fill the order
-                        self.storage.update_order_status(
-                            order_id=db_order.id,
-                            status="filled",
-                            filled_quantity=quantity,
-                            avg_fill_price=fill_price
-                        )
-                        
-                        # Record trade
-                        self.storage.record_trade(
-                            order_id=db_order.id,
-                            symbol=symbol,
-                            side=side.value,
-                            quantity=quantity,
-                            price=fill_price,
-                            strategy_id=strategy.config.get("strategy_id"),
-                        )
-                        
-                        print(f"[StrategyRunner] Recorded order and trade in storage")
-                    except Exception as e:
-                        print(f"[StrategyRunner] Error recording in storage: {e}")
-                
-                # Call callback if set
-                if self.on_signal_callback:
+            executed.append((signal_data, symbol, side, otype, quantity, price, order))
+
+        # Record in storage if available and execution service is not used.
+        # Each fill commits on its own so one bad record cannot drop the rows
+        # of orders that were already submitted and filled at the broker.
+        if storage and not order_execution_service and executed:
+            for _, symbol, side, otype, quantity, price, order in executed:
+                fill_price = price or order.get("avg_fill_price") or order.get("price") or 100.0
+                try:
+                    storage.record_filled_trade(
+                        symbol=symbol,
+                        side=side.value,
+                        order_type=otype.value,
+                        quantity=quantity,
+                        price=price,
+                        fill_price=fill_price,
+                        strategy_id=strategy_id,
+                    )
+                except Exception as e:
+                    logger.warning("Error recording %s in storage: %s", symbol, e)
+
+        # Call callback if set
+        if self.on_signal_callback:
+            for signal_data, _, _, _, _, _, order in executed:
+                try:
                     self.on_signal_callback(strategy, signal_data, order)
-            
-            except Exception as e:
-                print(f"[StrategyRunner] Error executing signal: {e}")
+                except Exception as e:
+                    logger.warning("Signal callback failed for %s: %s", strategy.name, e)
     
     def get_status(self) -> Dict[str, Any]:
         """
         Get runner status.
         
+        Strategy states are reused for a short TTL so frequent status polling
+        does not walk every strategy each time; counters are always fresh.
+        
         Returns:
             Status dictionary
         """
         return {
             "status": self.status.value,
-            "strategies": [s.get_state() for s in self.strategies.values()],
+            "strategies": self._strategy_states(),
             "tick_interval": self.tick_interval,
             "broker_connected": self.broker.is_connected(),
             "runner_thread_alive": self.is_thread_alive(),
             "poll_success_count": self.poll_success_count,
             "poll_error_count": self.poll_error_count,
             "last_poll_error": self.last_poll_error,
-            "last_poll_at": self.last_poll_at.isoformat() if self.last_poll_at else None,
-            "last_successful_poll_at": self.last_successful_poll_at.isoformat() if self.last_successful_poll_at else None,
-            "last_reconciliation_at": self.last_reconciliation_at.isoformat() if self.last_reconciliation_at else None,
+            "last_poll_at": _iso(self.last_poll_at),
+            "last_successful_poll_at": _iso(self.last_successful_poll_at),
+            "last_reconciliation_at": _iso(self.last_reconciliation_at),
             "last_reconciliation_discrepancies": self.last_reconciliation_discrepancies,
             "sleeping": self.sleeping,
-            "sleep_since": self.sleep_since.isoformat() if self.sleep_since else None,
-            "next_market_open_at": self.next_market_open_at.isoformat() if self.next_market_open_at else None,
-            "last_resume_at": self.last_resume_at.isoformat() if self.last_resume_at else None,
-            "last_catchup_at": self.last_catchup_at.isoformat() if self.last_catchup_at else None,
+            "sleep_since": _iso(self.sleep_since),
+            "next_market_open_at": _iso(self.next_market_open_at),
+            "last_resume_at": _iso(self.last_resume_at),
+            "last_catchup_at": _iso(self.last_catchup_at),
             "resume_count": self.resume_count,
             "market_session_open": self.market_session_open,
-            "last_state_persisted_at": self.last_state_persisted_at.isoformat() if self.last_state_persisted_at else None,
+            "last_state_persisted_at": _iso(self.last_state_persisted_at),
+            "market_data_cache_hits": self._md_hits,
+            "market_data_cache_misses": self._md_misses,
         }
     
+    def _strategy_states(self) -> List[Dict[str, Any]]:
+        """Return loaded strategies' states, cached briefly and per strategies dict."""
+        now = time.monotonic()
+        strategies = self.strategies
+        cached = self._strategy_states_cache
+        if cached is not None and now < cached[0] and cached[1] is strategies:
+            return cached[2]
+        states = [s.get_state() for s in strategies.values()]
+        self._strategy_states_cache = (now + _STRATEGY_STATES_CACHE_TTL, strategies, states)
+        return states
+
     def get_strategies(self) -> List[StrategyInterface]:
         """
         Get list of loaded strategies.
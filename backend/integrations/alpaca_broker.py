@@ -5,10 +5,12 @@ Implements the BrokerInterface for Alpaca Markets API.
 Supports both paper trading and live trading via API credentials.
 """
 
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime, timedelta, timezone
 import logging
 import threading
+import time
 
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import (
@@ -25,10 +27,12 @@ from alpaca.trading.enums import (
     OrderStatus as AlpacaOrderStatus,
     QueryOrderStatus,
 )
+from alpaca.trading.models import Order as AlpacaOrder
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockLatestQuoteRequest, StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 from alpaca.common.exceptions import APIError
+from requests.adapters import HTTPAdapter
 
 from services.broker import BrokerInterface, OrderSide, OrderType, OrderStatus
 
@@ -52,6 +56,132 @@ _STOCK_HINT_TERMS = (
     " plc ", " s.a.", " n.v.", " ag ", " se ", " technologies ",
     " pharmaceuticals ", " holdings inc", " group inc",
 )
+# Newer SDK models expose 'order_type', older ones only 'type'; the field set
+# is fixed by the installed SDK, so resolve the accessor once at import.
+_ORDER_TYPE_ATTR = (
+    "order_type" if "order_type" in getattr(AlpacaOrder, "model_fields", {}) else "type"
+)
+# Status/type translation tables, built once instead of per mapped order.
+_ALPACA_TO_INTERNAL_STATUS = {
+    AlpacaOrderStatus.NEW: OrderStatus.PENDING.value,
+    AlpacaOrderStatus.PENDING_NEW: OrderStatus.PENDING.value,
+    AlpacaOrderStatus.ACCEPTED: OrderStatus.SUBMITTED.value,
+    AlpacaOrderStatus.PENDING_CANCEL: OrderStatus.SUBMITTED.value,
+    AlpacaOrderStatus.PENDING_REPLACE: OrderStatus.SUBMITTED.value,
+    AlpacaOrderStatus.PARTIALLY_FILLED: OrderStatus.PARTIALLY_FILLED.value,
+    AlpacaOrderStatus.FILLED: OrderStatus.FILLED.value,
+    AlpacaOrderStatus.DONE_FOR_DAY: OrderStatus.FILLED.value,
+    AlpacaOrderStatus.CANCELED: OrderStatus.CANCELLED.value,
+    AlpacaOrderStatus.EXPIRED: OrderStatus.CANCELLED.value,
+    AlpacaOrderStatus.REPLACED: OrderStatus.CANCELLED.value,
+    AlpacaOrderStatus.REJECTED: OrderStatus.REJECTED.value,
+    AlpacaOrderStatus.SUSPENDED: OrderStatus.REJECTED.value,
+}
+_INTERNAL_TO_ALPACA_QUERY_STATUS = {
+    OrderStatus.PENDING: QueryOrderStatus.OPEN,
+    OrderStatus.SUBMITTED: QueryOrderStatus.OPEN,
+    OrderStatus.PARTIALLY_FILLED: QueryOrderStatus.OPEN,
+    OrderStatus.FILLED: QueryOrderStatus.CLOSED,
+    OrderStatus.CANCELLED: QueryOrderStatus.CLOSED,
+    OrderStatus.REJECTED: QueryOrderStatus.CLOSED,
+}
+_ORDER_SIDE_TO_ALPACA = {
+    OrderSide.BUY: AlpacaOrderSide.BUY,
+    OrderSide.SELL: AlpacaOrderSide.SELL,
+}
+_ALPACA_TO_INTERNAL_ORDER_TYPE = {
+    AlpacaOrderType.MARKET.value: OrderType.MARKET.value,
+    AlpacaOrderType.LIMIT.value: OrderType.LIMIT.value,
+    AlpacaOrderType.STOP.value: OrderType.STOP.value,
+    AlpacaOrderType.STOP_LIMIT.value: OrderType.STOP_LIMIT.value,
+}
+# Dashboard pollers hit account/positions far more often than they change;
+# keep the last REST snapshot briefly and drop it on any order activity.
+_ACCOUNT_CACHE_TTL_SECONDS = 1.0
+_POSITIONS_CACHE_TTL_SECONDS = 2.0
+# The runner's market-data pool and strategy chart pools can each run 8
+# requests concurrently; size the keep-alive pool so none of them has to open
+# (and TLS-handshake) a throwaway connection. Retries stay with the SDK, which
+# already backs off on 429s; transport retries could double-submit orders.
+_HTTP_POOL_CONNECTIONS = 4
+_HTTP_POOL_MAXSIZE = 16
+# Terminal orders seen on the trade-update stream, newest last; bounded so a
+# long session does not retain every historical order. Only terminal states
+# are kept: the stream can reconnect internally and miss events, so a cached
+# open state could go stale, whereas a terminal one never changes.
+_STREAMED_ORDER_CACHE_MAX = 2048
+_TERMINAL_ORDER_STATUSES = frozenset({
+    OrderStatus.FILLED.value,
+    OrderStatus.CANCELLED.value,
+    OrderStatus.REJECTED.value,
+})
+
+
+def _require_price(price: Optional[float], order_type: OrderType) -> float:
+    if price is None:
+        raise ValueError(f"Price required for {order_type.value} orders")
+    return price
+
+
+def _build_market_order(
+    symbol: str, quantity: float, side: AlpacaOrderSide, price: Optional[float], extra: Dict[str, Any]
+) -> MarketOrderRequest:
+    return MarketOrderRequest(
+        symbol=symbol,
+        qty=round(quantity, 9),
+        side=side,
+        time_in_force=TimeInForce.DAY,
+        **extra,
+    )
+
+
+def _build_limit_order(
+    symbol: str, quantity: float, side: AlpacaOrderSide, price: Optional[float], extra: Dict[str, Any]
+) -> LimitOrderRequest:
+    return LimitOrderRequest(
+        symbol=symbol,
+        qty=quantity,
+        side=side,
+        time_in_force=TimeInForce.DAY,
+        limit_price=_require_price(price, OrderType.LIMIT),
+        **extra,
+    )
+
+
+def _build_stop_order(
+    symbol: str, quantity: float, side: AlpacaOrderSide, price: Optional[float], extra: Dict[str, Any]
+) -> StopOrderRequest:
+    return StopOrderRequest(
+        symbol=symbol,
+        qty=quantity,
+        side=side,
+        time_in_force=TimeInForce.DAY,
+        stop_price=_require_price(price, OrderType.STOP),
+        **extra,
+    )
+
+
+def _build_stop_limit_order(
+    symbol: str, quantity: float, side: AlpacaOrderSide, price: Optional[float], extra: Dict[str, Any]
+) -> StopLimitOrderRequest:
+    trigger = _require_price(price, OrderType.STOP_LIMIT)
+    return StopLimitOrderRequest(
+        symbol=symbol,
+        qty=quantity,
+        side=side,
+        time_in_force=TimeInForce.DAY,
+        stop_price=trigger,
+        limit_price=trigger,
+        **extra,
+    )
+
+
+_ORDER_REQUEST_BUILDERS: Dict[OrderType, Callable[..., Any]] = {
+    OrderType.MARKET: _build_market_order,
+    OrderType.LIMIT: _build_limit_order,
+    OrderType.STOP: _build_stop_order,
+    OrderType.STOP_LIMIT: _build_stop_limit_order,
+}
 
 
 class AlpacaBroker(BrokerInterface):
@@ -99,6 +229,12 @@ class AlpacaBroker(BrokerInterface):
         self._asset_capabilities_cache: Dict[str, Dict[str, Any]] = {}
         self._asset_capabilities_ttl = timedelta(minutes=15)
         self._last_connect_error: Optional[str] = None
+        self._account_cache: Optional[Dict[str, Any]] = None
+        self._account_cache_ts = 0.0
+        self._positions_cache: Optional[List[Dict[str, Any]]] = None
+        self._positions_cache_ts = 0.0
+        self._streamed_orders: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._streamed_orders_lock = threading.Lock()
     
     def connect(self) -> bool:
         """
@@ -109,6 +245,7 @@ class AlpacaBroker(BrokerInterface):
         """
         try:
             self._last_connect_error = None
+            self._invalidate_account_cache()
             # Initialize trading client
             self._trading_client = TradingClient(
                 api_key=self.api_key,
@@ -121,6 +258,8 @@ class AlpacaBroker(BrokerInterface):
                 api_key=self.api_key,
                 secret_key=self.secret_key
             )
+            self._configure_http_pool(self._trading_client)
+            self._configure_http_pool(self._data_client)
             
             # Test connection by fetching account
             account = self._trading_client.get_account()
@@ -136,6 +275,18 @@ class AlpacaBroker(BrokerInterface):
             self._connected = False
             return False
     
+    @staticmethod
+    def _configure_http_pool(client: Any) -> None:
+        """Widen the keep-alive pool of an SDK client's requests session."""
+        session = getattr(client, "_session", None)
+        if session is None or not callable(getattr(session, "mount", None)):
+            return
+        adapter = HTTPAdapter(
+            pool_connections=_HTTP_POOL_CONNECTIONS,
+            pool_maxsize=_HTTP_POOL_MAXSIZE,
+        )
+        session.mount("https://", adapter)
+
     def disconnect(self) -> bool:
         """
         Disconnect from Alpaca API.
@@ -149,6 +300,8 @@ class AlpacaBroker(BrokerInterface):
         self._trading_client = None
         self._data_client = None
         self._asset_capabilities_cache = {}
+        self._invalidate_account_cache()
+        self._clear_streamed_orders()
         with self._live_quote_cache_lock:
             self._live_quote_cache.clear()
         logger.info("Disconnected from Alpaca")
@@ -166,20 +319,33 @@ class AlpacaBroker(BrokerInterface):
     def get_last_connection_error(self) -> Optional[str]:
         """Return the most recent Alpaca connection error if one occurred."""
         return self._last_connect_error
+
+    def _invalidate_account_cache(self) -> None:
+        """Drop cached account/positions snapshots after order activity."""
+        self._account_cache = None
+        self._positions_cache = None
     
     def get_account_info(self) -> Dict[str, Any]:
         """
         Get Alpaca account information.
+
+        Results are reused for ``_ACCOUNT_CACHE_TTL_SECONDS`` so concurrent
+        pollers share one REST round-trip.
         
         Returns:
             Account info dict with balance, buying power, etc.
         """
         if not self.is_connected():
             raise RuntimeError("Not connected to Alpaca")
+
+        now = time.monotonic()
+        cached = self._account_cache
+        if cached is not None and now - self._account_cache_ts < _ACCOUNT_CACHE_TTL_SECONDS:
+            return dict(cached)
         
         account = self._trading_client.get_account()
         
-        return {
+        info = {
             "account_number": account.account_number,
             "status": account.status,
             "currency": account.currency,
@@ -192,6 +358,9 @@ class AlpacaBroker(BrokerInterface):
             "transfers_blocked": account.transfers_blocked,
             "account_blocked": account.account_blocked,
         }
+        self._account_cache = info
+        self._account_cache_ts = now
+        return dict(info)
 
     def is_market_open(self) -> bool:
         """Return Alpaca clock market-open state when available."""
@@ -300,16 +469,53 @@ class AlpacaBroker(BrokerInterface):
             return None
         except (RuntimeError, APIError, OSError):
             return None
+
+    def get_market_clock(self) -> Dict[str, Any]:
+        """Return open state and next open/close from one Alpaca clock call."""
+        closed = {"is_open": False, "next_open": None, "next_close": None}
+        if not self.is_connected():
+            return closed
+        try:
+            clock = self._trading_client.get_clock()
+        except (RuntimeError, APIError, OSError):
+            return closed
+        next_open = getattr(clock, "next_open", None)
+        next_close = getattr(clock, "next_close", None)
+        return {
+            "is_open": bool(getattr(clock, "is_open", False)),
+            "next_open": next_open if isinstance(next_open, datetime) else None,
+            "next_close": next_close if isinstance(next_close, datetime) else None,
+        }
+
+    def get_next_market_close(self) -> Optional[datetime]:
+        """Return next market-close timestamp from Alpaca clock when available."""
+        if not self.is_connected():
+            return None
+        try:
+            clock = self._trading_client.get_clock()
+            next_close = getattr(clock, "next_close", None)
+            if isinstance(next_close, datetime):
+                return next_close
+            return None
+        except (RuntimeError, APIError, OSError):
+            return None
     
     def get_positions(self) -> List[Dict[str, Any]]:
         """
         Get current positions from Alpaca.
+
+        Results are reused for ``_POSITIONS_CACHE_TTL_SECONDS``.
         
         Returns:
             List of position dicts
         """
         if not self.is_connected():
             raise RuntimeError("Not connected to Alpaca")
+
+        now = time.monotonic()
+        cached = self._positions_cache
+        if cached is not None and now - self._positions_cache_ts < _POSITIONS_CACHE_TTL_SECONDS:
+            return [dict(row) for row in cached]
         
         positions = self._trading_client.get_all_positions()
         
@@ -317,10 +523,11 @@ class AlpacaBroker(BrokerInterface):
         for pos in positions:
             symbol = str(pos.symbol).upper()
             asset_meta = self._get_asset_capabilities(symbol)
+            quantity = float(pos.qty)
             result.append({
                 "symbol": symbol,
-                "quantity": float(pos.qty),
-                "side": "long" if float(pos.qty) > 0 else "short",
+                "quantity": quantity,
+                "side": "long" if quantity > 0 else "short",
                 "avg_entry_price": float(pos.avg_entry_price),
                 "current_price": float(pos.current_price),
                 "market_value": float(pos.market_value),
@@ -329,8 +536,10 @@ class AlpacaBroker(BrokerInterface):
                 "unrealized_pnl_percent": float(pos.unrealized_plpc) * 100,
                 "asset_type": self._resolve_asset_type(symbol, asset_meta),
             })
-        
-        return result
+
+        self._positions_cache = result
+        self._positions_cache_ts = now
+        return [dict(row) for row in result]
     
     def submit_order(
         self,
@@ -358,70 +567,20 @@ class AlpacaBroker(BrokerInterface):
         if not self.is_connected():
             raise RuntimeError("Not connected to Alpaca")
 
-        # Map our OrderSide to Alpaca's OrderSide
-        alpaca_side = AlpacaOrderSide.BUY if side == OrderSide.BUY else AlpacaOrderSide.SELL
+        alpaca_side = _ORDER_SIDE_TO_ALPACA.get(side, AlpacaOrderSide.SELL)
 
         # Common kwargs for idempotency
         common_kwargs: Dict[str, Any] = {}
         if client_order_id:
             common_kwargs["client_order_id"] = client_order_id
 
-        # Submit order based on type
-        if order_type == OrderType.MARKET:
-            order_data = MarketOrderRequest(
-                symbol=symbol,
-                qty=round(quantity, 9),
-                side=alpaca_side,
-                time_in_force=TimeInForce.DAY,
-                **common_kwargs,
-            )
-            order = self._trading_client.submit_order(order_data)
-
-        elif order_type == OrderType.LIMIT:
-            if price is None:
-                raise ValueError("Price required for limit orders")
-
-            order_data = LimitOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=alpaca_side,
-                time_in_force=TimeInForce.DAY,
-                limit_price=price,
-                **common_kwargs,
-            )
-            order = self._trading_client.submit_order(order_data)
-
-        elif order_type == OrderType.STOP:
-            if price is None:
-                raise ValueError("Price required for stop orders")
-
-            order_data = StopOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=alpaca_side,
-                time_in_force=TimeInForce.DAY,
-                stop_price=price,
-                **common_kwargs,
-            )
-            order = self._trading_client.submit_order(order_data)
-
-        elif order_type == OrderType.STOP_LIMIT:
-            if price is None:
-                raise ValueError("Price required for stop_limit orders")
-            order_data = StopLimitOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=alpaca_side,
-                time_in_force=TimeInForce.DAY,
-                stop_price=price,
-                limit_price=price,
-                **common_kwargs,
-            )
-            order = self._trading_client.submit_order(order_data)
-
-        else:
+        builder = _ORDER_REQUEST_BUILDERS.get(order_type)
+        if builder is None:
             raise ValueError(f"Unsupported order type: {order_type}")
+        order_data = builder(symbol, quantity, alpaca_side, price, common_kwargs)
+        order = self._trading_client.submit_order(order_data)
 
+        self._invalidate_account_cache()
         return self._map_alpaca_order(order)
     
     def cancel_order(self, order_id: str) -> bool:
@@ -439,6 +598,9 @@ class AlpacaBroker(BrokerInterface):
         
         try:
             self._trading_client.cancel_order_by_id(order_id)
+            self._invalidate_account_cache()
+            with self._streamed_orders_lock:
+                self._streamed_orders.pop(str(order_id), None)
             logger.info(f"Cancelled order {order_id}")
             return True
         except Exception as e:
@@ -451,6 +613,8 @@ class AlpacaBroker(BrokerInterface):
             raise RuntimeError("Not connected to Alpaca")
         try:
             cancel_responses = self._trading_client.cancel_orders()
+            self._invalidate_account_cache()
+            self._clear_streamed_orders()
             count = len(cancel_responses) if cancel_responses else 0
             logger.info("Cancelled all open orders (%d)", count)
             return count
@@ -458,18 +622,29 @@ class AlpacaBroker(BrokerInterface):
             logger.error("Failed to cancel all orders: %s", e)
             return 0
 
-    def get_order(self, order_id: str) -> Dict[str, Any]:
+    def get_order(self, order_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get order details.
+
+        While the trade-update stream is running, orders it has reported as
+        terminal are served from memory; otherwise (or on a miss) Alpaca is
+        queried.
         
         Args:
             order_id: Alpaca order ID
+            use_cache: Allow answering from streamed terminal orders
             
         Returns:
             Order details dict
         """
         if not self.is_connected():
             raise RuntimeError("Not connected to Alpaca")
+
+        if use_cache and self._trade_stream_running:
+            with self._streamed_orders_lock:
+                cached = self._streamed_orders.get(str(order_id))
+            if cached is not None:
+                return dict(cached)
         
         order = self._trading_client.get_order_by_id(order_id)
         return self._map_alpaca_order(order)
@@ -803,18 +978,17 @@ class AlpacaBroker(BrokerInterface):
         bar_data = bars.data if hasattr(bars, "data") else bars
         symbol_bars = bar_data.get(symbol, []) if isinstance(bar_data, dict) else []
 
-        result = []
-        for bar in symbol_bars:
-            result.append({
+        return [
+            {
                 "timestamp": bar.timestamp,
                 "open": float(bar.open),
                 "high": float(bar.high),
                 "low": float(bar.low),
                 "close": float(bar.close),
                 "volume": int(bar.volume),
-            })
-
-        return result
+            }
+            for bar in symbol_bars
+        ]
 
     def start_trade_update_stream(self, on_update: Callable[[Dict[str, Any]], None]) -> bool:
         """
@@ -840,15 +1014,30 @@ class AlpacaBroker(BrokerInterface):
 
             async def _handler(data: Any) -> None:
                 try:
-                    payload = {
-                        "event": str(getattr(data, "event", "")),
-                        "order_id": str(getattr(data, "order_id", "")),
-                        "symbol": str(getattr(data, "symbol", "")),
-                        "status": str(getattr(data, "order_status", "")),
-                    }
+                    # TradeUpdate nests the order; keep flat attributes as a
+                    # fallback for payloads that carry them directly.
+                    order = getattr(data, "order", None)
+                    mapped = self._map_alpaca_order(order) if order is not None else None
+                    if mapped is not None:
+                        self._remember_streamed_order(mapped)
+                        payload = {
+                            "event": str(getattr(data, "event", "")),
+                            "order_id": mapped["id"],
+                            "symbol": str(mapped["symbol"] or ""),
+                            "status": mapped["status"],
+                        }
+                    else:
+                        payload = {
+                            "event": str(getattr(data, "event", "")),
+                            "order_id": str(getattr(data, "order_id", "")),
+                            "symbol": str(getattr(data, "symbol", "")),
+                            "status": str(getattr(data, "order_status", "")),
+                        }
+                    # Fills move cash and positions; don't serve stale snapshots.
+                    self._invalidate_account_cache()
                     if self._trade_update_callback:
                         self._trade_update_callback(payload)
-                except (RuntimeError, ValueError, TypeError) as callback_exc:
+                except (RuntimeError, ValueError, TypeError, AttributeError) as callback_exc:
                     logger.warning(f"Trade update callback error: {callback_exc}")
 
             try:
@@ -860,6 +1049,7 @@ class AlpacaBroker(BrokerInterface):
             finally:
                 self._trade_stream_running = False
                 self._trade_stream = None
+                self._clear_streamed_orders()
 
         self._trade_stream_thread = threading.Thread(target=_run_stream, daemon=True)
         self._trade_stream_thread.start()
@@ -954,9 +1144,29 @@ class AlpacaBroker(BrokerInterface):
             logger.warning(f"Failed to stop market data stream cleanly: {exc}")
             return False
 
+    def is_trade_update_stream_active(self) -> bool:
+        """Whether the Alpaca trade update websocket stream is running."""
+        return bool(self._trade_stream_running)
+
+    def _remember_streamed_order(self, mapped: Dict[str, Any]) -> None:
+        """Record a streamed order for get_order once it reaches a terminal state."""
+        order_id = mapped.get("id")
+        if not order_id or mapped.get("status") not in _TERMINAL_ORDER_STATUSES:
+            return
+        with self._streamed_orders_lock:
+            self._streamed_orders[order_id] = mapped
+            self._streamed_orders.move_to_end(order_id)
+            while len(self._streamed_orders) > _STREAMED_ORDER_CACHE_MAX:
+                self._streamed_orders.popitem(last=False)
+
+    def _clear_streamed_orders(self) -> None:
+        with self._streamed_orders_lock:
+            self._streamed_orders.clear()
+
     def stop_trade_update_stream(self) -> bool:
         """Stop Alpaca trade update websocket stream."""
         self._trade_stream_running = False
+        self._clear_streamed_orders()
         try:
             if self._trade_stream is not None:
                 stop_ws = getattr(self._trade_stream, "stop_ws", None)
@@ -978,15 +1188,10 @@ class AlpacaBroker(BrokerInterface):
         Returns:
             Order dict in our format
             
-        Note: Alpaca API sometimes uses 'order_type' and sometimes 'type' 
-        depending on the endpoint/version. We check for both.
+        Note: Alpaca SDK versions differ between 'order_type' and 'type';
+        the attribute name is resolved once at import (``_ORDER_TYPE_ATTR``).
         """
-        # Handle both 'order_type' (newer) and 'type' (older) attributes
-        if hasattr(order, 'order_type'):
-            raw_order_type = order.order_type
-        else:
-            raw_order_type = order.type
-        order_type_value = self._map_from_alpaca_order_type(raw_order_type)
+        order_type_value = self._map_from_alpaca_order_type(getattr(order, _ORDER_TYPE_ATTR))
 
         limit_price = getattr(order, "limit_price", None)
         stop_price = getattr(order, "stop_price", None)
@@ -1014,13 +1219,8 @@ class AlpacaBroker(BrokerInterface):
     def _map_from_alpaca_order_type(self, alpaca_order_type: Any) -> str:
         """Map Alpaca order type object/value to our normalized order-type string."""
         raw = alpaca_order_type.value if hasattr(alpaca_order_type, "value") else str(alpaca_order_type)
-        mapping = {
-            AlpacaOrderType.MARKET.value: OrderType.MARKET.value,
-            AlpacaOrderType.LIMIT.value: OrderType.LIMIT.value,
-            AlpacaOrderType.STOP.value: OrderType.STOP.value,
-            AlpacaOrderType.STOP_LIMIT.value: OrderType.STOP_LIMIT.value,
-        }
-        return mapping.get(str(raw).lower(), str(raw).lower())
+        normalized = str(raw).lower()
+        return _ALPACA_TO_INTERNAL_ORDER_TYPE.get(normalized, normalized)
 
     @staticmethod
     def _safe_optional_float(value: Any) -> Optional[float]:
@@ -1033,31 +1233,8 @@ class AlpacaBroker(BrokerInterface):
     
     def _map_from_alpaca_status(self, alpaca_status: AlpacaOrderStatus) -> str:
         """Map Alpaca order status to our OrderStatus."""
-        mapping = {
-            AlpacaOrderStatus.NEW: OrderStatus.PENDING.value,
-            AlpacaOrderStatus.PENDING_NEW: OrderStatus.PENDING.value,
-            AlpacaOrderStatus.ACCEPTED: OrderStatus.SUBMITTED.value,
-            AlpacaOrderStatus.PENDING_CANCEL: OrderStatus.SUBMITTED.value,
-            AlpacaOrderStatus.PENDING_REPLACE: OrderStatus.SUBMITTED.value,
-            AlpacaOrderStatus.PARTIALLY_FILLED: OrderStatus.PARTIALLY_FILLED.value,
-            AlpacaOrderStatus.FILLED: OrderStatus.FILLED.value,
-            AlpacaOrderStatus.DONE_FOR_DAY: OrderStatus.FILLED.value,
-            AlpacaOrderStatus.CANCELED: OrderStatus.CANCELLED.value,
-            AlpacaOrderStatus.EXPIRED: OrderStatus.CANCELLED.value,
-            AlpacaOrderStatus.REPLACED: OrderStatus.CANCELLED.value,
-            AlpacaOrderStatus.REJECTED: OrderStatus.REJECTED.value,
-            AlpacaOrderStatus.SUSPENDED: OrderStatus.REJECTED.value,
-        }
-        return mapping.get(alpaca_status, OrderStatus.PENDING.value)
+        return _ALPACA_TO_INTERNAL_STATUS.get(alpaca_status, OrderStatus.PENDING.value)
     
     def _map_to_alpaca_status(self, status: OrderStatus) -> Optional[QueryOrderStatus]:
         """Map our OrderStatus to Alpaca query status (open/closed)."""
-        mapping = {
-            OrderStatus.PENDING: QueryOrderStatus.OPEN,
-            OrderStatus.SUBMITTED: QueryOrderStatus.OPEN,
-            OrderStatus.PARTIALLY_FILLED: QueryOrderStatus.OPEN,
-            OrderStatus.FILLED: QueryOrderStatus.CLOSED,
-            OrderStatus.CANCELLED: QueryOrderStatus.CLOSED,
-            OrderStatus.REJECTED: QueryOrderStatus.CLOSED,
-        }
-        return mapping.get(status)
+        return _INTERNAL_TO_ALPACA_QUERY_STATUS.get(status)
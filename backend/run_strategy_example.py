@@ -77,7 +77,7 @@ def main():
         print(f"\n   📊 Signal executed!")
         print(f"      Strategy: {strategy.get_name()}")
         print(f"      Symbol: {signal_data['symbol']}")
-        print(f"      Action: {signal_data['signal'].value.upper()}")
+        print(f"      Action: {signal_data['signal'].label.upper()}")
         print(f"      Quantity: {signal_data['quantity']}")
         print(f"      Order ID: {order['id']}")
     
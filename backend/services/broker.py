@@ -135,12 +135,14 @@ class BrokerInterface(ABC):
         pass
     
     @abstractmethod
-    def get_order(self, order_id: str) -> Dict[str, Any]:
+    def get_order(self, order_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get order details.
         
         Args:
             order_id: Order ID
+            use_cache: Allow brokers that keep streamed order state to answer
+                from it; pass False to force an authoritative lookup
             
         Returns:
             Order details dict
@@ -198,6 +200,13 @@ class BrokerInterface(ABC):
         """
         return False
 
+    def is_trade_update_stream_active(self) -> bool:
+        """
+        Optional: whether the trade-update stream is currently running.
+        Default False for brokers that do not support streaming.
+        """
+        return False
+
     def is_market_open(self) -> bool:
         """
         Optional: whether regular market session is open.
@@ -235,6 +244,27 @@ class BrokerInterface(ABC):
         """
         return None
 
+    def get_next_market_close(self) -> Optional[datetime]:
+        """
+        Optional: next regular market close time.
+        Default None for brokers that do not expose market clock metadata.
+        """
+        return None
+
+    def get_market_clock(self) -> Dict[str, Any]:
+        """
+        Optional: market-session state from a single lookup.
+        Returns ``is_open`` plus ``next_open``/``next_close`` (datetime or None).
+        The default composes the individual hooks; brokers whose clock is a
+        remote call should override it to answer from one response.
+        """
+        is_open = bool(self.is_market_open())
+        return {
+            "is_open": is_open,
+            "next_open": None if is_open else self.get_next_market_open(),
+            "next_close": self.get_next_market_close() if is_open else None,
+        }
+
     def get_last_connection_error(self) -> Optional[str]:
         """
         Optional: most recent connection failure reason.
@@ -279,6 +309,18 @@ class PaperBroker(BrokerInterface):
         if not self.simulate_market_hours:
             return None
         return self._next_market_open_from(datetime.now(timezone.utc))
+
+    def get_next_market_close(self) -> Optional[datetime]:
+        """Return next US regular session close when market-hours simulation is enabled."""
+        if not self.simulate_market_hours:
+            return None
+        now_utc = datetime.now(timezone.utc)
+        if self._is_market_open_at(now_utc):
+            session_day = now_utc.astimezone(self._market_tz)
+        else:
+            session_day = self._next_market_open_from(now_utc).astimezone(self._market_tz)
+        market_close = session_day.replace(hour=16, minute=0, second=0, microsecond=0)
+        return market_close.astimezone(timezone.utc)
     
     def connect(self) -> bool:
         """Connect to paper broker (always succeeds)."""
@@ -402,8 +444,8 @@ class PaperBroker(BrokerInterface):
             return True
         return False
     
-    def get_order(self, order_id: str) -> Dict[str, Any]:
-        """Get paper order details."""
+    def get_order(self, order_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get paper order details (always authoritative; use_cache is ignored)."""
         order = self.orders.get(order_id)
         if not order:
             return {}
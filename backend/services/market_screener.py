@@ -10,6 +10,7 @@ from datetime import datetime, timedelta, timezone, date as date_type
 import logging
 from enum import Enum
 import math
+import threading
 
 from config.settings import get_settings, has_alpaca_credentials
 
@@ -62,6 +63,8 @@ class MarketScreener:
         self.require_real_data = bool(require_real_data)
         self._cache: Dict[str, Any] = {}
         self._cache_timeout = 300  # 5 minutes
+        # Runner strategies share one screener across worker threads.
+        self._cache_lock = threading.Lock()
         self._data_client = None
         self._trading_client = None
         self._last_source = "fallback"
@@ -184,9 +187,10 @@ class MarketScreener:
         
         # Check cache
         cache_key = f"stocks_{limit}"
-        if self._is_cache_valid(cache_key):
-            self._last_source = self._cache[cache_key].get("source", "fallback")
-            return self._cache[cache_key]["data"]
+        cached = self._get_cached_entry(cache_key)
+        if cached is not None:
+            self._last_source = cached.get("source", "fallback")
+            return cached["data"]
         
         # Fetch from Alpaca data client or use fallback
         if self._data_client:
@@ -207,11 +211,12 @@ class MarketScreener:
         
         # Cache results
         stocks = self._enrich_assets(stocks)
-        self._cache[cache_key] = {
-            "data": stocks,
-            "timestamp": datetime.now(),
-            "source": self._last_source,
-        }
+        with self._cache_lock:
+            self._cache[cache_key] = {
+                "data": stocks,
+                "timestamp": datetime.now(),
+                "source": self._last_source,
+            }
         
         return stocks
     
@@ -229,9 +234,10 @@ class MarketScreener:
         
         # Check cache
         cache_key = f"etfs_{limit}"
-        if self._is_cache_valid(cache_key):
-            self._last_source = self._cache[cache_key].get("source", "fallback")
-            return self._cache[cache_key]["data"]
+        cached = self._get_cached_entry(cache_key)
+        if cached is not None:
+            self._last_source = cached.get("source", "fallback")
+            return cached["data"]
         
         # Fetch from Alpaca data client or use fallback
         if self._data_client:
@@ -252,11 +258,12 @@ class MarketScreener:
         
         # Cache results
         etfs = self._enrich_assets(etfs)
-        self._cache[cache_key] = {
-            "data": etfs,
-            "timestamp": datetime.now(),
-            "source": self._last_source,
-        }
+        with self._cache_lock:
+            self._cache[cache_key] = {
+                "data": etfs,
+                "timestamp": datetime.now(),
+                "source": self._last_source,
+            }
         
         return etfs
     
@@ -1081,10 +1088,62 @@ class MarketScreener:
         dip_buy_threshold_pct: float = 2.0,
     ) -> Dict[str, Any]:
         """Compute minimal high-value chart indicators/monitors."""
-        if not points:
+        normalized_points = self._normalize_indicator_points(points)
+        closes = [point["close"] for point in normalized_points]
+        if len(closes) < 2:
             return {}
+        latest_close = closes[-1]
+        atr_abs = self._atr14(normalized_points)
+        atr_pct = (atr_abs / latest_close * 100.0) if latest_close > 0 else 0.0
+
+        z_window = min(20, len(closes))
+        z_slice = closes[-z_window:]
+        z_mean = sum(z_slice) / len(z_slice)
+        variance = sum((v - z_mean) ** 2 for v in z_slice) / len(z_slice)
+        z_std = variance ** 0.5
+        zscore20 = (latest_close - z_mean) / z_std if z_std > 0 else 0.0
+
+        latest_sma50 = normalized_points[-1].get("sma50")
+        dip_trigger_price = None
+        dip_buy_signal = False
+        if latest_sma50:
+            dip_trigger_price = float(latest_sma50) * (1.0 - (dip_buy_threshold_pct / 100.0))
+            dip_buy_signal = latest_close <= dip_trigger_price and zscore20 <= zscore_entry_threshold
+
+        take_profit_price = latest_close * (1.0 + take_profit_pct / 100.0)
+        trailing_peak = max(closes[-20:]) if len(closes) >= 20 else max(closes)
+        trailing_stop_price = trailing_peak * (1.0 - trailing_stop_pct / 100.0)
+        atr_stop_price = latest_close * (1.0 - (atr_stop_mult * atr_pct / 100.0))
+
+        return {
+            "latest_close": round(latest_close, 4),
+            "atr14": round(atr_abs, 4),
+            "atr14_pct": round(atr_pct, 4),
+            "zscore20": round(zscore20, 4),
+            "take_profit_price": round(take_profit_price, 4),
+            "trailing_stop_price": round(trailing_stop_price, 4),
+            "atr_stop_price": round(atr_stop_price, 4),
+            "dip_trigger_price": round(dip_trigger_price, 4) if dip_trigger_price is not None else None,
+            "dip_buy_signal": dip_buy_signal,
+            "zscore_entry_threshold": zscore_entry_threshold,
+            "dip_buy_threshold_pct": dip_buy_threshold_pct,
+            "trailing_stop_pct": trailing_stop_pct,
+            "take_profit_pct": take_profit_pct,
+            "atr_stop_mult": atr_stop_mult,
+        }
+
+    def get_atr14_pct(self, points: List[Dict[str, Any]]) -> float:
+        """ATR(14) as a percentage of the latest close; 0.0 when not computable."""
+        normalized_points = self._normalize_indicator_points(points)
+        if len(normalized_points) < 2:
+            return 0.0
+        latest_close = normalized_points[-1]["close"]
+        return round(self._atr14(normalized_points) / latest_close * 100.0, 4)
+
+    def _normalize_indicator_points(self, points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep chart points with a finite positive close; drop invalid high/low values."""
         normalized_points = []
-        for point in points:
+        for point in points or []:
             raw_close = point.get("close")
             if raw_close is None:
                 continue
@@ -1118,12 +1177,11 @@ class MarketScreener:
                 "low": low,
                 "sma50": point.get("sma50"),
             })
+        return normalized_points
 
+    def _atr14(self, normalized_points: List[Dict[str, Any]]) -> float:
+        """True ATR(14): mean of max(high-low, |high-prev_close|, |low-prev_close|)."""
         closes = [point["close"] for point in normalized_points]
-        if len(closes) < 2:
-            return {}
-        latest_close = closes[-1]
-        # True ATR(14): TR = max(high-low, |high-prev_close|, |low-prev_close|).
         atr_window = min(14, len(closes) - 1)
         true_ranges = []
         start_idx = len(closes) - atr_window
@@ -1145,56 +1203,22 @@ class MarketScreener:
             )
             if math.isfinite(tr) and tr >= 0:
                 true_ranges.append(tr)
-        atr_abs = (sum(true_ranges) / len(true_ranges)) if true_ranges else 0.0
-        atr_pct = (atr_abs / latest_close * 100.0) if latest_close > 0 else 0.0
-
-        z_window = min(20, len(closes))
-        z_slice = closes[-z_window:]
-        z_mean = sum(z_slice) / len(z_slice)
-        variance = sum((v - z_mean) ** 2 for v in z_slice) / len(z_slice)
-        z_std = variance ** 0.5
-        zscore20 = (latest_close - z_mean) / z_std if z_std > 0 else 0.0
-
-        latest_sma50 = normalized_points[-1].get("sma50")
-        dip_trigger_price = None
-        dip_buy_signal = False
-        if latest_sma50:
-            dip_trigger_price = float(latest_sma50) * (1.0 - (dip_buy_threshold_pct / 100.0))
-            dip_buy_signal = latest_close <= dip_trigger_price and zscore20 <= zscore_entry_threshold
-
-        take_profit_price = latest_close * (1.0 + take_profit_pct / 100.0)
-        trailing_peak = max(closes[-20:]) if len(closes) >= 20 else max(closes)
-        trailing_stop_price = trailing_peak * (1.0 - trailing_stop_pct / 100.0)
-        atr_stop_price = latest_close * (1.0 - (atr_stop_mult * atr_pct / 100.0))
-
-        return {
-            "latest_close": round(latest_close, 4),
-            "atr14": round(atr_abs, 4),
-            "atr14_pct": round(atr_pct, 4),
-            "zscore20": round(zscore20, 4),
-            "take_profit_price": round(take_profit_price, 4),
-            "trailing_stop_price": round(trailing_stop_price, 4),
-            "atr_stop_price": round(atr_stop_price, 4),
-            "dip_trigger_price": round(dip_trigger_price, 4) if dip_trigger_price is not None else None,
-            "dip_buy_signal": dip_buy_signal,
-            "zscore_entry_threshold": zscore_entry_threshold,
-            "dip_buy_threshold_pct": dip_buy_threshold_pct,
-            "trailing_stop_pct": trailing_stop_pct,
-            "take_profit_pct": take_profit_pct,
-            "atr_stop_mult": atr_stop_mult,
-        }
+        return (sum(true_ranges) / len(true_ranges)) if true_ranges else 0.0
 
     def _with_sma(self, points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Attach SMA50 and SMA250 values to chart points."""
-        closes = [p["close"] for p in points]
+        # Prefix sums make each rolling mean O(1) instead of re-summing its window.
+        prefix = [0.0]
+        for p in points:
+            prefix.append(prefix[-1] + p["close"])
         result = []
         for idx, p in enumerate(points):
             sma50 = None
             sma250 = None
             if idx >= 49:
-                sma50 = sum(closes[idx - 49:idx + 1]) / 50.0
+                sma50 = (prefix[idx + 1] - prefix[idx - 49]) / 50.0
             if idx >= 249:
-                sma250 = sum(closes[idx - 249:idx + 1]) / 250.0
+                sma250 = (prefix[idx + 1] - prefix[idx - 249]) / 250.0
             point = {
                 "timestamp": p["timestamp"],
                 "close": p["close"],
@@ -1335,12 +1359,18 @@ class MarketScreener:
         Returns:
             True if cache is valid and not expired
         """
-        if key not in self._cache:
-            return False
-        
-        cache_age = (datetime.now() - self._cache[key]["timestamp"]).total_seconds()
-        return cache_age < self._cache_timeout
+        return self._get_cached_entry(key) is not None
+
+    def _get_cached_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return an unexpired cache entry, read atomically with its expiry check."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is None:
+            return None
+        cache_age = (datetime.now() - entry["timestamp"]).total_seconds()
+        return entry if cache_age < self._cache_timeout else None
     
     def clear_cache(self):
         """Clear all cached data."""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
@@ -5,7 +5,7 @@ Orchestrates the order lifecycle from submission to fill tracking.
 Handles validation, broker integration, and storage persistence.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from datetime import datetime, timedelta, timezone
 import logging
 import threading
@@ -1601,6 +1601,32 @@ class OrderExecutionService:
             logger.error(f"Failed to submit order {order.id}: {e}")
             raise BrokerError(f"Failed to submit order to broker: {e}")
 
+    def submit_orders_bulk(
+        self,
+        orders: List[Dict[str, Any]],
+    ) -> List[Union[Order, Exception]]:
+        """
+        Submit a batch of orders in one call.
+        
+        Each entry holds ``submit_order`` keyword arguments. Orders are still
+        validated in sequence so exposure/budget checks see earlier fills in the
+        same batch, and one failure does not abort the rest.
+        
+        Args:
+            orders: List of order keyword-argument dicts
+            
+        Returns:
+            One entry per input order: the created Order, or the exception
+            raised while submitting it
+        """
+        results: List[Union[Order, Exception]] = []
+        for order_kwargs in orders:
+            try:
+                results.append(self.submit_order(**order_kwargs))
+            except Exception as e:
+                results.append(e)
+        return results
+
     def maybe_execute_weekly_dca(
         self,
         *,
@@ -1763,12 +1789,54 @@ class OrderExecutionService:
             self._recent_order_timestamps.append(now)
             return True
     
-    def update_order_status(self, order: Order) -> Order:
+    def update_order_statuses_bulk(self, orders: List[Order], use_cache: bool = True) -> List[Order]:
+        """
+        Update the status of several orders from one broker order listing.
+        
+        Orders the listing does not include (e.g. ones that left the broker's
+        open set since the last pass) fall back to a per-order lookup.
+        
+        Args:
+            orders: Orders to update
+            use_cache: Allow per-order lookups to use broker-side streamed state
+            
+        Returns:
+            Updated orders, in input order
+        """
+        broker_orders: Dict[str, Dict[str, Any]] = {}
+        tracked = [order for order in orders if order.external_id]
+        if len(tracked) > 1:
+            try:
+                rows = self.broker.get_orders(
+                    limit=max(500, len(tracked)),
+                    symbols=sorted({order.symbol for order in tracked}),
+                )
+                broker_orders = {str(row.get("id")): row for row in rows or [] if row.get("id")}
+            except Exception as e:
+                logger.warning(f"Bulk broker order lookup failed, polling orders individually: {e}")
+        return [
+            self.update_order_status(
+                order,
+                broker_order=broker_orders.get(order.external_id),
+                use_cache=use_cache,
+            )
+            for order in orders
+        ]
+
+    def update_order_status(
+        self,
+        order: Order,
+        broker_order: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+    ) -> Order:
         """
         Update order status from broker.
         
         Args:
             order: Order to update
+            broker_order: Broker order details already fetched for this order (optional)
+            use_cache: Allow the broker to answer from streamed state; False
+                forces an authoritative lookup (full reconciliation sweeps)
             
         Returns:
             Updated order
@@ -1779,7 +1847,11 @@ class OrderExecutionService:
         
         try:
             # Get current status from broker
-            broker_order = self.broker.get_order(order.external_id)
+            if broker_order is None:
+                if use_cache:
+                    broker_order = self.broker.get_order(order.external_id)
+                else:
+                    broker_order = self.broker.get_order(order.external_id, use_cache=False)
             broker_status = broker_order.get("status")
 
             # Map broker status to our status
@@ -5,7 +5,7 @@ Provides abstraction layer between services and database models.
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, insert
+from sqlalchemy import and_, or_, insert, func
 
 from storage.models import (
     Position, Order, Trade, Strategy, Config, AuditLog, PortfolioSnapshot, OptimizationRun,
@@ -95,7 +95,8 @@ class OrderRepository:
     def create(self, symbol: str, side: OrderSideEnum, type: OrderTypeEnum,
                quantity: float, price: Optional[float] = None,
                strategy_id: Optional[int] = None,
-               external_id: Optional[str] = None) -> Order:
+               external_id: Optional[str] = None,
+               auto_commit: bool = True) -> Order:
         """Create a new order."""
         now = datetime.now(timezone.utc).replace(tzinfo=None)
         stmt = (
@@ -114,7 +115,8 @@ class OrderRepository:
             )
         )
         result = self.db.execute(stmt)
-        self.db.commit()
+        if auto_commit:
+            self.db.commit()
         inserted_ids = list(result.inserted_primary_key or [])
         order_id = int(inserted_ids[0]) if inserted_ids else None
         if order_id is None:
@@ -132,6 +134,18 @@ class OrderRepository:
         """Get order by external/broker ID."""
         return self.db.query(Order).filter(Order.external_id == external_id).first()
     
+    def get_open_orders_by_external_ids(self, external_ids: List[str]) -> List[Order]:
+        """Get non-terminal orders matching any of the given external/broker IDs."""
+        if not external_ids:
+            return []
+        return (
+            self.db.query(Order)
+            .filter(Order.external_id.in_(list(external_ids)))
+            .filter(Order.status.in_([OrderStatusEnum.PENDING, OrderStatusEnum.OPEN, OrderStatusEnum.PARTIALLY_FILLED]))
+            .order_by(Order.created_at.asc())
+            .all()
+        )
+    
     def get_by_status(self, status: OrderStatusEnum, limit: int = 100) -> List[Order]:
         """Get orders by status."""
         return self.db.query(Order).filter(Order.status == status).limit(limit).all()
@@ -154,6 +168,16 @@ class OrderRepository:
             .all()
         )
     
+    def get_open_order_symbols(self) -> List[str]:
+        """Get distinct symbols with non-terminal orders, without loading full order rows."""
+        rows = (
+            self.db.query(Order.symbol)
+            .filter(Order.status.in_([OrderStatusEnum.PENDING, OrderStatusEnum.OPEN, OrderStatusEnum.PARTIALLY_FILLED]))
+            .distinct()
+            .all()
+        )
+        return [row[0] for row in rows]
+    
     def update_status(self, order: Order, status: OrderStatusEnum,
                      filled_quantity: Optional[float] = None,
                      avg_fill_price: Optional[float] = None,
@@ -254,6 +278,11 @@ class TradeRepository:
         """Count total trade rows."""
         return int(self.db.query(Trade).count())
 
+    def sum_realized_pnl(self) -> float:
+        """Sum realized P&L across all trades in the database."""
+        total = self.db.query(func.coalesce(func.sum(Trade.realized_pnl), 0.0)).scalar()
+        return float(total or 0.0)
+
 
 class StrategyRepository:
     """Repository for Strategy CRUD operations."""
@@ -431,6 +460,37 @@ class AuditLogRepository:
             fallback.id = log_id
         return fallback
     
+    def create_many(self, entries: List[Dict[str, Any]], auto_commit: bool = True) -> int:
+        """
+        Insert several audit log entries in one executemany round-trip.
+
+        Entries may carry their own ``timestamp``; otherwise the insert time is used.
+        """
+        if not entries:
+            return 0
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = []
+        for entry in entries:
+            timestamp = entry.get("timestamp") or now
+            if timestamp.tzinfo is not None:
+                timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+            rows.append({
+                "event_type": entry["event_type"],
+                "description": entry["description"],
+                "details": entry.get("details"),
+                "user_id": entry.get("user_id"),
+                "strategy_id": entry.get("strategy_id"),
+                "order_id": entry.get("order_id"),
+                "timestamp": timestamp,
+                "created_at": now,
+            })
+        self.db.execute(insert(AuditLog), rows)
+        if auto_commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        return len(rows)
+
     def get_by_id(self, log_id: int) -> Optional[AuditLog]:
         """Get audit log by ID."""
         return self.db.query(AuditLog).filter(AuditLog.id == log_id).first()
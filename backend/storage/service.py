@@ -111,7 +111,8 @@ class StorageService:
     
     def create_order(self, symbol: str, side: str, order_type: str,
                      quantity: float, price: Optional[float] = None,
-                     strategy_id: Optional[int] = None) -> Order:
+                     strategy_id: Optional[int] = None,
+                     auto_commit: bool = True) -> Order:
         """Create a new order."""
         return self.orders.create(
             symbol=symbol,
@@ -119,7 +120,8 @@ class StorageService:
             type=OrderTypeEnum(order_type),
             quantity=quantity,
             price=price,
-            strategy_id=strategy_id
+            strategy_id=strategy_id,
+            auto_commit=auto_commit,
         )
     
     def get_recent_orders(self, limit: int = 100) -> List[Order]:
@@ -130,6 +132,14 @@ class StorageService:
         """Get broker-submitted orders that are not terminal yet."""
         return self.orders.get_open_orders(limit=limit)
     
+    def get_open_orders_by_external_ids(self, external_ids: List[str]) -> List[Order]:
+        """Get non-terminal orders by broker-assigned IDs."""
+        return self.orders.get_open_orders_by_external_ids(external_ids)
+    
+    def get_open_order_symbols(self) -> List[str]:
+        """Get distinct symbols that still have non-terminal orders."""
+        return self.orders.get_open_order_symbols()
+    
     def update_order_status(self, order_id: int, status: str,
                            filled_quantity: Optional[float] = None,
                            avg_fill_price: Optional[float] = None,
@@ -167,6 +177,45 @@ class StorageService:
             auto_commit=auto_commit,
         )
     
+    def record_filled_trade(self, symbol: str, side: str, order_type: str,
+                            quantity: float, price: Optional[float],
+                            fill_price: float,
+                            strategy_id: Optional[int] = None,
+                            auto_commit: bool = True) -> Order:
+        """Record an immediately-filled order and its trade in one transaction."""
+        try:
+            order = self.create_order(
+                symbol=symbol,
+                side=side,
+                order_type=order_type,
+                quantity=quantity,
+                price=price,
+                auto_commit=False,
+            )
+            order = self.orders.update_status(
+                order,
+                OrderStatusEnum.FILLED,
+                filled_quantity=quantity,
+                avg_fill_price=fill_price,
+                auto_commit=False,
+            )
+            self.record_trade(
+                order_id=order.id,
+                symbol=symbol,
+                side=side,
+                quantity=quantity,
+                price=fill_price,
+                strategy_id=strategy_id,
+                auto_commit=False,
+            )
+            if auto_commit:
+                self.commit()
+        except Exception:
+            if auto_commit:
+                self.rollback()
+            raise
+        return order
+    
     def get_recent_trades(self, limit: int = 100) -> List[Trade]:
         """Get recent trades."""
         return self.trades.get_recent(limit)
@@ -178,6 +227,10 @@ class StorageService:
     def count_all_trades(self) -> int:
         """Count all recorded trades."""
         return self.trades.count_all()
+
+    def get_realized_pnl_total(self) -> float:
+        """Total realized P&L across all recorded trades."""
+        return self.trades.sum_realized_pnl()
     
     # Strategy operations
     
@@ -235,6 +288,17 @@ class StorageService:
             auto_commit=auto_commit,
         )
     
+    def create_audit_logs_bulk(
+        self,
+        entries: List[Dict[str, Any]],
+        auto_commit: bool = True,
+    ) -> int:
+        """Create several audit log entries in one batch; returns the number written."""
+        return self.audit_logs.create_many(
+            [{**entry, "event_type": AuditEventTypeEnum(entry["event_type"])} for entry in entries],
+            auto_commit=auto_commit,
+        )
+    
     def get_audit_logs(
         self,
         limit: int = 100,
@@ -146,6 +146,37 @@ class TestAlpacaBrokerConnection:
         assert alpaca_broker.is_connected() is False
         assert alpaca_broker._trading_client is None
 
+    @patch('integrations.alpaca_broker.TradingClient')
+    @patch('integrations.alpaca_broker.StockHistoricalDataClient')
+    def test_get_market_clock_uses_one_clock_call(
+        self, mock_data_client, mock_trading_client, alpaca_broker, mock_account
+    ):
+        """Open state and both session edges should come from a single get_clock call."""
+        next_open = datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc)
+        next_close = datetime(2026, 1, 2, 21, 0, tzinfo=timezone.utc)
+        mock_client_instance = MagicMock()
+        mock_client_instance.get_account.return_value = mock_account
+        mock_client_instance.get_clock.return_value = Mock(
+            is_open=True, next_open=next_open, next_close=next_close
+        )
+        mock_trading_client.return_value = mock_client_instance
+        alpaca_broker.connect()
+
+        clock = alpaca_broker.get_market_clock()
+
+        assert clock == {"is_open": True, "next_open": next_open, "next_close": next_close}
+        mock_client_instance.get_clock.assert_called_once()
+
+    def test_configure_http_pool_widens_sdk_session_pool(self):
+        """SDK clients should reuse a keep-alive pool large enough for concurrent fetches."""
+        from alpaca.trading.client import TradingClient
+
+        client = TradingClient(api_key="test_api_key", secret_key="test_secret_key", paper=True)
+        AlpacaBroker._configure_http_pool(client)
+
+        adapter = client._session.get_adapter("https://paper-api.alpaca.markets")
+        assert adapter._pool_maxsize == 16
+
 
 class TestAlpacaBrokerAccount:
     """Test Alpaca account information methods."""
@@ -171,7 +202,30 @@ class TestAlpacaBrokerAccount:
         assert info["equity"] == 100000.00
         assert info["buying_power"] == 200000.00
         assert info["pattern_day_trader"] is False
-    
+
+    @patch('integrations.alpaca_broker.TradingClient')
+    @patch('integrations.alpaca_broker.StockHistoricalDataClient')
+    def test_get_account_info_is_cached_until_order_activity(
+        self, mock_data_client, mock_trading_client, alpaca_broker, mock_account
+    ):
+        """Repeated polls reuse one account fetch; cancelling an order refreshes it."""
+        mock_client_instance = MagicMock()
+        mock_client_instance.get_account.return_value = mock_account
+        mock_trading_client.return_value = mock_client_instance
+        alpaca_broker.connect()
+        calls_after_connect = mock_client_instance.get_account.call_count
+
+        first = alpaca_broker.get_account_info()
+        first["cash"] = -1.0
+        second = alpaca_broker.get_account_info()
+
+        assert second["cash"] == 50000.00
+        assert mock_client_instance.get_account.call_count == calls_after_connect + 1
+
+        alpaca_broker.cancel_order("order-123")
+        alpaca_broker.get_account_info()
+        assert mock_client_instance.get_account.call_count == calls_after_connect + 2
+
     def test_get_account_info_not_connected(self, alpaca_broker):
         """Test getting account info when not connected."""
         with pytest.raises(RuntimeError, match="Not connected"):
@@ -450,7 +504,93 @@ class TestAlpacaBrokerOrders:
         # Verify
         assert result["id"] == "order-123"
         assert result["symbol"] == "AAPL"
-    
+
+    @patch('integrations.alpaca_broker.TradingClient')
+    @patch('integrations.alpaca_broker.StockHistoricalDataClient')
+    def test_trade_update_stream_forwards_nested_order(
+        self, mock_data_client, mock_trading_client, alpaca_broker, mock_order, mock_account
+    ):
+        """Stream updates carry the order nested under .order; its id must reach the callback."""
+        import asyncio
+
+        mock_client_instance = MagicMock()
+        mock_client_instance.get_account.return_value = mock_account
+        mock_trading_client.return_value = mock_client_instance
+        alpaca_broker.connect()
+
+        update = Mock(spec=["event", "order"])
+        update.event = "fill"
+        update.order = mock_order
+        received = []
+
+        class _FakeStream:
+            def __init__(self, *args, **kwargs):
+                self._handler = None
+
+            def subscribe_trade_updates(self, handler):
+                self._handler = handler
+
+            def run(self):
+                asyncio.run(self._handler(update))
+
+        with patch('alpaca.trading.stream.TradingStream', _FakeStream):
+            assert alpaca_broker.start_trade_update_stream(received.append) is True
+            alpaca_broker._trade_stream_thread.join(timeout=5)
+
+        assert received == [{
+            "event": "fill",
+            "order_id": "order-123",
+            "symbol": "AAPL",
+            "status": OrderStatus.FILLED.value,
+        }]
+
+    @patch('integrations.alpaca_broker.TradingClient')
+    @patch('integrations.alpaca_broker.StockHistoricalDataClient')
+    def test_get_order_served_from_stream_while_running(
+        self, mock_data_client, mock_trading_client, alpaca_broker, mock_order, mock_account
+    ):
+        """Orders pushed by the live stream skip the REST lookup until the stream stops."""
+        mock_client_instance = MagicMock()
+        mock_client_instance.get_account.return_value = mock_account
+        mock_client_instance.get_order_by_id.return_value = mock_order
+        mock_trading_client.return_value = mock_client_instance
+        alpaca_broker.connect()
+
+        alpaca_broker._trade_stream_running = True
+        alpaca_broker._remember_streamed_order(alpaca_broker._map_alpaca_order(mock_order))
+        assert alpaca_broker.get_order("order-123")["status"] == OrderStatus.FILLED.value
+        mock_client_instance.get_order_by_id.assert_not_called()
+
+        alpaca_broker._trade_stream_running = True
+        assert alpaca_broker.get_order("order-123", use_cache=False)["id"] == "order-123"
+        mock_client_instance.get_order_by_id.assert_called_once_with("order-123")
+
+        alpaca_broker.stop_trade_update_stream()
+        alpaca_broker.get_order("order-123")
+        assert mock_client_instance.get_order_by_id.call_count == 2
+
+    @patch('integrations.alpaca_broker.TradingClient')
+    @patch('integrations.alpaca_broker.StockHistoricalDataClient')
+    def test_streamed_open_order_is_resolved_from_rest(
+        self, mock_data_client, mock_trading_client, alpaca_broker, mock_order, mock_account
+    ):
+        """A non-terminal streamed state (e.g. missed fill during a reconnect) must not be served."""
+        mock_client_instance = MagicMock()
+        mock_client_instance.get_account.return_value = mock_account
+        mock_client_instance.get_order_by_id.return_value = mock_order
+        mock_trading_client.return_value = mock_client_instance
+        alpaca_broker.connect()
+        alpaca_broker._trade_stream_running = True
+
+        streamed = alpaca_broker._map_alpaca_order(mock_order)
+        streamed["status"] = OrderStatus.SUBMITTED.value
+        alpaca_broker._remember_streamed_order(streamed)
+
+        result = alpaca_broker.get_order("order-123")
+
+        mock_client_instance.get_order_by_id.assert_called_once_with("order-123")
+        assert result["status"] == OrderStatus.FILLED.value
+
     @patch('integrations.alpaca_broker.TradingClient')
     @patch('integrations.alpaca_broker.StockHistoricalDataClient')
     def test_get_orders(self, mock_data_client, mock_trading_client, alpaca_broker, mock_order, mock_account):
@@ -237,6 +237,8 @@ def test_chart_indicators_use_true_atr_from_ohlc():
     # [7, 5, 7, 3] => ATR abs = 5.5; ATR% = 5.5 / 107 * 100 = 5.1402
     assert indicators["atr14"] == pytest.approx(5.5, rel=1e-6)
     assert indicators["atr14_pct"] == pytest.approx(5.1402, rel=1e-6)
+    assert screener.get_atr14_pct(points) == indicators["atr14_pct"]
+    assert screener.get_atr14_pct(points[:1]) == 0.0
 
 
 def test_get_preset_assets_seed_only_disables_backfill():
@@ -449,3 +451,18 @@ def test_market_screener_env_credentials_honor_settings_mode(monkeypatch):
 
     MarketScreener()
     assert created["paper"] is False
+
+
+def test_with_sma_matches_windowed_means():
+    """Rolling SMA overlays should equal plain window means."""
+    screener = MarketScreener()
+    closes = [100.0 + ((idx * 37) % 11) - idx * 0.05 for idx in range(300)]
+    points = [{"timestamp": str(idx), "close": close} for idx, close in enumerate(closes)]
+
+    result = screener._with_sma(points)
+
+    assert result[48]["sma50"] is None
+    assert result[49]["sma50"] == pytest.approx(sum(closes[:50]) / 50.0)
+    assert result[299]["sma50"] == pytest.approx(sum(closes[250:]) / 50.0)
+    assert result[248]["sma250"] is None
+    assert result[299]["sma250"] == pytest.approx(sum(closes[50:]) / 250.0)
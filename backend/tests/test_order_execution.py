@@ -526,6 +526,70 @@ def test_update_order_status_rolls_back_on_fill_side_effect_error(execution_serv
     assert execution_service.storage.get_recent_trades(limit=10) == []
 
 
+def test_update_order_statuses_bulk_uses_one_listing_with_fallback(execution_service):
+    """Bulk refresh should read listed orders from one call and poll only the missing ones."""
+    from storage.models import OrderStatusEnum
+
+    orders = []
+    for external_id, symbol in (("ext-bulk-1", "AAPL"), ("ext-bulk-2", "MSFT")):
+        order = execution_service.storage.create_order(
+            symbol=symbol,
+            side="buy",
+            order_type="limit",
+            quantity=2,
+            price=100.0,
+        )
+        order.status = OrderStatusEnum.OPEN
+        order.external_id = external_id
+        execution_service.storage.orders.update(order)
+        orders.append(order)
+
+    execution_service.broker.get_orders = Mock(return_value=[
+        {"id": "ext-bulk-1", "status": "open", "filled_quantity": 0.0, "avg_fill_price": None},
+    ])
+    execution_service.broker.get_order = Mock(return_value={
+        "id": "ext-bulk-2",
+        "status": "filled",
+        "filled_quantity": 2.0,
+        "avg_fill_price": 100.0,
+        "commission": 0.0,
+    })
+
+    updated = execution_service.update_order_statuses_bulk(orders)
+
+    execution_service.broker.get_orders.assert_called_once()
+    assert execution_service.broker.get_orders.call_args.kwargs["symbols"] == ["AAPL", "MSFT"]
+    execution_service.broker.get_order.assert_called_once_with("ext-bulk-2")
+    assert [order.status.value for order in updated] == ["open", "filled"]
+
+
+def test_update_order_statuses_bulk_full_sweep_bypasses_broker_cache(execution_service):
+    """Full reconciliation sweeps should ask the broker for authoritative order state."""
+    from storage.models import OrderStatusEnum
+
+    order = execution_service.storage.create_order(
+        symbol="AAPL",
+        side="buy",
+        order_type="market",
+        quantity=1,
+    )
+    order.status = OrderStatusEnum.OPEN
+    order.external_id = "ext-sweep-1"
+    execution_service.storage.orders.update(order)
+    execution_service.broker.get_order = Mock(return_value={
+        "id": "ext-sweep-1",
+        "status": "filled",
+        "filled_quantity": 1.0,
+        "avg_fill_price": 100.0,
+        "commission": 0.0,
+    })
+
+    updated = execution_service.update_order_statuses_bulk([order], use_cache=False)
+
+    execution_service.broker.get_order.assert_called_once_with("ext-sweep-1", use_cache=False)
+    assert updated[0].status.value == "filled"
+
+
 def test_submit_order_reuses_existing_row_for_duplicate_broker_external_id(execution_service):
     """If broker returns an already-seen external_id, do not process a duplicate fill again."""
     duplicate_response = {
@@ -3,7 +3,7 @@ Tests for storage layer - CRUD operations.
 Tests database models, repositories, and storage service.
 """
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import create_engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
@@ -226,6 +226,17 @@ def test_get_orders_by_status(order_repo):
     assert len(pending_orders) == 2
 
 
+
+def test_get_open_order_symbols(order_repo):
+    """Test distinct symbols are returned only for non-terminal orders."""
+    for symbol in ("AAPL", "AAPL", "MSFT"):
+        order_repo.create(symbol=symbol, side=OrderSideEnum.BUY, type=OrderTypeEnum.MARKET, quantity=1.0)
+    filled = order_repo.create(symbol="TSLA", side=OrderSideEnum.BUY, type=OrderTypeEnum.MARKET, quantity=1.0)
+    order_repo.update_status(filled, OrderStatusEnum.FILLED)
+
+    assert sorted(order_repo.get_open_order_symbols()) == ["AAPL", "MSFT"]
+
+
 # Trade Repository Tests
 
 def test_create_trade(trade_repo):
@@ -258,6 +269,21 @@ def test_get_trades_by_order(trade_repo):
     assert len(trades) == 2
 
 
+
+def test_sum_realized_pnl(trade_repo, db_session):
+    """Test realized P&L is summed in the database, ignoring trades without one."""
+    assert trade_repo.sum_realized_pnl() == 0.0
+    for realized_pnl in (12.5, -2.25, None):
+        trade = trade_repo.create(
+            order_id=1, symbol="AAPL", side=OrderSideEnum.SELL,
+            type=TradeTypeEnum.CLOSE, quantity=1.0, price=150.0
+        )
+        trade.realized_pnl = realized_pnl
+    db_session.commit()
+
+    assert trade_repo.sum_realized_pnl() == pytest.approx(10.25)
+
+
 # Strategy Repository Tests
 
 def test_create_strategy(strategy_repo):
@@ -414,6 +440,23 @@ def test_storage_service_record_trade(storage_service):
     assert trade.commission == 1.0
 
 
+def test_storage_service_record_filled_trade(storage_service):
+    """Test recording a filled order and its trade in one call."""
+    order = storage_service.record_filled_trade(
+        symbol="VTI",
+        side="buy",
+        order_type="market",
+        quantity=3.0,
+        price=None,
+        fill_price=250.0,
+    )
+    assert order.status == OrderStatusEnum.FILLED
+    assert order.filled_quantity == 3.0
+    assert order.avg_fill_price == 250.0
+    trades = storage_service.get_recent_trades()
+    assert [(t.order_id, t.price) for t in trades] == [(order.id, 250.0)]
+
+
 def test_storage_service_config(storage_service):
     """Test config operations through storage service."""
     # Set config
@@ -496,6 +539,21 @@ def test_get_all_audit_logs(audit_log_repo):
     assert len(order_created_logs) == 2
 
 
+def test_create_many_audit_logs(audit_log_repo):
+    """Test batch-inserting audit logs keeps each entry's own timestamp."""
+    stamp = datetime(2024, 1, 2, 15, 30, tzinfo=timezone.utc)
+    written = audit_log_repo.create_many([
+        {"event_type": AuditEventTypeEnum.ERROR, "description": "Poll error", "timestamp": stamp},
+        {"event_type": AuditEventTypeEnum.CONFIG_UPDATED, "description": "Resumed", "details": {"n": 1}},
+    ])
+
+    assert written == 2
+    assert audit_log_repo.count() == 2
+    error_log = audit_log_repo.get_all(event_type=AuditEventTypeEnum.ERROR)[0]
+    assert error_log.timestamp == stamp.replace(tzinfo=None)
+    assert audit_log_repo.create_many([]) == 0
+
+
 def test_count_audit_logs(audit_log_repo):
     """Test counting audit logs."""
     # Create multiple logs
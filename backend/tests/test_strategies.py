@@ -0,0 +1,262 @@
+"""
+Tests for sample strategy implementations.
+"""
+
+import pytest
+
+from engine.strategies import MovingAverageCrossoverStrategy, BuyAndHoldStrategy, MetricsDrivenStrategy
+from engine.strategy_interface import Signal
+
+
+def _feed(strategy, symbol, prices):
+    """Feed a price series into a strategy and collect all emitted signals."""
+    emitted = []
+    for price in prices:
+        emitted.extend(strategy.on_tick({symbol: {"price": price}}))
+    return emitted
+
+
+def test_ma_crossover_emits_buy_then_sell():
+    """Test crossover up produces BUY and crossover down produces SELL."""
+    strategy = MovingAverageCrossoverStrategy({
+        "symbols": ["AAPL"],
+        "short_window": 2,
+        "long_window": 4,
+        "position_size": 10,
+    })
+    strategy.on_start()
+
+    signals = _feed(strategy, "AAPL", [10, 10, 10, 10, 12, 14, 16, 12, 8, 6])
+
+    assert [s["signal"] for s in signals] == [Signal.BUY, Signal.SELL]
+    assert all(s["symbol"] == "AAPL" for s in signals)
+    assert all(s["quantity"] == 10.0 for s in signals)
+
+
+def test_ma_crossover_running_averages_match_history():
+    """Test running window sums stay consistent with recomputed averages."""
+    strategy = MovingAverageCrossoverStrategy({
+        "symbols": ["SPY"],
+        "short_window": 3,
+        "long_window": 5,
+    })
+    strategy.on_start()
+    prices = [100.0, 101.5, 99.25, 102.0, 103.75, 98.5, 97.0, 104.25]
+    _feed(strategy, "SPY", prices)
+
+    assert strategy._calculate_ma("SPY", 3) == pytest.approx(sum(prices[-3:]) / 3)
+    assert strategy._calculate_ma("SPY", 5) == pytest.approx(sum(prices[-5:]) / 5)
+    state = strategy.get_state()["state"]
+    assert state["price_history"]["SPY"] == prices[-5:]
+    assert state["in_position"] == {"SPY": False}
+    assert state["last_signal"] == {"SPY": "sell"}
+
+
+def test_ma_crossover_ignores_missing_and_invalid_prices():
+    """Test symbols without data or with non-positive prices are skipped."""
+    strategy = MovingAverageCrossoverStrategy({
+        "symbols": ["AAPL", "MSFT"],
+        "short_window": 2,
+        "long_window": 3,
+    })
+    strategy.on_start()
+
+    assert strategy.on_tick({"AAPL": {"price": 0}}) == []
+    assert strategy.on_tick({"AAPL": {"price": None}}) == []
+    assert strategy.on_tick({"AAPL": {"price": "n/a"}}) == []
+    state = strategy.get_state()["state"]
+    assert state["price_history"] == {"AAPL": [], "MSFT": []}
+
+    strategy.on_tick({"AAPL": {"price": "101.5"}})
+    assert strategy.get_state()["state"]["price_history"]["AAPL"] == [101.5]
+
+
+def test_buy_and_hold_buys_each_symbol_once():
+    """Test buy-and-hold emits a single BUY per symbol."""
+    strategy = BuyAndHoldStrategy({"symbols": ["VTI", "BND"], "position_size": 5})
+    strategy.on_start()
+
+    first = strategy.on_tick({"VTI": {"price": 200.0}})
+    second = strategy.on_tick({"VTI": {"price": 201.0}, "BND": {"price": 70.0}})
+    third = strategy.on_tick({"VTI": {"price": 202.0}, "BND": {"price": 71.0}})
+
+    assert [s["symbol"] for s in first] == ["VTI"]
+    assert [s["symbol"] for s in second] == ["BND"]
+    assert third == []
+    assert strategy.get_state()["state"]["bought"] == {"VTI": True, "BND": True}
+
+
+def test_buy_and_hold_skips_malformed_prices():
+    """Test a non-numeric tick price is skipped instead of raising."""
+    strategy = BuyAndHoldStrategy({"symbols": ["VTI"], "position_size": 5})
+    strategy.on_start()
+
+    assert strategy.on_tick({"VTI": {"price": "n/a"}}) == []
+    assert [s["symbol"] for s in strategy.on_tick({"VTI": {"price": "200"}})] == ["VTI"]
+
+
+class _StubScreener:
+    """Deterministic in-memory screener for MetricsDrivenStrategy tests."""
+
+    def __init__(self, closes):
+        self.points = [{"close": close, "high": close, "low": close} for close in closes]
+        self.chart_calls = []
+        self.atr_calls = 0
+
+    def detect_market_regime(self):
+        return "trending_up"
+
+    def get_symbol_chart(self, symbol, days=300):
+        self.chart_calls.append(symbol)
+        return self.points
+
+    def get_atr14_pct(self, points):
+        self.atr_calls += 1
+        return 1.0
+
+
+def _metrics_strategy(**overrides):
+    config = {"symbols": ["VTI"], "position_size": 1000.0, "take_profit_pct": 5.0}
+    config.update(overrides)
+    strategy = MetricsDrivenStrategy(config)
+    strategy.screener = _StubScreener([float(v) for v in range(1, 261)])
+    strategy.on_start()
+    return strategy
+
+
+def test_metrics_strategy_enters_on_trend_pullback():
+    """Test uptrend plus pullback to SMA50 opens a first tranche."""
+    strategy = _metrics_strategy()
+
+    signals = strategy.on_tick({"VTI": {"price": 236.0}})
+
+    assert len(signals) == 1
+    assert signals[0]["signal"] == Signal.BUY
+    assert signals[0]["quantity"] == pytest.approx(1000.0 / 236.0)
+    assert strategy.state["positions"]["VTI"].entry_price == 236.0
+    assert strategy.get_state()["state"]["positions"]["VTI"]["qty"] == pytest.approx(1000.0 / 236.0)
+
+
+def test_metrics_strategy_exit_does_not_reenter_same_tick():
+    """Test a take-profit exit is not followed by a re-entry on the same tick."""
+    strategy = _metrics_strategy()
+    strategy.on_tick({"VTI": {"price": 236.0}})
+
+    signals = strategy.on_tick({"VTI": {"price": 250.0}})
+
+    assert [s["signal"] for s in signals] == [Signal.SELL]
+    assert strategy.state["positions"]["VTI"] is None
+
+
+def test_metrics_strategy_reuses_charts_across_ticks():
+    """Test chart lookups are cached between ticks instead of refetched."""
+    strategy = _metrics_strategy(symbols=["VTI", "BND"])
+
+    strategy.on_tick({"VTI": {"price": 100.0}, "BND": {"price": 100.0}})
+    strategy.on_tick({"VTI": {"price": 101.0}, "BND": {"price": 101.0}})
+
+    assert sorted(strategy.screener.chart_calls) == ["BND", "SPY", "VTI"]
+
+
+def test_metrics_strategy_prefetches_charts_concurrently_and_stops_pool():
+    """Test uncached charts are fetched through the worker pool, released on stop."""
+    strategy = _metrics_strategy(symbols=["VTI", "BND", "VXUS"])
+
+    strategy.on_tick({"VTI": {"price": 100.0}, "BND": {"price": 100.0}})
+
+    assert sorted(strategy.screener.chart_calls) == ["BND", "SPY", "VTI"]
+    assert strategy._chart_pool is not None
+    strategy.on_stop()
+    assert strategy._chart_pool is None
+
+
+def test_signal_reason_renders_lazily():
+    """Test crossover reasons format only when rendered as text."""
+    strategy = MovingAverageCrossoverStrategy({
+        "symbols": ["AAPL"],
+        "short_window": 2,
+        "long_window": 4,
+    })
+    strategy.on_start()
+
+    signals = _feed(strategy, "AAPL", [10, 10, 10, 10, 12])
+
+    assert str(signals[0]["reason"]) == "MA crossover up: short=11.00 long=10.50"
+
+
+def test_metrics_strategy_allowed_regimes_gate_entries():
+    """Test entries are blocked when the detected regime is not allowed."""
+    blocked = _metrics_strategy(allowed_regimes=["range_bound"])
+    allowed = _metrics_strategy(allowed_regimes=["range_bound", "trending_up"])
+
+    assert isinstance(blocked.allowed_regimes, frozenset)
+    assert blocked.on_tick({"VTI": {"price": 236.0}}) == []
+    assert len(allowed.on_tick({"VTI": {"price": 236.0}})) == 1
+
+
+def test_metrics_strategy_skips_flat_symbol_charts_when_entries_blocked():
+    """Test flat symbols are not charted when the regime blocks entries."""
+    strategy = _metrics_strategy(symbols=["VTI", "BND"], allowed_regimes=["range_bound"])
+
+    assert strategy.on_tick({"VTI": {"price": 236.0}, "BND": {"price": 236.0}}) == []
+    assert strategy.screener.chart_calls == []
+
+
+def test_metrics_strategy_memoizes_chart_metrics_per_latest_bar():
+    """Test chart-derived metrics are reused until the chart's latest bar changes."""
+    strategy = _metrics_strategy()
+    strategy.on_tick({"VTI": {"price": 236.0}})
+    assert strategy.screener.atr_calls == 1
+
+    strategy.on_tick({"VTI": {"price": 237.0}})
+    assert strategy.screener.atr_calls == 1
+    assert strategy.state["positions"]["VTI"].peak_price == 237.0
+
+    strategy.screener.points[-1] = {"close": 261.0, "high": 261.0, "low": 261.0}
+    strategy._chart_cache.clear()
+    strategy.on_tick({"VTI": {"price": 237.5}})
+    assert strategy.screener.atr_calls == 2
+
+
+def test_signal_is_int_valued_with_lowercase_labels():
+    """Test signals compare as ints and keep their lowercase labels."""
+    assert Signal.BUY == 1
+    assert Signal.BUY.label == "buy"
+    assert [signal.label for signal in Signal] == ["hold", "buy", "sell", "close"]
+
+
+def test_metrics_strategy_uses_screener_from_config():
+    """Test a screener passed in the config is used instead of building one."""
+    screener = _StubScreener([1.0])
+    first = MetricsDrivenStrategy({"symbols": ["VTI"], "screener": screener})
+    second = MetricsDrivenStrategy({"name": "Other", "symbols": ["BND"], "screener": screener})
+
+    assert first.screener is screener
+    assert second.screener is screener
+
+
+def test_runner_manager_rebuilds_screener_when_credentials_change(monkeypatch):
+    """Test the runner screener is reused per credentials and keyed by a digest."""
+    import api.runner_manager as runner_manager_module
+
+    built = []
+
+    def _factory(alpaca_client, require_real_data=False):
+        built.append(alpaca_client)
+        return _StubScreener([1.0])
+
+    monkeypatch.setattr(runner_manager_module, "MarketScreener", _factory)
+    manager = runner_manager_module.RunnerManager()
+    monkeypatch.setattr(manager, "_screener", None)
+    monkeypatch.setattr(manager, "_screener_key", None)
+    creds = {"api_key": "key", "secret_key": "secret", "paper": True}
+
+    first = manager._runner_screener(dict(creds), False)
+    again = manager._runner_screener(dict(creds), False)
+    rotated = manager._runner_screener({**creds, "secret_key": "rotated"}, False)
+
+    assert first is again
+    assert rotated is not first
+    assert manager._screener is rotated
+    assert len(built) == 2
+    assert "secret" not in manager._screener_key
@@ -0,0 +1,766 @@
+"""
+Tests for the strategy runner scheduler helpers.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from engine.strategies import BuyAndHoldStrategy
+from engine.strategy_interface import Signal
+from engine.strategy_runner import StrategyRunner
+from services.broker import PaperBroker
+from storage.database import Base
+from storage.models import OrderStatusEnum
+from storage.service import StorageService
+
+
+@pytest.fixture
+def storage():
+    """Create a storage service backed by an in-memory SQLite database."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield StorageService(session)
+    session.close()
+
+
+class _BatchBroker(PaperBroker):
+    """Paper broker that also exposes a batched quote endpoint."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_calls = []
+        self.single_calls = []
+
+    def get_market_data(self, symbol):
+        self.single_calls.append(symbol)
+        return super().get_market_data(symbol)
+
+    def get_market_data_multi(self, symbols):
+        self.batch_calls.append(list(symbols))
+        return {symbol: {"symbol": symbol, "price": 10.0} for symbol in symbols if symbol != "BND"}
+
+
+class _FailingBroker(PaperBroker):
+    """Paper broker whose quote lookup fails for one symbol."""
+
+    def get_market_data(self, symbol):
+        if symbol == "BND":
+            raise RuntimeError("quote unavailable")
+        return super().get_market_data(symbol)
+
+
+def _runner(broker, symbols):
+    runner = StrategyRunner(broker=broker)
+    runner.load_strategy(BuyAndHoldStrategy({"symbols": symbols}))
+    return runner
+
+
+def test_fetch_market_data_uses_batched_broker_call():
+    """Test a batched broker endpoint is used, with per-symbol fallback for gaps."""
+    broker = _BatchBroker()
+    runner = _runner(broker, ["VTI", "BND", "VXUS"])
+
+    market_data = runner._fetch_market_data()
+
+    assert broker.batch_calls == [["BND", "VTI", "VXUS"]]
+    assert broker.single_calls == ["BND"]
+    assert set(market_data) == {"VTI", "BND", "VXUS"}
+    assert market_data["VTI"]["price"] == 10.0
+
+
+def test_fetch_market_data_concurrent_fetch_isolates_failures():
+    """Test pooled per-symbol fetches skip failing symbols without losing others."""
+    broker = _FailingBroker()
+    runner = _runner(broker, ["VTI", "BND", "VXUS"])
+    assert runner.start()
+    try:
+        assert runner._io_pool is not None
+        market_data = runner._fetch_market_data()
+    finally:
+        runner.stop()
+
+    assert set(market_data) == {"VTI", "VXUS"}
+    assert runner._io_pool is None
+
+
+def test_tracked_symbols_cached_until_strategies_change():
+    """Test the symbol union is reused until a strategy is loaded or unloaded."""
+    runner = _runner(PaperBroker(), ["VTI", "BND"])
+
+    first = runner._tracked_symbols()
+    assert first == {"VTI", "BND"}
+    assert runner._tracked_symbols() is first
+
+    runner.load_strategy(BuyAndHoldStrategy({"name": "Extra", "symbols": ["VXUS"]}))
+    assert runner._tracked_symbols() == {"VTI", "BND", "VXUS"}
+
+    assert runner.unload_strategy("Extra")
+    assert not runner.unload_strategy("Extra")
+    assert runner._tracked_symbols() == {"VTI", "BND"}
+
+    runner.clear_strategies()
+    assert runner._tracked_symbols() == frozenset()
+
+
+def test_fetch_market_data_reuses_fresh_quotes():
+    """Test quotes fetched within the cache TTL are not refetched from the broker."""
+    broker = _BatchBroker()
+    runner = _runner(broker, ["VTI", "VXUS"])
+
+    runner._fetch_market_data()
+    runner._fetch_market_data()
+    assert len(broker.batch_calls) == 1
+    status = runner.get_status()
+    assert status["market_data_cache_hits"] == 2
+    assert status["market_data_cache_misses"] == 2
+
+    for symbol, (fetched_at, data) in list(runner._md_cache.items()):
+        runner._md_cache[symbol] = (fetched_at - 5.0, data)
+    runner._fetch_market_data()
+    assert len(broker.batch_calls) == 2
+
+
+class _SlowTickRunner(StrategyRunner):
+    """Runner whose strategy pass always takes longer than the tick interval."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ticks = []
+
+    def _run_strategies(self, market_data):
+        started = time.monotonic()
+        time.sleep(0.15)
+        self.ticks.append((started, time.monotonic()))
+        if len(self.ticks) >= 3:
+            self._stop_event.set()
+
+
+def test_run_loop_pauses_between_overrunning_ticks():
+    """Test persistently slow ticks still get a pause instead of running back-to-back."""
+    broker = PaperBroker()
+    broker.connect()
+    runner = _SlowTickRunner(broker=broker, tick_interval=0.1)
+
+    runner._run_loop()
+
+    assert len(runner.ticks) == 3
+    for (_, prev_end), (next_start, _) in zip(runner.ticks, runner.ticks[1:]):
+        assert next_start - prev_end >= 0.09
+
+
+def test_sleep_wait_reports_stream_wakeups():
+    """Test the tick wait distinguishes stream wakeups from reaching the deadline."""
+    runner = _runner(PaperBroker(), ["VTI"])
+
+    assert runner._sleep_wait(0.1) is False
+    runner._on_broker_trade_update({})
+    assert runner._sleep_wait(5.0) is True
+    assert not runner._stream_update_event.is_set()
+
+
+class _RecordingStrategy(BuyAndHoldStrategy):
+    """Buy-and-hold strategy that records which thread ran its tick."""
+
+    def __init__(self, config, fail=False):
+        super().__init__(config)
+        self.fail = fail
+        self.tick_threads = []
+
+    def on_tick(self, market_data):
+        self.tick_threads.append(threading.current_thread().name)
+        if self.fail:
+            raise ValueError("boom")
+        return super().on_tick(market_data)
+
+
+def test_run_strategies_ticks_on_pool_and_isolates_errors():
+    """Test strategies tick on the I/O pool and one failure does not block the rest."""
+    runner = StrategyRunner(broker=PaperBroker())
+    failing = _RecordingStrategy({"name": "Failing", "symbols": ["VTI"]}, fail=True)
+    working = _RecordingStrategy({"name": "Working", "symbols": ["VTI"], "position_size": 1})
+    for strategy in (failing, working):
+        strategy.on_start()
+        runner.load_strategy(strategy)
+    executed = []
+    runner.on_signal_callback = lambda strategy, signal, order: executed.append(strategy.name)
+    runner._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="runner-io")
+    runner.broker.connect()
+    try:
+        runner._run_strategies({"VTI": {"price": 100.0}})
+    finally:
+        runner._io_pool.shutdown()
+
+    assert executed == ["Working"]
+    assert runner.poll_error_count == 1
+    assert "Failing" in runner.last_poll_error
+    assert all(name.startswith("runner-io") for name in failing.tick_threads + working.tick_threads)
+
+
+def test_execute_signals_records_paper_fills(storage):
+    """Test executed paper orders are recorded as filled orders and trades."""
+    broker = PaperBroker()
+    broker.connect()
+    runner = StrategyRunner(broker=broker, storage_service=storage)
+    strategy = BuyAndHoldStrategy({"symbols": ["AAPL", "VTI"], "strategy_id": None})
+
+    runner._execute_signals(strategy, [
+        {"symbol": "AAPL", "signal": Signal.BUY, "quantity": 2},
+        {"symbol": "VTI", "signal": Signal.HOLD, "quantity": 1},
+        {"symbol": "AAPL", "signal": Signal.SELL, "quantity": 1, "price": 101.0},
+        {
+            "symbol": "VTI",
+            "signal": Signal.BUY,
+            "quantity": 3,
+            "order_type": "market",
+            "price": None,
+            "reason": "every field set",
+        },
+    ])
+
+    orders = storage.get_recent_orders()
+    trades = storage.get_recent_trades()
+    assert sorted((o.symbol, o.side.value, o.status.value) for o in orders) == [
+        ("AAPL", "buy", "filled"),
+        ("AAPL", "sell", "filled"),
+        ("VTI", "buy", "filled"),
+    ]
+    assert sorted(t.quantity for t in trades) == [1.0, 2.0, 3.0]
+
+
+def test_execute_signals_storage_failure_keeps_other_fills(storage):
+    """Test one failed paper-fill record does not roll back the others."""
+    broker = PaperBroker()
+    broker.connect()
+    runner = StrategyRunner(broker=broker, storage_service=storage)
+    strategy = BuyAndHoldStrategy({"symbols": ["AAPL", "MSFT", "VTI"], "strategy_id": None})
+    record_trade = storage.record_trade
+    calls = []
+
+    def flaky_record_trade(*args, **kwargs):
+        calls.append(kwargs.get("symbol"))
+        if len(calls) == 2:
+            raise RuntimeError("disk full")
+        return record_trade(*args, **kwargs)
+
+    storage.record_trade = flaky_record_trade
+    runner._execute_signals(strategy, [
+        {"symbol": "AAPL", "signal": Signal.BUY, "quantity": 1},
+        {"symbol": "MSFT", "signal": Signal.BUY, "quantity": 2},
+        {"symbol": "VTI", "signal": Signal.BUY, "quantity": 3},
+    ])
+
+    assert calls == ["AAPL", "MSFT", "VTI"]
+    assert sorted(o.symbol for o in storage.get_recent_orders()) == ["AAPL", "VTI"]
+    assert sorted(t.symbol for t in storage.get_recent_trades()) == ["AAPL", "VTI"]
+
+
+def test_execute_signals_submits_through_execution_service_bulk():
+    """Test the execution-service path submits a strategy's orders in one bulk call."""
+
+    class _BulkService:
+        def __init__(self):
+            self.batches = []
+
+        def submit_orders_bulk(self, orders):
+            self.batches.append(orders)
+            return [RuntimeError("rejected")] + [
+                type("Submitted", (), {
+                    "external_id": "ext-%d" % i,
+                    "id": i,
+                    "status": OrderStatusEnum.PENDING,
+                    "symbol": order["symbol"],
+                    "filled_quantity": 0.0,
+                    "avg_fill_price": None,
+                })()
+                for i, order in enumerate(orders[1:], start=1)
+            ]
+
+    service = _BulkService()
+    runner = StrategyRunner(broker=PaperBroker(), order_execution_service=service)
+    results = []
+    runner.on_signal_callback = lambda strategy, signal, order: results.append(order["id"])
+    strategy = BuyAndHoldStrategy({"symbols": ["AAPL", "VTI"], "strategy_id": 7})
+
+    runner._execute_signals(strategy, [
+        {"symbol": "AAPL", "signal": Signal.BUY, "quantity": 2},
+        {"symbol": "VTI", "signal": Signal.CLOSE, "quantity": 1, "order_type": "limit", "price": 50.0},
+    ])
+
+    assert len(service.batches) == 1
+    assert [(o["symbol"], o["side"], o["order_type"], o["strategy_id"]) for o in service.batches[0]] == [
+        ("AAPL", "buy", "market", 7),
+        ("VTI", "sell", "limit", 7),
+    ]
+    assert results == ["ext-1"]
+
+
+def test_sync_local_positions_aggregates_broker_rows(storage):
+    """Test broker rows per symbol are netted into one local position at the weighted entry."""
+    runner = StrategyRunner(broker=PaperBroker(), storage_service=storage)
+
+    changes = runner._sync_local_positions_to_broker(
+        broker_positions=[
+            {"symbol": "vti", "quantity": 2, "side": "long", "avg_entry_price": 100.0},
+            {"symbol": "VTI", "quantity": 6, "side": "long", "avg_entry_price": 200.0},
+            {"symbol": "BND", "quantity": 0.0001, "side": "long", "avg_entry_price": 70.0},
+        ],
+        pending_symbols=set(),
+        quantity_tolerance=1e-3,
+    )
+
+    assert [change["action"] for change in changes] == ["create_local_position"]
+    position = storage.get_position_by_symbol("VTI")
+    assert position.quantity == 8.0
+    assert position.avg_entry_price == pytest.approx(175.0)
+
+
+def test_strategy_changes_swap_in_a_new_dict():
+    """Test loading and unloading never mutate a dict the runner thread may be iterating."""
+    runner = _runner(PaperBroker(), ["VTI"])
+    snapshot = runner.strategies
+
+    runner.load_strategy(BuyAndHoldStrategy({"name": "Extra", "symbols": ["BND"]}))
+    runner.unload_strategy("BuyAndHoldStrategy")
+
+    assert list(snapshot) == ["BuyAndHoldStrategy"]
+    assert list(runner.strategies) == ["Extra"]
+
+
+def test_run_strategies_executes_signals_as_ticks_complete():
+    """Test a slow strategy does not hold back execution of a faster one's signals."""
+    release = threading.Event()
+
+    class _SlowStrategy(_RecordingStrategy):
+        def on_tick(self, market_data):
+            release.wait(timeout=5.0)
+            return super().on_tick(market_data)
+
+    runner = StrategyRunner(broker=PaperBroker())
+    slow = _SlowStrategy({"name": "Slow", "symbols": ["VTI"], "position_size": 1})
+    fast = _RecordingStrategy({"name": "Fast", "symbols": ["VTI"], "position_size": 1})
+    for strategy in (slow, fast):
+        strategy.on_start()
+        runner.load_strategy(strategy)
+    executed = []
+
+    def _on_signal(strategy, signal, order):
+        executed.append(strategy.name)
+        release.set()
+
+    runner.on_signal_callback = _on_signal
+    runner._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="runner-io")
+    runner.broker.connect()
+    try:
+        runner._run_strategies({"VTI": {"price": 100.0}})
+    finally:
+        runner._io_pool.shutdown()
+
+    assert executed == ["Fast", "Slow"]
+
+
+def test_fetch_market_data_reuses_dict_without_stale_quotes():
+    """Test the market-data dict is reused but drops failed and untracked symbols."""
+    broker = _FailingBroker()
+    runner = _runner(broker, ["VTI", "VXUS"])
+    runner.load_strategy(BuyAndHoldStrategy({"name": "Bonds", "symbols": ["BND"]}))
+
+    first = runner._fetch_market_data()
+    assert set(first) == {"VTI", "VXUS"}
+
+    runner.unload_strategy("BuyAndHoldStrategy")
+    second = runner._fetch_market_data()
+    assert second is first
+    assert second == {}
+
+
+def test_thread_scheduling_is_opt_in_and_tolerates_missing_privileges():
+    """Test CPU pinning and realtime priority are skipped quietly when they cannot apply."""
+    runner = StrategyRunner(broker=PaperBroker(), runner_cpu=10_000, realtime_priority=10_000)
+
+    runner._apply_thread_scheduling()
+
+    StrategyRunner(broker=PaperBroker())._apply_thread_scheduling()
+
+
+def test_thread_scheduling_reads_runner_settings(monkeypatch):
+    """Test runner CPU pinning and priority are configurable from the environment."""
+    from config.settings import Settings
+
+    monkeypatch.setenv("STOCKSBOT_RUNNER_CPU", "2")
+    monkeypatch.setenv("STOCKSBOT_RUNNER_REALTIME_PRIORITY", "10")
+    settings = Settings()
+
+    assert settings.runner_cpu == 2
+    assert settings.runner_realtime_priority == 10
+
+
+def test_fetch_market_data_bounds_wait_on_hung_symbols():
+    """Test a hung per-symbol fetch is abandoned at the tick deadline."""
+    release = threading.Event()
+
+    class _HangingBroker(PaperBroker):
+        def get_market_data(self, symbol):
+            if symbol == "BND":
+                release.wait(timeout=5.0)
+            return super().get_market_data(symbol)
+
+    runner = StrategyRunner(broker=_HangingBroker(), tick_interval=1.0)
+    runner.load_strategy(BuyAndHoldStrategy({"symbols": ["VTI", "BND"]}))
+    runner._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="runner-io")
+    try:
+        market_data = runner._fetch_market_data()
+    finally:
+        release.set()
+        runner._io_pool.shutdown()
+
+    assert set(market_data) == {"VTI"}
+
+
+def test_stop_wakes_scheduler_wait_immediately():
+    """Test stop() interrupts a long tick wait instead of waiting for a poll slice."""
+    runner = _runner(PaperBroker(), ["VTI"])
+    runner._stop_event.set()
+    runner._wake()
+
+    assert runner._sleep_wait(60.0) is False
+
+
+class _StreamingBroker(PaperBroker):
+    """Paper broker that reports an active trade-update stream."""
+
+    def is_trade_update_stream_active(self):
+        return True
+
+
+class _ReconcileService:
+    """Execution-service stub that records which orders were reconciled."""
+
+    def __init__(self):
+        self.updated = []
+        self.use_cache = []
+
+    def update_order_statuses_bulk(self, orders, use_cache=True):
+        self.updated.extend(order.external_id for order in orders)
+        self.use_cache.append(use_cache)
+        return orders
+
+
+def _open_order(storage, external_id):
+    order = storage.create_order(symbol="VTI", side="buy", order_type="market", quantity=1.0)
+    order.external_id = external_id
+    return storage.orders.update_status(order, OrderStatusEnum.OPEN)
+
+
+def test_reconcile_open_orders_only_polls_streamed_ids(storage):
+    """Test streaming reconciliation polls just the orders named in trade updates."""
+    for external_id in ("a", "b", "c"):
+        _open_order(storage, external_id)
+    service = _ReconcileService()
+    runner = StrategyRunner(
+        broker=_StreamingBroker(),
+        storage_service=storage,
+        order_execution_service=service,
+        streaming_enabled=True,
+    )
+
+    runner._reconcile_open_orders()
+    assert service.updated == []
+
+    runner._on_broker_trade_update({"order_id": "b", "event": "fill"})
+    runner._reconcile_open_orders()
+    assert service.updated == ["b"]
+
+    runner._on_broker_trade_update({"id": "c", "event": "new"})
+    runner._reconcile_open_orders()
+    assert service.updated == ["b", "c"]
+
+    runner._reconcile_open_orders(full=True)
+    assert service.updated == ["b", "c", "a", "b", "c"]
+    # Stream-driven passes may use streamed state; the full sweep must not.
+    assert service.use_cache == [True, True, False]
+
+
+def test_reconcile_open_orders_sweeps_everything_without_stream(storage):
+    """Test every open order is polled each pass when no stream is running."""
+    for external_id in ("a", "b"):
+        _open_order(storage, external_id)
+    service = _ReconcileService()
+    runner = StrategyRunner(broker=PaperBroker(), storage_service=storage, order_execution_service=service)
+
+    runner._reconcile_open_orders()
+
+    assert service.updated == ["a", "b"]
+
+
+class _SessionBroker(PaperBroker):
+    """Paper broker with a scripted, call-counted market session."""
+
+    def __init__(self, is_open, next_open=None, next_close=None):
+        super().__init__()
+        self.open = is_open
+        self.next_open = next_open
+        self.next_close = next_close
+        self.open_calls = 0
+        self.next_open_calls = 0
+
+    def is_market_open(self):
+        self.open_calls += 1
+        return self.open
+
+    def get_next_market_open(self):
+        self.next_open_calls += 1
+        return self.next_open
+
+    def get_next_market_close(self):
+        return self.next_close
+
+
+def test_market_session_lookups_are_cached():
+    """Test market-open and next-open lookups hit the broker once per TTL."""
+    broker = _SessionBroker(False, datetime.now(timezone.utc) + timedelta(hours=12))
+    runner = StrategyRunner(broker=broker)
+
+    assert runner._cached_market_open() is False
+    assert runner._cached_market_open() is False
+    runner._safe_next_market_open()
+    assert (broker.open_calls, broker.next_open_calls) == (1, 1)
+
+    runner._invalidate_market_session_cache()
+    broker.open = True
+    assert runner._cached_market_open() is True
+    assert broker.open_calls == 2
+
+
+def test_market_closed_cache_expires_near_next_open():
+    """Test the closed-market TTL is shortened to the predicted session open."""
+    broker = _SessionBroker(False, datetime.now(timezone.utc) + timedelta(seconds=1))
+    runner = StrategyRunner(broker=broker)
+
+    runner._cached_market_open()
+    expires_at = runner._market_open_cache[0]
+
+    assert 0 < expires_at - time.monotonic() <= 5.0
+
+
+def test_market_open_cache_expires_at_next_close():
+    """Test an open result is not served past the session close."""
+    broker = _SessionBroker(True, next_close=datetime.now(timezone.utc) + timedelta(seconds=1))
+    runner = StrategyRunner(broker=broker)
+
+    assert runner._cached_market_open() is True
+    assert 0 < runner._market_open_cache[0] - time.monotonic() <= 5.0
+
+    runner._invalidate_market_session_cache()
+    broker.next_close = datetime.now(timezone.utc) + timedelta(hours=3)
+    runner._cached_market_open()
+    assert 55.0 < runner._market_open_cache[0] - time.monotonic() <= 60.0
+
+    runner._invalidate_market_session_cache()
+    broker.next_close = None
+    runner._cached_market_open()
+    assert runner._market_open_cache[0] - time.monotonic() <= 5.0
+
+
+def test_market_session_refresh_reads_one_clock():
+    """Test open state and the close edge come from a single broker clock lookup."""
+
+    class _ClockBroker(PaperBroker):
+        def __init__(self):
+            super().__init__()
+            self.clock_calls = 0
+
+        def get_market_clock(self):
+            self.clock_calls += 1
+            return {
+                "is_open": True,
+                "next_open": None,
+                "next_close": datetime.now(timezone.utc) + timedelta(hours=2),
+            }
+
+        def is_market_open(self):
+            raise AssertionError("runner should read the combined clock")
+
+        def get_next_market_close(self):
+            raise AssertionError("runner should read the combined clock")
+
+    broker = _ClockBroker()
+    runner = StrategyRunner(broker=broker)
+
+    assert runner._cached_market_open() is True
+    assert broker.clock_calls == 1
+    assert runner._market_open_cache[0] - time.monotonic() > 55.0
+
+
+def test_runner_audit_logs_are_buffered_until_flush(storage):
+    """Test runner audit entries are held back and written in one batch."""
+    runner = StrategyRunner(broker=PaperBroker(), storage_service=storage)
+
+    runner._audit_poll_error("boom")
+    runner._resume_from_sleep()
+    assert storage.audit_logs.count() == 0
+
+    runner._flush_audit_logs()
+    descriptions = sorted(log.description for log in storage.get_audit_logs())
+    assert descriptions == ["Runner poll error: boom", "Runner resumed after market open"]
+    assert runner._pending_audit_logs == []
+
+
+def test_collect_quantity_discrepancies_skips_pending_and_tolerated(storage):
+    """Test aggregated broker/local quantities only report real, settled mismatches."""
+    runner = StrategyRunner(broker=PaperBroker(), storage_service=storage)
+    broker_qty = runner._aggregate_broker_quantities([
+        {"symbol": "vti", "quantity": 3, "side": "long"},
+        {"symbol": "VTI", "quantity": 2, "side": "long"},
+        {"symbol": "BND", "quantity": 4, "side": "short"},
+        {"symbol": "SPY", "quantity": 1},
+    ])
+
+    rows = runner._collect_quantity_discrepancies(
+        broker_qty=broker_qty,
+        local_qty={"VTI": 5.0004, "QQQ": 2.0},
+        pending_symbols={"SPY"},
+        quantity_tolerance=1e-3,
+    )
+
+    assert broker_qty == {"VTI": 5.0, "BND": -4.0, "SPY": 1.0}
+    assert [(row["symbol"], row["broker_quantity"], row["local_quantity"]) for row in rows] == [
+        ("BND", -4.0, 0.0),
+        ("QQQ", 0.0, 2.0),
+    ]
+
+
+def test_strategy_runner_uses_slots():
+    """Test runner instances carry no per-instance __dict__."""
+    runner = StrategyRunner(broker=PaperBroker())
+
+    assert not hasattr(runner, "__dict__")
+    with pytest.raises(AttributeError):
+        runner.unexpected_attribute = True
+
+
+def test_poll_error_audits_are_throttled_on_monotonic_clock(storage):
+    """Test repeated poll errors within 30s produce a single audit entry."""
+    runner = StrategyRunner(broker=PaperBroker(), storage_service=storage)
+
+    runner._audit_poll_error("first")
+    runner._audit_poll_error("second")
+    runner._last_error_audit_mono -= 31.0
+    runner._audit_poll_error("third")
+    runner._flush_audit_logs()
+
+    descriptions = sorted(log.description for log in storage.get_audit_logs())
+    assert descriptions == ["Runner poll error: first", "Runner poll error: third"]
+
+
+def test_persist_sleep_state_skips_unchanged_payload(storage, monkeypatch):
+    """Test the sleep checkpoint is only rewritten when its contents change."""
+    runner = StrategyRunner(broker=PaperBroker(), storage_service=storage)
+    upserts = []
+    original_upsert = storage.config.upsert
+    monkeypatch.setattr(
+        storage.config,
+        "upsert",
+        lambda *args, **kwargs: upserts.append(kwargs["key"]) or original_upsert(*args, **kwargs),
+    )
+
+    runner._persist_sleep_state()
+    runner._persist_sleep_state()
+    runner.resume_count += 1
+    runner._persist_sleep_state()
+
+    assert upserts == ["runner_sleep_state", "runner_sleep_state"]
+
+
+def test_get_status_reuses_strategy_states_until_strategies_change():
+    """Test status polling caches strategy states but not membership changes."""
+    runner = _runner(PaperBroker(), ["VTI"])
+
+    first = runner.get_status()["strategies"]
+    assert runner.get_status()["strategies"] is first
+
+    runner.load_strategy(BuyAndHoldStrategy({"name": "Second", "symbols": ["BND"]}))
+    assert [state["name"] for state in runner.get_status()["strategies"]] == ["BuyAndHoldStrategy", "Second"]
+
+
+def test_persist_runtime_state_coalesces_timestamp_only_ticks(storage, monkeypatch):
+    """Test runtime checkpoints skip ticks that only advance poll timestamps."""
+    runner = StrategyRunner(broker=PaperBroker(), storage_service=storage)
+    upserts = []
+    original_upsert = storage.config.upsert
+    monkeypatch.setattr(
+        storage.config,
+        "upsert",
+        lambda *args, **kwargs: upserts.append(kwargs["key"]) or original_upsert(*args, **kwargs),
+    )
+
+    runner._persist_runtime_state()
+    runner.poll_success_count += 1
+    runner._persist_runtime_state()
+    assert len(upserts) == 1
+
+    runner.poll_error_count += 1
+    runner._persist_runtime_state()
+    runner._persist_runtime_state(force=True)
+    assert len(upserts) == 3
+
+
+def test_fetch_market_data_backs_off_failing_symbols():
+    """Test a symbol is backed off only after repeated misses, with a growing delay."""
+    broker = _FailingBroker()
+    calls = []
+    fetch = broker.get_market_data
+    broker.get_market_data = lambda symbol: calls.append(symbol) or fetch(symbol)
+    runner = _runner(broker, ["BND"])
+    runner.tick_interval = 5.0
+
+    for _ in range(4):
+        assert runner._fetch_market_data() == {}
+    assert calls == ["BND"] * 3
+    retry_at, failures = runner._md_failures["BND"]
+    assert failures == 3
+    assert retry_at - time.monotonic() == pytest.approx(5.0, abs=1.0)
+
+    runner._md_failures["BND"] = (retry_at - 6.0, failures)
+    runner._fetch_market_data()
+    assert calls == ["BND"] * 4
+    retry_at, failures = runner._md_failures["BND"]
+    assert failures == 4
+    assert retry_at - time.monotonic() == pytest.approx(10.0, abs=1.0)
+
+
+def test_fetch_market_data_success_resets_failure_streak():
+    """Test a successful quote clears the consecutive-miss count for a symbol."""
+    broker = _FailingBroker()
+    runner = _runner(broker, ["BND"])
+    runner.tick_interval = 5.0
+
+    runner._fetch_market_data()
+    runner._fetch_market_data()
+    assert runner._md_failures["BND"][1] == 2
+
+    broker.get_market_data = lambda symbol: {"price": 70.0}
+    assert runner._fetch_market_data()["BND"] == {"price": 70.0}
+    assert "BND" not in runner._md_failures
+
+    del broker.get_market_data
+    runner._md_cache.clear()
+    runner._fetch_market_data()
+    assert runner._md_failures["BND"][1] == 1
+
+
+def test_position_reconciliation_disabled_for_in_memory_sqlite(storage):
+    """Test the in-memory sqlite guard is decided once, at construction."""
+    broker = PaperBroker()
+    broker.get_positions = lambda: pytest.fail("reconciliation should not reach the broker")
+    runner = StrategyRunner(broker=broker, storage_service=storage)
+
+    assert runner._reconciliation_disabled is True
+    runner._maybe_reconcile_positions_with_broker()
+    assert runner.last_reconciliation_at is None